@@ -0,0 +1,531 @@
+"""Batch filter engine for the sort/filter proxy model example.
+
+The engine keeps the name and color of each source row in flat columns,
+and filters every row in one pass over those columns, rather than asking
+the source model about each row in turn.
+
+NumPy is used when it is installed. Without it, the passes are made with
+`map`/`itertools.compress` over the columns, which keeps the loops in C,
+but is a few times slower.
+
+The results of the last few name searches are kept. The names that
+contain some text are among the names that contain any part of it, so as
+a search is typed, each search only re-tests the names that matched the
+one before it, and going back to earlier text reuses its result. Without
+NumPy, re-testing a name costs about twice as much as testing it in a
+full pass, so only small results are re-tested.
+
+The sort order of every row by each column is kept too, until the rows
+change, so sorting the rows that pass by another column only picks them
+out of that order.
+"""
+
+import array
+import collections
+import itertools
+import operator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Columns the rows can be sorted by.
+NAME = 'name'
+COLOR = 'color'
+
+# Separates the names in the name buffer searched by NumPy.
+_SEPARATOR = b'\0'
+
+# Number of name searches whose results are kept.
+MAX_SEARCHES = 16
+
+# Without NumPy, only the rows of searches that match fewer rows than this
+# fraction of the rows are re-tested by searches for text that contains
+# theirs; larger results are searched for again in full.
+NARROW_RATIO = 0.2
+
+# Fewer rows than this fraction of the rows are sorted by rank when they
+# are picked out of a sort order without NumPy, rather than picked out by
+# walking the whole order.
+SPARSE_RATIO = 0.125
+
+# Number of rows `find_rows` looks up one by one, rather than building the
+# inverse of the rows.
+MAX_FOUND_ROWS = 16
+
+
+def inverse(rows, size):
+    """Return the position of each row in the given rows.
+
+    Args:
+        rows (numpy.ndarray|array.array): Rows (see `FilterEngine.rows`).
+        size (int): Number of rows in the engine.
+
+    Returns:
+        numpy.ndarray|array.array: Position of each row, or -1 for the rows
+            that are not in `rows`.
+    """
+
+    if numpy is not None:
+        result = numpy.full(size, -1, numpy.int64)
+        result[rows] = numpy.arange(len(rows))
+        return result
+
+    result = array.array('l', [-1]) * size
+
+    for position, row in enumerate(rows):
+        result[row] = position
+
+    return result
+
+
+def find_rows(rows, wanted, size):
+    """Return the positions of a few rows in the given rows.
+
+    Args:
+        rows (numpy.ndarray|array.array): Rows (see `FilterEngine.rows`).
+        wanted (list[int]): Rows to find.
+        size (int): Number of rows in the engine.
+
+    Returns:
+        list[int]: Position of each wanted row, or -1 if it is not in
+            `rows`.
+    """
+
+    if len(wanted) > MAX_FOUND_ROWS:
+        positions = inverse(rows, size)
+
+        return [
+            int(positions[row]) if 0 <= row < size else -1 for row in wanted
+        ]
+
+    result = []
+
+    for row in wanted:
+        if numpy is not None:
+            found = numpy.flatnonzero(rows == row)
+            result.append(int(found[0]) if len(found) else -1)
+            continue
+
+        try:
+            result.append(rows.index(row))
+        except ValueError:
+            result.append(-1)
+
+    return result
+
+
+class FilterEngine(object):
+    """Filters and sorts rows by name and color."""
+
+    def __init__(self, names=(), colors=()):
+        """Initialize.
+
+        Args:
+            names (list[str]): Name of each row.
+            colors (list[str]): Color of each row.
+        """
+
+        self.set_rows(names, colors)
+
+    def __len__(self):
+        return len(self._names)
+
+    def set_rows(self, names, colors):
+        """Replace the rows of the engine.
+
+        Args:
+            names (list[str]): Name of each row; kept by the engine, rather
+                than copied, so it must not be changed afterwards.
+            colors (list[str]): Color of each row.
+        """
+
+        self._names = names
+
+        # (size, result) of recent name searches, by text, oldest first.
+        self._searches = collections.OrderedDict()
+
+        # Sort order of every row, and the position of each row in it, by
+        # column.
+        self._orders = {}
+        self._ranks = {}
+
+        # (text, color) of the last filters, their mask, and the rows that
+        # pass them, by sort column.
+        self._filters = None
+        self._mask = None
+        self._results = {}
+
+        # Colors are stored as one byte per row.
+        self._color_ids = {}
+
+        for color in colors:
+            if color not in self._color_ids:
+                self._color_ids[color] = len(self._color_ids)
+
+        color_ids = bytes(map(self._color_ids.__getitem__, colors))
+
+        if numpy is None:
+            self._colors = color_ids
+            return
+
+        self._colors = numpy.frombuffer(color_ids, numpy.uint8)
+
+        # The names are searched as one buffer of UTF-8 bytes, with the
+        # start of each name, so a match can be traced back to its row.
+        encoded = [name.encode('utf-8') for name in self._names]
+        lengths = numpy.fromiter(map(len, encoded), numpy.int64, len(encoded))
+
+        self._starts = numpy.zeros(len(encoded), numpy.int64)
+        numpy.cumsum(lengths[:-1] + 1, out=self._starts[1:])
+
+        self._buffer = numpy.frombuffer(
+            _SEPARATOR.join(encoded) + _SEPARATOR, numpy.uint8
+        )
+
+    def mask(self, text='', color=None):
+        """Return which rows pass the filters.
+
+        Args:
+            text (str): Text the names must contain (case sensitive).
+            color (str): Color the rows must have, or None for any color.
+
+        Returns:
+            numpy.ndarray|bytes: True/1 for each row that passes, or
+                None if every row passes.
+        """
+
+        if (text, color) == self._filters:
+            return self._mask
+
+        masks = []
+
+        if color is not None:
+            masks.append(self._match_color(color))
+
+        if text:
+            masks.append(self._match_names(text))
+
+        if not masks:
+            mask = None
+        elif len(masks) == 1:
+            mask = masks[0]
+        elif numpy is not None:
+            mask = numpy.logical_and.reduce(masks)
+        else:
+            # Masks are 0/1 bytes, so they are combined as two big integers.
+            mask = (
+                int.from_bytes(masks[0], 'little')
+                & int.from_bytes(masks[1], 'little')
+            ).to_bytes(len(self), 'little')
+
+        self._filters = (text, color)
+        self._mask = mask
+        self._results = {}
+
+        return mask
+
+    def order(self, column):
+        """Return every row, sorted by a column.
+
+        Rows with the same value stay in source order.
+
+        Args:
+            column (str): NAME or COLOR.
+
+        Returns:
+            numpy.ndarray|array.array: Rows, in sorted order; shared, so
+                it must not be changed.
+        """
+
+        order = self._orders.get(column)
+
+        if order is None:
+            order = self._orders[column] = self._sort(column)
+
+        return order
+
+    def _sort(self, column):
+        """Sort every row by a column.
+
+        Args:
+            column (str): NAME or COLOR.
+
+        Returns:
+            numpy.ndarray|array.array: Rows, in sorted order.
+        """
+
+        if column == COLOR:
+            return self._order_by_color()
+
+        if numpy is not None:
+            return numpy.argsort(numpy.array(self._names), kind='stable')
+
+        return array.array(
+            'l', sorted(range(len(self._names)), key=self._names.__getitem__)
+        )
+
+    def apply(self, order, mask):
+        """Return the rows of an order that pass the filters.
+
+        Args:
+            order (numpy.ndarray|array.array): Rows, in sorted order (see
+                `order`).
+            mask (numpy.ndarray|bytes): Rows that pass (see `mask`).
+
+        Returns:
+            numpy.ndarray|array.array: Rows, in sorted order.
+        """
+
+        if mask is None:
+            return order
+
+        if numpy is not None:
+            return order[mask[order]]
+
+        return array.array(
+            'l', itertools.compress(order, map(mask.__getitem__, order))
+        )
+
+    def rows(self, text='', color=None, column=NAME):
+        """Return the rows that pass the filters, sorted by a column.
+
+        Args:
+            text (str): Text the names must contain (case sensitive).
+            color (str): Color the rows must have, or None for any color.
+            column (str): Column to sort by (NAME or COLOR).
+
+        Returns:
+            numpy.ndarray|array.array: Rows, in sorted order; shared, so it
+                must not be changed.
+        """
+
+        mask = self.mask(text, color)
+
+        if column in self._results:
+            return self._results[column]
+
+        if (
+            numpy is None
+            and mask is not None
+            and mask.count(1) < len(self) * SPARSE_RATIO
+        ):
+            # Sorting the few rows that pass by their position in the order
+            # is quicker than walking the whole order.
+            ranks = self._ranks.get(column)
+
+            if ranks is None:
+                ranks = self._ranks[column] = inverse(
+                    self.order(column), len(self)
+                )
+
+            result = array.array('l', sorted(
+                itertools.compress(range(len(self)), mask),
+                key=ranks.__getitem__
+            ))
+        else:
+            result = self.apply(self.order(column), mask)
+
+        self._results[column] = result
+
+        return result
+
+    def _order_by_color(self):
+        """Return every row, sorted by color.
+
+        There are only a few colors, so the rows of each color are picked
+        out in turn, rather than sorted.
+
+        Returns:
+            numpy.ndarray|array.array
+        """
+
+        if numpy is not None:
+            ranks = numpy.zeros(max(len(self._color_ids), 1), numpy.uint8)
+            ranks[[self._color_ids[each] for each in sorted(self._color_ids)]] = (
+                numpy.arange(len(self._color_ids))
+            )
+
+            return numpy.argsort(ranks[self._colors], kind='stable')
+
+        result = array.array('l')
+
+        for color in sorted(self._color_ids):
+            result.extend(
+                itertools.compress(
+                    range(len(self)), self._match_color(color)
+                )
+            )
+
+        return result
+
+    def _match_color(self, color):
+        """Return which rows have the given color.
+
+        Args:
+            color (str): Color.
+
+        Returns:
+            numpy.ndarray|bytes
+        """
+
+        color_id = self._color_ids.get(color, -1)
+
+        if numpy is not None:
+            return self._colors == color_id
+
+        # Translating the color ids maps the color to 1 and the others to 0.
+        table = bytearray(256)
+
+        if color_id >= 0:
+            table[color_id] = 1
+
+        return self._colors.translate(table)
+
+    def _match_names(self, text):
+        """Return which rows have names that contain the given text.
+
+        Args:
+            text (str): Text to search for.
+
+        Returns:
+            numpy.ndarray|bytearray: Shared with the search cache, so it
+                must not be changed.
+        """
+
+        matches = self._search_names(text)
+
+        if numpy is None:
+            return matches[1]
+
+        mask = numpy.zeros(len(self), bool)
+        mask[numpy.searchsorted(self._starts, matches, side='right') - 1] = True
+
+        return mask
+
+    def _search_names(self, text):
+        """Search the names for the given text, reusing earlier searches.
+
+        Args:
+            text (str): Text to search for.
+
+        Returns:
+            numpy.ndarray|tuple: Positions of the matches in the name
+                buffer, with NumPy, or the matching rows (None until they
+                are re-tested) and which rows match, without it.
+        """
+
+        searches = self._searches
+
+        if text in searches:
+            searches.move_to_end(text)
+            return searches[text][1]
+
+        # Start from the smallest result for text that this text contains.
+        base = None
+
+        for key, (size, matches) in searches.items():
+            if key in text and (base is None or size < base[0]):
+                base = (size, key, matches)
+
+        if numpy is None:
+            if base is not None and base[0] >= len(self) * NARROW_RATIO:
+                base = None
+
+            matches = self._search_python(text, base)
+            size = matches[1].count(1)
+        else:
+            matches = self._search_numpy(text, base)
+            size = len(matches)
+
+        searches[text] = (size, matches)
+
+        if len(searches) > MAX_SEARCHES:
+            searches.popitem(last=False)
+
+        return matches
+
+    def _search_python(self, text, base):
+        """Return the rows whose names contain the given text.
+
+        Args:
+            text (str): Text to search for.
+            base (tuple): (size, text, result) of an earlier search for
+                text that this text contains, or None.
+
+        Returns:
+            tuple[array.array, bytearray]: The matching rows, or None if
+                the names were searched in full, and which rows match.
+        """
+
+        names = self._names
+
+        if base is None:
+            return None, bytearray(
+                map(operator.contains, names, itertools.repeat(text))
+            )
+
+        size, key, (candidates, base_mask) = base
+
+        if candidates is None:
+            # Picked out once, when the result is first re-tested.
+            candidates = array.array(
+                'l', itertools.compress(range(len(names)), base_mask)
+            )
+            self._searches[key] = (size, (candidates, base_mask))
+
+        rows = array.array('l', itertools.compress(
+            candidates,
+            map(
+                operator.contains,
+                map(names.__getitem__, candidates),
+                itertools.repeat(text)
+            )
+        ))
+
+        mask = bytearray(len(names))
+        collections.deque(
+            map(mask.__setitem__, rows, itertools.repeat(1)), maxlen=0
+        )
+
+        return rows, mask
+
+    def _search_numpy(self, text, base):
+        """Return where the given text is in the name buffer.
+
+        Args:
+            text (str): Text to search for.
+            base (tuple): (size, text, result) of an earlier search for
+                text that this text contains, or None.
+
+        Returns:
+            numpy.ndarray: Positions of the matches.
+        """
+
+        pattern = numpy.frombuffer(text.encode('utf-8'), numpy.uint8)
+        buffer = self._buffer
+        end = len(buffer) - len(pattern) + 1
+
+        if _SEPARATOR[0] in pattern or end <= 0:
+            return numpy.zeros(0, numpy.int64)
+
+        if base is None:
+            # Find where the first byte of the text is, then narrow those
+            # down to where the next byte follows, and so on.
+            positions = numpy.flatnonzero(buffer[:end] == pattern[0])
+            first = 1
+        else:
+            # Every match of this text has a match of the earlier text in
+            # it, at the same offset.
+            _, key, matches = base
+            shift = len(text[:text.find(key)].encode('utf-8'))
+            positions = matches - shift
+            positions = positions[(positions >= 0) & (positions < end)]
+            first = 0
+
+        for offset in range(first, len(pattern)):
+            positions = positions[buffer[positions + offset] == pattern[offset]]
+
+        return positions
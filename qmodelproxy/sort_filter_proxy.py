@@ -1,338 +1,823 @@
-"""Sort/Filter Proxy Model example."""
-
-import json
-import os
-import random
-import sys
-import functools
-
-from PySide2 import QtCore, QtGui, QtWidgets 
-
-random.seed(42)
-
-COLORS = {
-    'Black': QtGui.QColor(QtCore.Qt.black),
-    'Red': QtGui.QColor(QtCore.Qt.red),
-    'Dark Red': QtGui.QColor(QtCore.Qt.darkRed),
-    'Green': QtGui.QColor(QtCore.Qt.green),
-    'Dark Green': QtGui.QColor(QtCore.Qt.darkGreen),
-    'Blue': QtGui.QColor(QtCore.Qt.blue),
-    'Dark Blue': QtGui.QColor(QtCore.Qt.darkBlue),
-    'Cyan': QtGui.QColor(QtCore.Qt.cyan),
-    'Dark Cyan': QtGui.QColor(QtCore.Qt.darkCyan),
-}
-
-COLOR_NAMES = list(COLORS.keys())
-
-
-class SourceModel(QtGui.QStandardItemModel):
-    Changed = QtCore.Signal()
-
-    def __init__(self):
-        super(SourceModel, self).__init__()
-
-        data_filepath = os.path.join(os.path.dirname(__file__), 'data.json')
-
-        with open(data_filepath, 'r') as fp:
-            self.words = json.load(fp)
-
-    def refresh(self):
-        self.clear()
-
-        for i in range(1000):
-            self._make_data_item()
-
-        self.Changed.emit()
-
-    def _make_data_item(self):
-        name = ' '.join(random.choices(self.words, k=3))
-        color = random.choice(COLOR_NAMES)
-
-        item = ColorItem(name, color)
-
-        self.appendRow(item)
-
-
-class ProxyModel(QtCore.QSortFilterProxyModel):
-    def __init__(self):
-        super(ProxyModel, self).__init__()
-
-        self._filter_value = None 
-
-        self.setFilterRole(QtCore.Qt.UserRole + 1)
-        self.sort(0)
-
-    @property
-    def sort_role(self):
-        return self.sortRole()
-
-    @sort_role.setter 
-    def sort_role(self, value):        
-        self.setSortRole(value)
-
-    @property
-    def filter_string(self):
-        return self.filterFixedString()
-
-    @filter_string.setter
-    def filter_string(self, value):
-        self.setFilterFixedString(value)
-        self.invalidate()
-
-    @property 
-    def filter_value(self):
-        return self._filter_value
-
-    @filter_value.setter
-    def filter_value(self, value):
-        self._filter_value = value 
-        self.invalidate()
-
-    def refresh(self):
-        self.sourceModel().refresh()
-
-        # Calling `invalidate` re-runs the filter and ensures a `layoutChanged`
-        # signal is emitted by the model proxy.
-        self.invalidate()
-
-    def filterAcceptsRow(self, source_row, source_parent):
-        # The default behavior of a sort/filter proxy model will filter 
-        # items using the filter string. Additional filters, like one to
-        # filter by color, need to implemented on top of this behavior.
-
-        if self.filter_value is not None:
-            source_index = self.sourceModel().index(
-                source_row, 0, source_parent
-            )
-            item = self.sourceModel().itemFromIndex(source_index)
-            result = self.filter_value == item.color
-        else:
-            result = True 
-
-        if result:
-            result = super(ProxyModel, self).filterAcceptsRow(
-                source_row, source_parent
-            )
-
-        return result 
-
-    def item_from_index(self, index):
-        # A sort/filter proxy model manages its own indices that must be
-        # mapped to the indices of the source model to access the items
-        source_index = self.mapToSource(index)
-        return self.sourceModel().itemFromIndex(source_index)
-
-
-class ItemView(QtWidgets.QListView):
-    def __init__(self, model, parent=None):
-        super(ItemView, self).__init__(parent)
-
-        self.setSelectionMode(QtWidgets.QTreeView.SingleSelection)
-        self.setEditTriggers(QtWidgets.QTreeView.NoEditTriggers)
-        self.setViewMode(QtWidgets.QListView.IconMode)
-        self.setResizeMode(QtWidgets.QListView.Adjust)
-        self.setMovement(QtWidgets.QListView.Static)
-        self.setIconSize(QtCore.QSize(96, 96))
-        self.setLayoutMode(QtWidgets.QListView.Batched)
-        self.setModel(model)
-
-    def selectionChanged(self, old, new):
-        for index in self.selectedIndexes():
-            item = self.model().item_from_index(index)
-
-            print(
-                '{:12} {}'
-                .format('[{}]'.format(item.color), item.name)
-            )
-
-
-class ColorItem(QtGui.QStandardItem):
-    """Model item for a color swatch."""
-
-    # Wrapping QStandardItem provides a pythonic API for accessing the data 
-    # (eg, item.color) instead of having to make other objects aware of the 
-    # data role values.
-
-    NAME_ROLE = QtCore.Qt.UserRole + 1
-    COLOR_ROLE = QtCore.Qt.UserRole + 2
-
-    def __init__(self, name, color):
-        display_name = name.replace(' ', '\n')
-
-        super(ColorItem, self).__init__(display_name)
-        
-        self.setData(name, self.NAME_ROLE)
-        self.setData(color, self.COLOR_ROLE)
-
-        color_swatch = COLORS[color]
-        self.setData(color_swatch, QtCore.Qt.DecorationRole)
-
-    @property 
-    def name(self):
-        return self.data(self.NAME_ROLE)
-
-    @property
-    def color(self):
-        return self.data(self.COLOR_ROLE)
-
-
-class SimpleDataModel(QtGui.QStandardItemModel):
-    """Simple wrapper around a QStandardItemModel.
-    
-    Allows construction of items with data in a fixed role.
-    """
-
-    def __init__(self, data_role=QtCore.Qt.UserRole + 1):
-        super(SimpleDataModel, self).__init__()
-        self.data_role = data_role
-
-    def _add_item(self, name, data):
-        item = QtGui.QStandardItem(name)
-        item.setData(data, self.data_role)
-
-        self.appendRow(item)
-
-
-class Colors(SimpleDataModel):
-    """List of color options."""
-
-    def __init__(self):
-        super(Colors, self).__init__()
-        
-        self._add_item('All Colors', None)
-
-        for color in sorted(COLORS):
-            self._add_item(color, color)
-
-
-class SortModes(SimpleDataModel):
-    """List of sort options."""
-
-    def __init__(self):
-        super(SortModes, self).__init__()
-
-        self._add_item('By Name', ColorItem.NAME_ROLE)
-        self._add_item('By Color', ColorItem.COLOR_ROLE)
-
-
-class DataComboBox(QtWidgets.QComboBox):
-    """Simple wrapper around a ComboBox.
-    
-    The `Changed` signal emits the data assigned to the selected item.
-    """
-
-    Changed = QtCore.Signal(object)
-
-    def __init__(self, model, parent=None, data_role=QtCore.Qt.UserRole + 1):
-        self.data_role = data_role 
-
-        super(DataComboBox, self).__init__(parent)
-        
-        self.currentIndexChanged.connect(self._handle_index_changed)
-        self.setModel(model)
-
-    def _handle_index_changed(self, index):
-        self.Changed.emit(self.itemData(index, self.data_role))
-        
-
-class MainWidget(QtWidgets.QWidget):
-    """Widget for viewing a list of items, with filter/sort capabilities."""
-
-    def __init__(self, model, parent=None):
-        super(MainWidget, self).__init__(parent)
-
-        self.model = model 
-
-        main_layout = QtWidgets.QVBoxLayout(self)
-        form_layout = QtWidgets.QFormLayout()
-
-        self.filter_edit = QtWidgets.QLineEdit(self)
-        self.sort_mode = DataComboBox(SortModes(), self)
-        self.color_mode = DataComboBox(Colors(), self)
-        self.flow_view = ItemView(model, self)       
-        self.item_count = QtWidgets.QLabel()
-
-        form_layout.addRow('Search', self.filter_edit)
-        form_layout.addRow('Sort', self.sort_mode)
-        form_layout.addRow('Show', self.color_mode)
-        main_layout.addLayout(form_layout)
-        main_layout.addWidget(self.flow_view)
-        main_layout.addWidget(self.item_count)
-        
-        self._connect_slots()
-
-    def _connect_slots(self):
-        """Connect signals/slots."""
-
-        self.model.layoutChanged.connect(self._update_item_count)
-
-        # A partial of `setattr` gives you a callable to assign a value.
-        #
-        # f = partial(setattr, obj, 'foo')
-        # f(5)
-        # obj.foo
-        # 5
-
-        self.filter_edit.textChanged.connect(
-            functools.partial(setattr, self.model, 'filter_string')
-        )
-
-        self.sort_mode.Changed.connect(
-            functools.partial(setattr, self.model, 'sort_role')
-        )
-
-        self.color_mode.Changed.connect(
-            functools.partial(setattr, self.model, 'filter_value')
-        )
-
-    def _update_item_count(self):        
-        """Update the item counter."""
-
-        self.item_count.setText(
-            'Showing {:4d} Items'
-            .format(self.model.rowCount())
-        )
-
-
-class MainWindow(QtWidgets.QMainWindow):    
-    """Tool for viewing a list of items, with filter/sort capabilities."""
-
-    def __init__(self):
-        super(MainWindow, self).__init__()
-
-        self.setWindowTitle('Filter/Sort Proxy Model Example')
-
-        self.model = ProxyModel()
-        self.model.setSourceModel(SourceModel())
-
-        self.setCentralWidget(MainWidget(self.model))
-
-        self._opened = False 
-
-    def showEvent(self, event):
-        super(MainWindow, self).showEvent(event)
-
-        if not self._opened:
-            self._opened = True 
-
-            QtCore.QTimer.singleShot(10, self.refresh)
-
-    def refresh(self):
-        """Refresh the view."""
-
-        self.model.refresh()
-
-
-def main():
-    app = QtWidgets.QApplication([])
-    app.setQuitOnLastWindowClosed(True)
-
-    win = MainWindow()
-    win.resize(540, 400)
-    win.show()
-
-    sys.exit(app.exec_())
-
-
-if __name__ == '__main__':
+"""Sort/Filter Proxy Model example.
+
+The source model is filled with synthetic swatches, so the proxy model and
+view can be tried at any size:
+
+    python sort_filter_proxy.py --rows 1000000 --seed 7
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import functools
+
+from PySide2 import QtCore, QtGui, QtWidgets 
+
+import filter_engine
+
+COLORS = {
+    'Black': QtGui.QColor(QtCore.Qt.black),
+    'Red': QtGui.QColor(QtCore.Qt.red),
+    'Dark Red': QtGui.QColor(QtCore.Qt.darkRed),
+    'Green': QtGui.QColor(QtCore.Qt.green),
+    'Dark Green': QtGui.QColor(QtCore.Qt.darkGreen),
+    'Blue': QtGui.QColor(QtCore.Qt.blue),
+    'Dark Blue': QtGui.QColor(QtCore.Qt.darkBlue),
+    'Cyan': QtGui.QColor(QtCore.Qt.cyan),
+    'Dark Cyan': QtGui.QColor(QtCore.Qt.darkCyan),
+}
+
+COLOR_NAMES = list(COLORS.keys())
+
+
+# Number of rows generated, and inserted into the source model, at a time.
+BATCH_SIZE = 100000
+
+
+def load_words():
+    """Return the words that swatch names are made of.
+
+    Returns:
+        list[str]
+    """
+
+    data_filepath = os.path.join(os.path.dirname(__file__), 'data.json')
+
+    with open(data_filepath, 'r') as fp:
+        return json.load(fp)
+
+
+def iter_batches(rows, seed=42, words=None, batch_size=BATCH_SIZE):
+    """Yield synthetic swatches, in batches.
+
+    Names and colors are drawn from their own random number generators, so
+    the same seed yields the same swatches, whatever the batch size.
+
+    Args:
+        rows (int): Total number of swatches.
+        seed (int): Random seed.
+        words (list[str]): Words to make names of; see `load_words`.
+        batch_size (int): Number of swatches per batch.
+
+    Yields:
+        tuple[list[str], list[str]]: Names and colors of a batch.
+    """
+
+    if words is None:
+        words = load_words()
+
+    name_rng = random.Random('names {}'.format(seed))
+    color_rng = random.Random('colors {}'.format(seed))
+
+    for first in range(0, rows, batch_size):
+        count = min(batch_size, rows - first)
+
+        # Names are three words each.
+        picks = iter(name_rng.choices(words, k=3 * count))
+        names = list(map(' '.join, zip(picks, picks, picks)))
+
+        yield names, color_rng.choices(COLOR_NAMES, k=count)
+
+
+class SourceModel(QtCore.QAbstractListModel):
+    """List of color swatches.
+
+    The name and color of each swatch are stored as flat columns, rather
+    than as items, so the proxy model can filter every row at once (see
+    `filter_engine`). With the copies the proxy model and its filter engine
+    keep, each swatch takes about 320 bytes, so a few million swatches fit
+    in a couple of GB; tens of millions need a lot more memory than that.
+
+    The swatches are generated and inserted a batch at a time, one batch
+    per pass of the event loop, so the window stays responsive while they
+    load. `Changed` is emitted once they are all in.
+    """
+
+    Changed = QtCore.Signal()
+
+    def __init__(self, rows=1000, seed=42):
+        """Initialize.
+
+        Args:
+            rows (int): Number of swatches to generate.
+            seed (int): Random seed; the same seed makes the same swatches.
+        """
+
+        super(SourceModel, self).__init__()
+
+        self.words = load_words()
+        self.row_count = rows
+        self.seed = seed
+
+        self.names = []
+        self.colors = []
+
+        # Batches of swatches still to be inserted, while they load.
+        self._batches = None
+
+        self._batch_timer = QtCore.QTimer(self)
+        self._batch_timer.setInterval(0)
+        self._batch_timer.timeout.connect(self._append_batch)
+
+    @property
+    def loading(self):
+        """Return True while the swatches are being generated.
+
+        Returns:
+            bool
+        """
+
+        return self._batches is not None
+
+    def refresh(self):
+        """Generate the swatches again, in the background."""
+
+        self._batches = iter_batches(self.row_count, self.seed, self.words)
+
+        self.beginResetModel()
+
+        del self.names[:]
+        del self.colors[:]
+
+        self.endResetModel()
+
+        self._batch_timer.start()
+
+    def _append_batch(self):
+        """Insert the next batch of swatches."""
+
+        batch = next(self._batches, None)
+
+        if batch is None:
+            self._batch_timer.stop()
+            self._batches = None
+            self.Changed.emit()
+            return
+
+        self.append_rows(*batch)
+
+    def append_rows(self, names, colors):
+        """Add swatches to the end of the list, as one insert.
+
+        Args:
+            names (list[str]): Name of each swatch.
+            colors (list[str]): Color of each swatch.
+        """
+
+        if not names:
+            return
+
+        first = len(self.names)
+
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(names) - 1)
+
+        self.names.extend(names)
+        self.colors.extend(colors)
+
+        self.endInsertRows()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return len(self.names)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+
+        if role == QtCore.Qt.DisplayRole:
+            return self.names[row].replace(' ', '\n')
+        elif role == QtCore.Qt.DecorationRole:
+            return COLORS[self.colors[row]]
+        elif role == ColorItem.NAME_ROLE:
+            return self.names[row]
+        elif role == ColorItem.COLOR_ROLE:
+            return self.colors[row]
+
+        return None
+
+    def itemFromIndex(self, index):
+        # Swatches are not stored as items, so an item is made for the
+        # pythonic API (eg, item.color).
+        return ColorItem(self.names[index.row()], self.colors[index.row()])
+
+
+class FilterTask(QtCore.QRunnable):
+    """Filters and sorts the rows of a proxy model on a worker thread."""
+
+    def __init__(self, engine, generation, filtered, columns, *args):
+        """Initialize.
+
+        Args:
+            engine (FilterEngine): Engine to run the filters with; it is
+                used by one task at a time.
+            generation (int): Id of the request this task belongs to.
+            filtered (QtCore.SignalInstance): Emitted with the generation,
+                the rows that pass (see `FilterEngine.rows`), and the number
+                of rows in the engine.
+            columns (tuple): New (names, colors) columns for the engine,
+                or None if the source rows have not changed.
+            *args: Filter string, color, and sort column (see
+                `FilterEngine.rows`).
+        """
+
+        super(FilterTask, self).__init__()
+
+        self.engine = engine
+        self.generation = generation
+        self.cancelled = False
+
+        self._filtered = filtered
+        self._columns = columns
+        self._args = args
+
+    def run(self):
+        """Run the filters, one phase at a time.
+
+        The engine keeps the result of each phase, so a task that is
+        cancelled between phases leaves them to the task after it.
+        """
+
+        engine = self.engine
+        text, color, column = self._args
+
+        if self._columns is not None:
+            engine.set_rows(*self._columns)
+
+        phases = (
+            functools.partial(engine.mask, text, color),
+            functools.partial(engine.order, column),
+            functools.partial(engine.rows, text, color, column),
+        )
+
+        rows = None
+
+        for phase in phases:
+            if self.cancelled:
+                rows = None
+                break
+
+            rows = phase()
+
+        # The result is always sent, so the next task can start.
+        self._filtered.emit(self.generation, rows, len(self.engine))
+
+
+class ProxyModel(QtCore.QAbstractProxyModel):
+    """Sorted, filtered view of the rows of a `SourceModel`.
+
+    Unlike a QSortFilterProxyModel, which calls `filterAcceptsRow` and
+    `lessThan` for each row, the filters are run over the name and color
+    columns of the source model in one batch (see `filter_engine`), and
+    the result is a list of source rows, in sorted order.
+
+    The filters run on a QThreadPool worker, one task at a time; a request
+    made while a task runs cancels it, and waits for it to finish. The
+    rows shown do not change until the latest request is done, when they
+    are replaced with a single layout change.
+
+    Without NumPy, the engine's passes are single calls into C that hold
+    the GIL, so the window still pauses while one runs; a cancelled task
+    only stops between passes.
+    """
+
+    _Filtered = QtCore.Signal(int, object, int)
+
+    # Milliseconds without typing before the filter string is applied.
+    FILTER_DELAY = 150
+
+    def __init__(self):
+        super(ProxyModel, self).__init__()
+
+        self._engine = filter_engine.FilterEngine()
+        self._source_model = None
+
+        # Source row of each proxy row, the number of source rows they
+        # were picked from, and the proxy row of each source row (built
+        # when it is first needed).
+        self._rows = []
+        self._size = 0
+        self._inverse = None
+
+        # Whether the source rows have changed since the engine last read
+        # them.
+        self._source_changed = False
+
+        # Id of the latest request, the running task, and whether another
+        # request is waiting for it to finish.
+        self._generation = 0
+        self._task = None
+        self._pending = False
+
+        self._filter_string = ''
+        self._filter_value = None 
+        self._sort_role = ColorItem.NAME_ROLE
+
+        # Changes to the source model come a row at a time, and the filter
+        # string a character at a time, so they are collected and filtered
+        # together.
+        self._invalidate_timer = QtCore.QTimer(self)
+        self._invalidate_timer.setSingleShot(True)
+        self._invalidate_timer.timeout.connect(self.invalidate)
+
+        self._Filtered.connect(self._handle_filtered)
+
+    @property
+    def sort_role(self):
+        return self._sort_role
+
+    @sort_role.setter 
+    def sort_role(self, value):        
+        self._sort_role = value
+        self.invalidate()
+
+    @property
+    def filter_string(self):
+        return self._filter_string
+
+    @filter_string.setter
+    def filter_string(self, value):
+        self._filter_string = value
+        self._invalidate_timer.start(self.FILTER_DELAY)
+
+    @property 
+    def filter_value(self):
+        return self._filter_value
+
+    @filter_value.setter
+    def filter_value(self, value):
+        self._filter_value = value 
+        self.invalidate()
+
+    def refresh(self):
+        # The filters are re-run once the source model has loaded (see
+        # `_handle_source_changed`), which emits a `layoutChanged` signal
+        # from the model proxy, once they are done.
+        self.sourceModel().refresh()
+
+    def invalidate(self):
+        """Re-run the filters, and sort the rows that pass, in the background."""
+
+        self._invalidate_timer.stop()
+
+        if self.sourceModel() is None:
+            return
+
+        # Results of earlier requests are dropped.
+        self._generation += 1
+        self._pending = True
+
+        if self._task is None:
+            self._start_task()
+        else:
+            self._task.cancelled = True
+
+    def _start_task(self):
+        """Start a task for the latest request."""
+
+        columns = None
+
+        if self._source_changed:
+            # The task gets copies of the columns, as the source model may
+            # change while it runs; the engine keeps them as they are.
+            source_model = self.sourceModel()
+            columns = (list(source_model.names), list(source_model.colors))
+
+            self._source_changed = False
+
+        self._pending = False
+        self._task = FilterTask(
+            self._engine,
+            self._generation,
+            self._Filtered,
+            columns,
+            self._filter_string,
+            self._filter_value,
+            self._sort_column(),
+        )
+
+        QtCore.QThreadPool.globalInstance().start(self._task)
+
+    def _handle_filtered(self, generation, rows, size):
+        """Handle a task finishing.
+
+        Args:
+            generation (int): Id of the request the task belongs to.
+            rows (list[int]): Source rows that pass, in sorted order, or
+                None if the task was cancelled.
+            size (int): Number of source rows they were picked from.
+        """
+
+        self._task = None
+
+        if generation == self._generation and rows is not None:
+            self._set_rows(rows, size)
+
+        if self._pending:
+            self._start_task()
+
+    def _sort_column(self):
+        """Return the engine column for the sort role.
+
+        Returns:
+            str
+        """
+
+        if self._sort_role == ColorItem.COLOR_ROLE:
+            return filter_engine.COLOR
+
+        return filter_engine.NAME
+
+    def _set_rows(self, rows, size):
+        """Show the given source rows, with a single layout change.
+
+        Args:
+            rows (list[int]): Source rows, in sorted order.
+            size (int): Number of source rows they were picked from.
+        """
+
+        self.layoutAboutToBeChanged.emit()
+
+        old_indexes = self.persistentIndexList()
+        old_rows = [int(self._rows[index.row()]) for index in old_indexes]
+
+        self._rows = rows
+        self._size = size
+        self._inverse = None
+
+        if old_indexes:
+            positions = filter_engine.find_rows(rows, old_rows, size)
+
+            self.changePersistentIndexList(
+                old_indexes,
+                [
+                    self.index(position, index.column())
+                    for position, index in zip(positions, old_indexes)
+                ]
+            )
+
+        self.layoutChanged.emit()
+
+    def setSourceModel(self, source_model):
+        self.beginResetModel()
+
+        old_model = self.sourceModel()
+
+        if old_model is not None:
+            for signal, slot in self._source_connections(old_model):
+                signal.disconnect(slot)
+
+        super(ProxyModel, self).setSourceModel(source_model)
+
+        # Unlike QSortFilterProxyModel, QAbstractProxyModel does not keep
+        # the Python source model alive.
+        self._source_model = source_model
+
+        self._rows = []
+        self._size = 0
+        self._inverse = None
+        self._source_changed = True
+        self._generation += 1
+
+        if source_model is not None:
+            for signal, slot in self._source_connections(source_model):
+                signal.connect(slot)
+
+        self.endResetModel()
+
+        self._invalidate_timer.start(0)
+
+    def _source_connections(self, source_model):
+        """Return the source model signals, and the slots they connect to.
+
+        Args:
+            source_model (SourceModel): Source model.
+
+        Returns:
+            list[tuple]
+        """
+
+        return [
+            (source_model.modelAboutToBeReset, self._handle_source_removing),
+            (source_model.modelReset, self._handle_source_removed),
+            (source_model.rowsAboutToBeRemoved, self._handle_source_removing),
+            (source_model.rowsRemoved, self._handle_source_removed),
+            (source_model.rowsInserted, self._handle_source_inserted),
+            (source_model.dataChanged, self._handle_source_changed),
+            (source_model.Changed, self._handle_source_changed),
+        ]
+
+    def _handle_source_removing(self, *args):
+        # The proxy rows are source rows, which are about to be wrong, so
+        # the proxy model is emptied until the filters are re-run.
+        self.beginResetModel()
+
+    def _handle_source_removed(self, *args):
+        self._rows = []
+        self._size = 0
+        self._inverse = None
+        self.endResetModel()
+
+        # Results picked from the old rows would be wrong.
+        self._generation += 1
+
+        self._handle_source_changed()
+
+    def _handle_source_inserted(self, parent, first, last):
+        if last + 1 < self.sourceModel().rowCount():
+            # Rows were inserted before other rows, which moves them.
+            self.beginResetModel()
+            self._handle_source_removed()
+        else:
+            self._handle_source_changed()
+
+    def _handle_source_changed(self, *args):
+        self._source_changed = True
+
+        # Rows are filtered once they have all loaded, rather than after
+        # each batch.
+        if not self.sourceModel().loading:
+            self._invalidate_timer.start(0)
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+
+        return self.createIndex(row, column)
+
+    def parent(self, index):
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        source_model = self.sourceModel()
+
+        if parent.isValid() or source_model is None:
+            return 0
+
+        return source_model.columnCount()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QtCore.QModelIndex()
+
+        return self.sourceModel().index(
+            int(self._rows[proxy_index.row()]), proxy_index.column()
+        )
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QtCore.QModelIndex()
+
+        if self._inverse is None:
+            self._inverse = filter_engine.inverse(self._rows, self._size)
+
+        row = source_index.row()
+
+        # Rows added since the last filter are not shown yet.
+        if row >= len(self._inverse) or self._inverse[row] < 0:
+            return QtCore.QModelIndex()
+
+        return self.index(int(self._inverse[row]), source_index.column())
+
+    def item_from_index(self, index):
+        # A proxy model manages its own indices that must be mapped to the
+        # indices of the source model to access the items
+        source_index = self.mapToSource(index)
+        return self.sourceModel().itemFromIndex(source_index)
+
+
+class ItemView(QtWidgets.QListView):
+    def __init__(self, model, parent=None):
+        super(ItemView, self).__init__(parent)
+
+        self.setSelectionMode(QtWidgets.QTreeView.SingleSelection)
+        self.setEditTriggers(QtWidgets.QTreeView.NoEditTriggers)
+        self.setViewMode(QtWidgets.QListView.IconMode)
+        self.setResizeMode(QtWidgets.QListView.Adjust)
+        self.setMovement(QtWidgets.QListView.Static)
+        self.setIconSize(QtCore.QSize(96, 96))
+        self.setLayoutMode(QtWidgets.QListView.Batched)
+        self.setModel(model)
+
+    def selectionChanged(self, old, new):
+        for index in self.selectedIndexes():
+            item = self.model().item_from_index(index)
+
+            print(
+                '{:12} {}'
+                .format('[{}]'.format(item.color), item.name)
+            )
+
+
+class ColorItem(QtGui.QStandardItem):
+    """Model item for a color swatch."""
+
+    # Wrapping QStandardItem provides a pythonic API for accessing the data 
+    # (eg, item.color) instead of having to make other objects aware of the 
+    # data role values.
+
+    NAME_ROLE = QtCore.Qt.UserRole + 1
+    COLOR_ROLE = QtCore.Qt.UserRole + 2
+
+    def __init__(self, name, color):
+        display_name = name.replace(' ', '\n')
+
+        super(ColorItem, self).__init__(display_name)
+        
+        self.setData(name, self.NAME_ROLE)
+        self.setData(color, self.COLOR_ROLE)
+
+        color_swatch = COLORS[color]
+        self.setData(color_swatch, QtCore.Qt.DecorationRole)
+
+    @property 
+    def name(self):
+        return self.data(self.NAME_ROLE)
+
+    @property
+    def color(self):
+        return self.data(self.COLOR_ROLE)
+
+
+class SimpleDataModel(QtGui.QStandardItemModel):
+    """Simple wrapper around a QStandardItemModel.
+    
+    Allows construction of items with data in a fixed role.
+    """
+
+    def __init__(self, data_role=QtCore.Qt.UserRole + 1):
+        super(SimpleDataModel, self).__init__()
+        self.data_role = data_role
+
+    def _add_item(self, name, data):
+        item = QtGui.QStandardItem(name)
+        item.setData(data, self.data_role)
+
+        self.appendRow(item)
+
+
+class Colors(SimpleDataModel):
+    """List of color options."""
+
+    def __init__(self):
+        super(Colors, self).__init__()
+        
+        self._add_item('All Colors', None)
+
+        for color in sorted(COLORS):
+            self._add_item(color, color)
+
+
+class SortModes(SimpleDataModel):
+    """List of sort options."""
+
+    def __init__(self):
+        super(SortModes, self).__init__()
+
+        self._add_item('By Name', ColorItem.NAME_ROLE)
+        self._add_item('By Color', ColorItem.COLOR_ROLE)
+
+
+class DataComboBox(QtWidgets.QComboBox):
+    """Simple wrapper around a ComboBox.
+    
+    The `Changed` signal emits the data assigned to the selected item.
+    """
+
+    Changed = QtCore.Signal(object)
+
+    def __init__(self, model, parent=None, data_role=QtCore.Qt.UserRole + 1):
+        self.data_role = data_role 
+
+        super(DataComboBox, self).__init__(parent)
+        
+        self.currentIndexChanged.connect(self._handle_index_changed)
+        self.setModel(model)
+
+    def _handle_index_changed(self, index):
+        self.Changed.emit(self.itemData(index, self.data_role))
+        
+
+class MainWidget(QtWidgets.QWidget):
+    """Widget for viewing a list of items, with filter/sort capabilities."""
+
+    def __init__(self, model, parent=None):
+        super(MainWidget, self).__init__(parent)
+
+        self.model = model 
+
+        main_layout = QtWidgets.QVBoxLayout(self)
+        form_layout = QtWidgets.QFormLayout()
+
+        self.filter_edit = QtWidgets.QLineEdit(self)
+        self.sort_mode = DataComboBox(SortModes(), self)
+        self.color_mode = DataComboBox(Colors(), self)
+        self.flow_view = ItemView(model, self)       
+        self.item_count = QtWidgets.QLabel()
+
+        form_layout.addRow('Search', self.filter_edit)
+        form_layout.addRow('Sort', self.sort_mode)
+        form_layout.addRow('Show', self.color_mode)
+        main_layout.addLayout(form_layout)
+        main_layout.addWidget(self.flow_view)
+        main_layout.addWidget(self.item_count)
+        
+        self._connect_slots()
+
+    def _connect_slots(self):
+        """Connect signals/slots."""
+
+        self.model.layoutChanged.connect(self._update_item_count)
+        self.model.modelReset.connect(self._update_item_count)
+
+        # A partial of `setattr` gives you a callable to assign a value.
+        #
+        # f = partial(setattr, obj, 'foo')
+        # f(5)
+        # obj.foo
+        # 5
+
+        self.filter_edit.textChanged.connect(
+            functools.partial(setattr, self.model, 'filter_string')
+        )
+
+        self.sort_mode.Changed.connect(
+            functools.partial(setattr, self.model, 'sort_role')
+        )
+
+        self.color_mode.Changed.connect(
+            functools.partial(setattr, self.model, 'filter_value')
+        )
+
+    def _update_item_count(self):        
+        """Update the item counter."""
+
+        self.item_count.setText(
+            'Showing {:4d} Items'
+            .format(self.model.rowCount())
+        )
+
+
+class MainWindow(QtWidgets.QMainWindow):    
+    """Tool for viewing a list of items, with filter/sort capabilities."""
+
+    def __init__(self, rows=1000, seed=42):
+        super(MainWindow, self).__init__()
+
+        self.setWindowTitle('Filter/Sort Proxy Model Example')
+
+        self.source_model = SourceModel(rows, seed)
+
+        self.model = ProxyModel()
+        self.model.setSourceModel(self.source_model)
+
+        self.setCentralWidget(MainWidget(self.model))
+
+        self._opened = False 
+
+    def showEvent(self, event):
+        super(MainWindow, self).showEvent(event)
+
+        if not self._opened:
+            self._opened = True 
+
+            QtCore.QTimer.singleShot(10, self.refresh)
+
+    def refresh(self):
+        """Refresh the view."""
+
+        self.model.refresh()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='View a list of swatches.')
+    parser.add_argument(
+        '--rows', type=int, default=1000, help='Number of swatches'
+    )
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication([])
+    app.setQuitOnLastWindowClosed(True)
+
+    win = MainWindow(args.rows, args.seed)
+    win.resize(540, 400)
+    win.show()
+
+    sys.exit(app.exec_())
+
+
+if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,32 +1,116 @@
-import argparse
-import sys 
-
-import common
-import item_widget
-import model_view 
-import model_view2 
-
-from PySide2 import QtCore, QtGui, QtWidgets
-
-
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument(
-        '--mv', action='store_true', help='View the Model/View example'
-    )
-    parser.add_argument(
-        '--mv2', action='store_true', help='View the Model/View example'
-    )
-
-    args = parser.parse_args()
-
-    if args.mv2:
-        model_view2.main()
-    elif args.mv:
-        model_view.main()
-    else:
-        item_widget.main()
-
-
-if __name__ == '__main__':
-    main()
\ No newline at end of file
+"""Launch one of the status examples.
+
+Only the selected example (and the parts of Qt it uses) is imported, after
+the arguments are parsed. With --timing, the time it takes to import the
+example and to paint its window is printed. With --budget, the launcher 
+also exits as soon as the window is painted, with status OVER_BUDGET if 
+that took longer than the budget, so startup time can be checked in CI.
+
+    python -m qmodelview --mv2 --timing
+    python -m qmodelview --mv2 --budget 1.5
+"""
+
+import time
+
+# Measured from here, as the interpreter's own startup is not visible to it.
+START = time.perf_counter()
+
+import argparse
+import functools
+import importlib
+import os
+import sys 
+
+
+# Exit status when startup takes longer than the budget.
+OVER_BUDGET = 3
+
+
+def report_startup(example, imported, budget, painted):
+    """Print how long startup took, and exit if it is being measured.
+
+    Args:
+        example (str): Name of the example module.
+        imported (tuple[float, float]): Times the example import started
+            and ended.
+        budget (float): Startup budget, in seconds, or None.
+        painted (float): Time of the first paint of the window.
+    """
+
+    timings = [
+        ('arguments', imported[0] - START),
+        ('import {}'.format(example), imported[1] - imported[0]),
+        ('first window', painted - imported[1]),
+        ('total', painted - START),
+    ]
+
+    for label, seconds in timings:
+        print('{:<24}{:8.1f} ms'.format(label, seconds * 1000), file=sys.stderr)
+
+    if budget is None:
+        return
+
+    over_budget = painted - START > budget
+
+    print(
+        'budget {:.1f} ms {}'.format(
+            budget * 1000, 'exceeded' if over_budget else 'met'
+        ),
+        file=sys.stderr
+    )
+
+    # The example is loaded by now, so this does not import anything.
+    from PySide2 import QtWidgets
+
+    QtWidgets.QApplication.exit(OVER_BUDGET if over_budget else 0)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--mv', action='store_true', help='View the Model/View example'
+    )
+    parser.add_argument(
+        '--mv2', action='store_true', help='View the Model/View+ example'
+    )
+    parser.add_argument(
+        '--timing', action='store_true', help='Print the startup time'
+    )
+    parser.add_argument(
+        '--budget', 
+        type=float, 
+        default=os.environ.get('QMODELVIEW_STARTUP_BUDGET'),
+        help='Exit once the window is painted, with an error if startup took '
+             'longer than this many seconds'
+    )
+
+    args = parser.parse_args()
+
+    if args.mv2:
+        example = 'model_view2'
+    elif args.mv:
+        example = 'model_view'
+    else:
+        example = 'item_widget'
+
+    # The examples import each other as top level modules, as they do when
+    # they are run as scripts.
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    import_start = time.perf_counter()
+    module = importlib.import_module(example)
+    import_end = time.perf_counter()
+
+    if not args.timing and args.budget is None:
+        module.main()
+        return
+
+    module.main(
+        on_first_paint=functools.partial(
+            report_startup, example, (import_start, import_end), args.budget
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
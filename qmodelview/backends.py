@@ -0,0 +1,546 @@
+"""Status data backends.
+
+A backend is a source of status data. The examples read small JSON files,
+but the same data can be served from a database, where it can be queried
+by parent or by status without loading everything.
+
+Status data is either flat (parent -> child -> status, like `data.json`), or
+nested (sequence -> shot -> task records, like `data2.json`). The SQLite
+backend stores flat data; snapshots store either.
+"""
+
+import contextlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+
+import cache
+import snapshot
+import stream
+
+
+class StatusBackend(object):
+    """Interface for a source of status data."""
+
+    def query(self):
+        """Return all of the status data.
+
+        Returns:
+            dict|list[dict]: Flat or nested status data.
+        """
+
+        raise NotImplementedError()
+
+    def iter_items(self):
+        """Yield the top level items of the status data.
+
+        Yields:
+            object: (name, children) pairs for flat data, or records for
+                nested data.
+        """
+
+        data = self.query()
+
+        for item in (data.items() if isinstance(data, dict) else data):
+            yield item
+
+    def parents(self):
+        """Return the names of the top level items, sorted.
+
+        Returns:
+            list[str]
+        """
+
+        raise NotImplementedError()
+
+    def children(self, parent):
+        """Return the status data of one top level item.
+
+        Args:
+            parent (str): Name of the top level item.
+
+        Returns:
+            dict|list[dict]: Status codes by child name for flat data, or
+                the child records for nested data.
+
+        Raises:
+            KeyError: If there is no such top level item.
+        """
+
+        raise NotImplementedError()
+
+    def with_status(self, status):
+        """Return the items with the given status.
+
+        Args:
+            status (str): Status code.
+
+        Returns:
+            list[tuple]: Names of each item and its parents, from the top
+                level down, followed by the status code.
+        """
+
+        raise NotImplementedError()
+
+    def close(self):
+        """Release the resources held by this backend."""
+
+
+class JsonBackend(StatusBackend):
+    """Status data read from a JSON file."""
+
+    def __init__(self, path, cache=None):
+        """Initialize.
+
+        Args:
+            path (str): Path to the JSON file.
+            cache (cache.QueryCache): Optional cache for the parsed data.
+        """
+
+        self.path = path
+        self.cache = cache
+
+    def query(self):
+        if self.cache is None:
+            return self._load()
+
+        return self.cache.load((self.path, 'document'), self.path, self._load)
+
+    def iter_items(self):
+        # The file is parsed one top level item at a time, so the first
+        # items are available before the whole file has been read.
+        if self.cache is None:
+            for item in self._iter_file():
+                yield item
+
+            return
+
+        key = (self.path, 'items')
+        signature = self.cache.signature(self.path)
+        items = self.cache.get(key, signature)
+
+        if items is not None:
+            for item in items:
+                yield item
+
+            return
+
+        items = []
+
+        for item in self._iter_file():
+            items.append(item)
+            yield item
+
+        self.cache.put(key, signature, items)
+
+    def parents(self):
+        data = self.query()
+
+        if isinstance(data, dict):
+            return sorted(data)
+
+        return sorted(each['name'] for each in data)
+
+    def children(self, parent):
+        data = self.query()
+
+        if isinstance(data, dict):
+            return data[parent]
+
+        for each in data:
+            if each['name'] == parent:
+                return each.get('items', [])
+
+        raise KeyError(parent)
+
+    def with_status(self, status):
+        return [
+            path + (code,)
+            for path, code in iter_statuses(self.query())
+            if code == status
+        ]
+
+    def _load(self):
+        """Return the parsed JSON file.
+
+        Returns:
+            dict|list[dict]
+        """
+
+        with open(self.path, 'r') as fp:
+            return json.load(fp)
+
+    def _iter_file(self):
+        """Yield the top level items of the JSON file as they are parsed.
+
+        Yields:
+            object
+        """
+
+        with open(self.path, 'r') as fp:
+            for item in stream.iter_document(fp):
+                yield item
+
+
+def iter_statuses(data, path=()):
+    """Yield the path and status code of each item in the status data.
+
+    Args:
+        data (dict|list[dict]): Flat or nested status data.
+        path (tuple[str]): Names of the parents of the data.
+
+    Yields:
+        tuple[tuple[str], str]
+    """
+
+    if isinstance(data, dict):
+        for name, value in sorted(data.items()):
+            if isinstance(value, dict):
+                for each in iter_statuses(value, path + (name,)):
+                    yield each
+            else:
+                yield path + (name,), value
+
+        return
+
+    for record in data:
+        if 'status' in record:
+            yield path + (record['name'],), record['status']
+        else:
+            children = record.get('items', [])
+
+            for each in iter_statuses(children, path + (record['name'],)):
+                yield each
+
+
+class ConnectionPool(object):
+    """Pool of read-only SQLite connections.
+
+    A connection is only used by one thread at a time, but may be used by
+    different threads (eg, the loader's worker threads) over its lifetime.
+    """
+
+    def __init__(self, path, size=4):
+        """Initialize.
+
+        Args:
+            path (str): Path to the database.
+            size (int): Maximum number of idle connections to keep.
+        """
+
+        self.path = path
+        self.size = size
+
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Borrow a connection from the pool.
+
+        Yields:
+            sqlite3.Connection
+        """
+
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                keep = not self._closed and self._idle.qsize() < self.size
+
+            if keep:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+    def close(self):
+        """Close the idle connections."""
+
+        with self._lock:
+            self._closed = True
+
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _connect(self):
+        """Open a new connection.
+
+        Returns:
+            sqlite3.Connection
+        """
+
+        # Only needed for databases, and slow to import, so it is imported
+        # when a connection is opened rather than on startup.
+        import urllib.request
+
+        # The module keeps a cache of prepared statements per connection,
+        # keyed by the SQL text; the backend's queries are constants, so
+        # they are only prepared once per connection.
+        return sqlite3.connect(
+            'file:{}?mode=ro'.format(urllib.request.pathname2url(self.path)),
+            uri=True,
+            check_same_thread=False,
+            cached_statements=32,
+        )
+
+
+class SqliteBackend(StatusBackend):
+    """Flat status data stored in a SQLite database."""
+
+    # The primary key doubles as the index on parent.
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS status ('
+        '    parent TEXT NOT NULL,'
+        '    child TEXT NOT NULL,'
+        '    status TEXT NOT NULL,'
+        '    PRIMARY KEY (parent, child)'
+        ') WITHOUT ROWID',
+        'CREATE INDEX IF NOT EXISTS status_child ON status (child)',
+        'CREATE INDEX IF NOT EXISTS status_status ON status (status, parent, child)',
+    )
+
+    SELECT_ALL = 'SELECT parent, child, status FROM status ORDER BY parent, child'
+    SELECT_PARENTS = 'SELECT DISTINCT parent FROM status ORDER BY parent'
+    SELECT_CHILDREN = 'SELECT child, status FROM status WHERE parent = ? ORDER BY child'
+    SELECT_STATUS = 'SELECT parent, child FROM status WHERE status = ? ORDER BY parent, child'
+    INSERT = 'INSERT OR REPLACE INTO status (parent, child, status) VALUES (?, ?, ?)'
+
+    def __init__(self, path, pool_size=4):
+        """Initialize.
+
+        Args:
+            path (str): Path to the database.
+            pool_size (int): Maximum number of idle connections to keep.
+        """
+
+        self.path = path
+        self.pool = ConnectionPool(path, pool_size)
+
+    @classmethod
+    def create(cls, path, rows, batch_size=10000):
+        """Create (or add to) a status database.
+
+        Args:
+            path (str): Path to the database.
+            rows (iterable[tuple[str, str, str]]): Parent, child and status
+                of each item.
+            batch_size (int): Number of rows to insert per transaction.
+
+        Returns:
+            SqliteBackend
+        """
+
+        conn = sqlite3.connect(path)
+
+        try:
+            for statement in cls.SCHEMA:
+                conn.execute(statement)
+
+            batch = []
+
+            for row in rows:
+                batch.append(row)
+
+                if len(batch) >= batch_size:
+                    with conn:
+                        conn.executemany(cls.INSERT, batch)
+
+                    batch = []
+
+            with conn:
+                conn.executemany(cls.INSERT, batch)
+
+            conn.execute('ANALYZE')
+        finally:
+            conn.close()
+
+        return cls(path)
+
+    def query(self):
+        result = {}
+
+        for parent, children in self.iter_items():
+            result[parent] = children
+
+        return result
+
+    def iter_items(self):
+        parent = None
+        children = None
+
+        with self.pool.connection() as conn:
+            for name, child, status in conn.execute(self.SELECT_ALL):
+                if name != parent:
+                    if parent is not None:
+                        yield parent, children
+
+                    parent = name
+                    children = {}
+
+                children[child] = status
+
+        if parent is not None:
+            yield parent, children
+
+    def parents(self):
+        with self.pool.connection() as conn:
+            return [name for name, in conn.execute(self.SELECT_PARENTS)]
+
+    def children(self, parent):
+        with self.pool.connection() as conn:
+            result = dict(conn.execute(self.SELECT_CHILDREN, (parent,)))
+
+        if not result:
+            raise KeyError(parent)
+
+        return result
+
+    def with_status(self, status):
+        with self.pool.connection() as conn:
+            return [
+                (parent, child, status)
+                for parent, child in conn.execute(self.SELECT_STATUS, (status,))
+            ]
+
+    def close(self):
+        self.pool.close()
+
+
+class SnapshotBackend(StatusBackend):
+    """Status data read from a memory-mapped binary snapshot."""
+
+    def __init__(self, path):
+        """Initialize.
+
+        Args:
+            path (str): Path to the snapshot.
+        """
+
+        self.path = path
+
+        self._snapshot = None
+        self._signature = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, path, rows):
+        """Create a snapshot of flat status data.
+
+        Args:
+            path (str): Path to the snapshot.
+            rows (iterable[tuple[str, str, str]]): Parent, child and status
+                of each item.
+
+        Returns:
+            SnapshotBackend
+        """
+
+        data = {}
+
+        for parent, child, status in rows:
+            data.setdefault(parent, {})[child] = status
+
+        snapshot.write(path, data)
+
+        return cls(path)
+
+    def snapshot(self):
+        """Return the snapshot, mapped again if the file changed.
+
+        Returns:
+            snapshot.Snapshot
+        """
+
+        signature = cache.QueryCache.signature(self.path)
+
+        with self._lock:
+            # The previous snapshot may still be in use by another thread,
+            # so it is left to be unmapped when it is no longer referenced.
+            if self._snapshot is None or signature != self._signature:
+                self._snapshot = snapshot.Snapshot(self.path)
+                self._signature = signature
+
+            return self._snapshot
+
+    def query(self):
+        return self.snapshot().to_data()
+
+    def iter_items(self):
+        mapped = self.snapshot()
+
+        for node in range(mapped.top_count):
+            yield mapped.item(node)
+
+    def parents(self):
+        mapped = self.snapshot()
+
+        return [mapped.name(node) for node in range(mapped.top_count)]
+
+    def children(self, parent):
+        mapped = self.snapshot()
+        node = mapped.find(parent)
+
+        if node < 0:
+            raise KeyError(parent)
+
+        item = mapped.item(node)
+
+        if mapped.shape == snapshot.FLAT:
+            return item[1]
+
+        return item.get('items', [])
+
+    def with_status(self, status):
+        mapped = self.snapshot()
+
+        # Only leaf nodes are status items, as in the other backends.
+        return [
+            mapped.path(node) + (status,)
+            for node in mapped.with_status(status)
+            if not mapped.child_count[node]
+        ]
+
+    def close(self):
+        with self._lock:
+            if self._snapshot is not None:
+                self._snapshot.close()
+                self._snapshot = None
+
+
+# Backends, by file extension. Anything else is read as JSON.
+BACKENDS = {
+    '.qmvs': SnapshotBackend,
+    '.db': SqliteBackend,
+    '.sqlite': SqliteBackend,
+    '.sqlite3': SqliteBackend,
+}
+
+
+def open_backend(path, cache=None):
+    """Return a backend for the given status data file.
+
+    Args:
+        path (str): Path to the status data.
+        cache (cache.QueryCache): Optional cache for parsed JSON data.
+
+    Returns:
+        StatusBackend
+    """
+
+    backend = BACKENDS.get(os.path.splitext(path)[1].lower())
+
+    if backend is None:
+        return JsonBackend(path, cache)
+
+    return backend(path)
@@ -0,0 +1,281 @@
+"""Scaling benchmark for the status examples.
+
+Compares the item/widget, model/view and model/view+ examples on synthetic
+status data of increasing size, on the offscreen Qt platform. Each case
+runs in its own process, so memory use is measured in isolation. Memory is
+reported both as the peak of Python allocations, which does not include
+the items Qt allocates, and as the change in resident memory.
+
+The model/view+ example is measured loading every item up front, like the
+other examples, and, as `model_view2_lazy`, loading the children of each
+top level item only when they are needed, as the example does.
+
+    python bench.py --sizes 1000 10000 100000 --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import synthetic
+
+
+# Widget class, data shape and lazy loading (None if the widget has no lazy
+# mode) of each example.
+APPROACHES = {
+    'item_widget': ('item_widget', 'StatusWidget', 'flat', None),
+    'model_view': ('model_view', 'StatusView', 'flat', None),
+    'model_view2': ('model_view2', 'StatusWidget', 'nested', False),
+    'model_view2_lazy': ('model_view2', 'StatusWidget', 'nested', True),
+}
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+
+
+def _timed(func, *args):
+    """Call a function and return how long it took.
+
+    Args:
+        func (callable): Function to call.
+
+    Returns:
+        float: Elapsed time, in seconds.
+    """
+
+    start = time.perf_counter()
+    func(*args)
+
+    return time.perf_counter() - start
+
+
+def _rss_bytes():
+    """Return the resident memory of this process.
+
+    Returns:
+        int: Bytes, or the peak resident memory where the current one is
+            not available (kilobytes on Linux, bytes on macOS).
+    """
+
+    try:
+        with open('/proc/self/statm') as fp:
+            return int(fp.read().split()[1]) * resource.getpagesize()
+    except (IOError, OSError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _tree_view(widget):
+    """Return the tree view of a status widget.
+
+    Args:
+        widget (QtWidgets.QWidget): Status widget.
+
+    Returns:
+        QtWidgets.QTreeView
+    """
+
+    return getattr(widget, 'status_view', widget)
+
+
+def _span_top_rows(view):
+    """Span the first column of every top level row of the given view.
+
+    Args:
+        view (QtWidgets.QTreeView): Tree view.
+    """
+
+    root = view.rootIndex()
+
+    for row in range(view.model().rowCount(root)):
+        view.setFirstColumnSpanned(row, root, True)
+
+
+def run_case(approach, path):
+    """Measure one example on one dataset.
+
+    Args:
+        approach (str): Name of the example (see `APPROACHES`).
+        path (str): Path to the status data.
+
+    Returns:
+        dict: Measurements, in seconds and bytes.
+    """
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    import importlib
+
+    from PySide2 import QtWidgets
+
+    import common
+
+    module_name, class_name, _, lazy = APPROACHES[approach]
+    widget_class = getattr(importlib.import_module(module_name), class_name)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    widget = widget_class()
+    widget.data_source = path
+    widget.resize(320, 320)
+
+    if lazy is not None:
+        widget.model.lazy = lazy
+
+    result = {}
+
+    start_rss = _rss_bytes()
+    tracemalloc.start()
+    result['refresh'] = _timed(widget.refresh)
+    result['peak_python_bytes'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result['refresh_rss_bytes'] = _rss_bytes() - start_rss
+
+    # A second refresh of the same (cached) data only has to diff it.
+    result['refresh_unchanged'] = _timed(widget.refresh)
+
+    view = _tree_view(widget)
+    view.collapseAll()
+
+    result['expand_all'] = _timed(view.expandAll)
+    result['span_first_column'] = _timed(_span_top_rows, view)
+
+    widget.show()
+    app.processEvents()
+
+    result['first_paint'] = _timed(widget.grab)
+
+    # Includes what the views allocate to expand and paint the rows.
+    result['rss_bytes'] = _rss_bytes() - start_rss
+
+    # Kilobytes on Linux, bytes on macOS.
+    result['max_rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    common.QUERY_CACHE.invalidate()
+
+    return result
+
+
+def write_dataset(directory, shape, rows):
+    """Write a synthetic dataset, unless it already exists.
+
+    Args:
+        directory (str): Directory to write to.
+        shape (str): 'flat' or 'nested'.
+        rows (int): Number of rows.
+
+    Returns:
+        str: Path to the dataset.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+
+    path = os.path.join(directory, '{}_{}.json'.format(shape, rows))
+
+    if not os.path.exists(path):
+        synthetic.write(path, rows, nested=shape == 'nested')
+
+    return path
+
+
+def run(approaches, sizes, directory, timeout=None):
+    """Run the benchmark, one process per case.
+
+    Args:
+        approaches (list[str]): Names of the examples to measure.
+        sizes (list[int]): Dataset sizes, in rows.
+        directory (str): Directory for the datasets.
+        timeout (float): Seconds to allow each case, or None.
+
+    Returns:
+        list[dict]
+    """
+
+    results = []
+
+    for rows in sizes:
+        for approach in approaches:
+            path = write_dataset(directory, APPROACHES[approach][2], rows)
+
+            entry = {'approach': approach, 'rows': rows}
+
+            try:
+                output = subprocess.run(
+                    [sys.executable, __file__, '--case', approach, path],
+                    stdout=subprocess.PIPE,
+                    check=True,
+                    timeout=timeout,
+                ).stdout
+            except subprocess.TimeoutExpired:
+                entry['error'] = 'timeout'
+            except subprocess.CalledProcessError as error:
+                entry['error'] = 'exit code {}'.format(error.returncode)
+            else:
+                entry.update(json.loads(output))
+
+            results.append(entry)
+
+            summary = entry.get('error') or '{:.3f}s'.format(entry['refresh'])
+
+            print(
+                '# {:12} {:>9} rows: {}'.format(approach, rows, summary),
+                file=sys.stderr
+            )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--approaches', nargs='+', choices=sorted(APPROACHES),
+        default=sorted(APPROACHES), help='Examples to measure'
+    )
+    parser.add_argument(
+        '--sizes', nargs='+', type=int, default=DEFAULT_SIZES,
+        help='Dataset sizes, in rows'
+    )
+    parser.add_argument(
+        '--data-dir', help='Directory for the datasets (default: temporary)'
+    )
+    parser.add_argument(
+        '--timeout', type=float, help='Seconds to allow each case'
+    )
+    parser.add_argument(
+        '--output', help='JSON file to write the results to (default: stdout)'
+    )
+    parser.add_argument(
+        '--case', nargs=2, metavar=('APPROACH', 'PATH'), help=argparse.SUPPRESS
+    )
+
+    args = parser.parse_args()
+
+    if args.case:
+        json.dump(run_case(*args.case), sys.stdout)
+        sys.exit(0)
+
+    directory = args.data_dir or tempfile.mkdtemp(prefix='qmodelview_bench_')
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': run(args.approaches, args.sizes, directory, args.timeout),
+    }
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(report, fp, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
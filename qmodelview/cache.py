@@ -0,0 +1,162 @@
+"""In-process cache for status data.
+
+Status data is cached by file, and validated against the file's
+modification time and size, so an unchanged file is never re-read or
+re-parsed. The least recently used entries are evicted first.
+
+Cached values are shared between callers; they must not be modified.
+"""
+
+import collections
+import os
+import threading
+
+
+FileSignature = collections.namedtuple('FileSignature', 'mtime size')
+
+CacheStats = collections.namedtuple(
+    'CacheStats', 'hits misses evictions entries size'
+)
+
+
+class QueryCache(object):
+    """LRU cache of status data, validated by file signature."""
+
+    def __init__(self, max_entries=8, max_size=1024 ** 3):
+        """Initialize.
+
+        Args:
+            max_entries (int): Maximum number of cached values.
+            max_size (int): Maximum total size, in bytes, of the files the
+                cached values were read from.
+        """
+
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def signature(path):
+        """Return the signature of the given file.
+
+        Args:
+            path (str): Path to a file.
+
+        Returns:
+            FileSignature
+        """
+
+        stat = os.stat(path)
+
+        return FileSignature(stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def stats(self):
+        """Return the hit/miss statistics for this cache.
+
+        Returns:
+            CacheStats
+        """
+
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size()
+            )
+
+    def get(self, key, signature):
+        """Return the cached value for the given key.
+
+        Args:
+            key (hashable): Cache key.
+            signature (FileSignature): Current signature of the file the
+                value was read from.
+
+        Returns:
+            object: None if there is no value, or it is out of date.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] != signature:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return entry[1]
+
+    def put(self, key, signature, value):
+        """Cache a value.
+
+        Args:
+            key (hashable): Cache key.
+            signature (FileSignature): Signature of the file the value was
+                read from, taken *before* it was read.
+            value (object): Value to cache.
+        """
+
+        with self._lock:
+            self._entries[key] = (signature, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries
+                or self._size() > self.max_size
+            ):
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def load(self, key, path, loader):
+        """Return the cached value for the given key, loading it if needed.
+
+        Args:
+            key (hashable): Cache key.
+            path (str): Path to the file the value is read from.
+            loader (callable): Returns the value, read from the file.
+
+        Returns:
+            object
+        """
+
+        signature = self.signature(path)
+        value = self.get(key, signature)
+
+        if value is None:
+            value = loader()
+            self.put(key, signature, value)
+
+        return value
+
+    def invalidate(self, key=None):
+        """Remove a value from the cache.
+
+        Args:
+            key (hashable): Cache key; if None, the whole cache is cleared.
+        """
+
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _size(self):
+        """Return the total size of the files of the cached values.
+
+        Returns:
+            int
+        """
+
+        return sum(signature.size for signature, _ in self._entries.values())
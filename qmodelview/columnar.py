@@ -0,0 +1,771 @@
+"""Columnar storage for hierarchical status data.
+
+Nested status records (sequence -> shot -> task) cost a Python dict per
+record, and a QStandardItem per cell once they are shown. This module
+stores the same hierarchy in a few flat arrays instead, one value per node:
+
+    name_ids     index of the node's name in the string table
+    parents      id of the node's parent, or -1 for a top level node
+    first_child  id of the node's first child
+    child_count  number of children of the node
+    statuses     index of the node's status code in the status table
+
+The children of a node are stored next to each other (a CSR layout), so
+the children of `node` are `first_child[node] + row`, and the row of a
+node is `node - first_child[parents[node]]`; both are O(1).
+
+Nodes with children also have a rollup: the number of leaf nodes below
+them with each status code. Rollups are stored in one array per status
+code, with one value per node with children (see `rollup_ids`). They are
+computed when nodes are added, and updated in O(depth) when the status of
+a leaf changes.
+
+Nodes are never moved once they are added. Changing the structure of a
+subtree means adding a new copy of it and discarding the old one; the
+discarded nodes are reclaimed by `StatusTree.compacted`.
+"""
+
+import array
+import collections
+
+
+class StringTable(object):
+    """Table of interned strings, so each distinct string is stored once."""
+
+    def __init__(self, values=()):
+        """Initialize.
+
+        Args:
+            values (iterable[str]): Initial strings.
+        """
+
+        self._values = []
+        self._ids = {}
+
+        # Encoded strings, and their offsets, for a table whose strings are
+        # decoded as they are used (see `from_utf8`).
+        self._data = None
+        self._offsets = None
+
+        for value in values:
+            self.intern(value)
+
+    @classmethod
+    def from_utf8(cls, data, offsets):
+        """Return a table of encoded strings, which are decoded as they are
+        used.
+
+        Args:
+            data (bytes): UTF-8 encoded strings, one after another; they
+                must be distinct.
+            offsets (array.array): Start of each string, followed by the end
+                of the last one.
+
+        Returns:
+            StringTable
+        """
+
+        table = cls()
+        table._data = data
+        table._offsets = offsets
+        table._values = [None] * (len(offsets) - 1)
+
+        # Ids are looked up by string once they are all decoded.
+        table._ids = None
+
+        return table
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, value_id):
+        value = self._values[value_id]
+
+        if value is None and self._data is not None:
+            value = self._values[value_id] = str(
+                self._data[self._offsets[value_id]:self._offsets[value_id + 1]],
+                'utf-8'
+            )
+
+        return value
+
+    def _decode_all(self):
+        """Decode every string, so ids can be looked up by string."""
+
+        if self._ids is not None:
+            return
+
+        self._values = [self[each] for each in range(len(self._values))]
+        self._ids = {value: value_id for value_id, value in enumerate(self._values)}
+        self._data = None
+        self._offsets = None
+
+    def intern(self, value):
+        """Return the id of the given string, adding it if needed.
+
+        Args:
+            value (str): String to look up.
+
+        Returns:
+            int
+        """
+
+        self._decode_all()
+
+        value_id = self._ids.get(value)
+
+        if value_id is None:
+            value_id = self._ids[value] = len(self._values)
+            self._values.append(value)
+
+        return value_id
+
+    def get(self, value, default=-1):
+        """Return the id of the given string, without adding it.
+
+        Args:
+            value (str): String to look up.
+            default (int): Id to return if the string is not in the table.
+
+        Returns:
+            int
+        """
+
+        self._decode_all()
+
+        return self._ids.get(value, default)
+
+
+class StatusTree(object):
+    """Hierarchy of named nodes with status codes, stored in flat arrays."""
+
+    def __init__(self, strings=None, status_codes=None):
+        """Initialize.
+
+        Args:
+            strings (StringTable): Table of node names, to share with
+                another tree.
+            status_codes (StringTable): Table of status codes, to share with
+                another tree. Id 0 is reserved for nodes without a status.
+        """
+
+        self.strings = StringTable() if strings is None else strings
+        self.status_codes = (
+            StringTable([None]) if status_codes is None else status_codes
+        )
+
+        self.name_ids = array.array('I')
+        self.parents = array.array('i')
+        self.first_child = array.array('I')
+        self.child_count = array.array('I')
+
+        # At most 255 different status codes.
+        self.statuses = array.array('B')
+
+        # Row of each node in the rollup arrays, or -1 for leaf nodes, and
+        # the rollup arrays, by status id.
+        self.rollup_ids = array.array('i')
+        self.rollups = []
+        self._rollup_count = 0
+
+        # Number of nodes that were discarded, and can be reclaimed.
+        self.garbage = 0
+
+    @classmethod
+    def from_records(cls, records):
+        """Return a tree of the given top level records.
+
+        Unlike `add`, the nodes are stored breadth first across all of the 
+        records, so the top level nodes come first, in the given order.
+
+        Args:
+            records (iterable[dict]): Top level status data.
+
+        Returns:
+            StatusTree
+        """
+
+        tree = cls()
+        queue = collections.deque()
+
+        for record in records:
+            queue.append((tree._append_record(record, -1), record))
+
+        top_count = len(tree)
+
+        while queue:
+            node, record = queue.popleft()
+            items = record.get('items') or []
+
+            tree._set_children(node, len(tree), len(items))
+
+            for each in items:
+                queue.append((tree._append_record(each, node), each))
+
+        tree._sum_rollups(top_count)
+
+        return tree
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Return a tree with the data of a binary snapshot.
+
+        The arrays are copied in bulk, rather than node by node, and names
+        are only decoded when they are used.
+
+        Args:
+            snapshot (snapshot.Snapshot): Open snapshot.
+
+        Returns:
+            StatusTree
+        """
+
+        tree = cls(
+            StringTable.from_utf8(*snapshot.string_data()),
+            StringTable(snapshot.status_codes)
+        )
+
+        tree.name_ids.frombytes(snapshot.name_ids.cast('B'))
+        tree.parents.frombytes(snapshot.parents.cast('B'))
+        tree.first_child.frombytes(snapshot.first_child.cast('B'))
+        tree.child_count.frombytes(snapshot.child_count.cast('B'))
+        tree.statuses.frombytes(snapshot.statuses.cast('B'))
+        tree.rollup_ids.frombytes(snapshot.rollup_ids.cast('B'))
+
+        tree._rollup_count = snapshot.rollup_count
+
+        for counts in snapshot.rollups:
+            tree.rollups.append(array.array('I'))
+            tree.rollups[-1].frombytes(counts.cast('B'))
+
+        return tree
+
+    def __len__(self):
+        return len(self.name_ids)
+
+    @property
+    def nbytes(self):
+        """Return the size of the arrays of this tree.
+
+        Returns:
+            int: Size, in bytes, excluding the string tables.
+        """
+
+        return sum(
+            each.itemsize * len(each)
+            for each in [
+                self.name_ids,
+                self.parents,
+                self.first_child,
+                self.child_count,
+                self.statuses,
+                self.rollup_ids
+            ] + self.rollups
+        )
+
+    def name(self, node):
+        """Return the name of a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            str
+        """
+
+        return self.strings[self.name_ids[node]]
+
+    def status(self, node):
+        """Return the status code of a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            str: None if the node has no status.
+        """
+
+        return self.status_codes[self.statuses[node]]
+
+    def set_status(self, node, status):
+        """Set the status code of a node.
+
+        The rollups of the parents of a leaf node are updated too.
+
+        Args:
+            node (int): Node id.
+            status (str): Status code, or None.
+        """
+
+        old_id = self.statuses[node]
+        new_id = self.status_codes.intern(status)
+
+        self.statuses[node] = new_id
+
+        if old_id == new_id or self.rollup_ids[node] >= 0:
+            return
+
+        self._ensure_rollup(max(old_id, new_id))
+
+        parent = self.parents[node]
+
+        while parent >= 0:
+            row = self.rollup_ids[parent]
+
+            if old_id:
+                self.rollups[old_id][row] -= 1
+
+            if new_id:
+                self.rollups[new_id][row] += 1
+
+            parent = self.parents[parent]
+
+    def rollup(self, node):
+        """Return the number of leaf nodes with each status, below a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            dict[str, int]: Counts, by status code; a leaf node counts 
+                itself.
+        """
+
+        row = self.rollup_ids[node]
+
+        if row < 0:
+            status = self.status(node)
+            return {} if status is None else {status: 1}
+
+        return {
+            self.status_codes[status_id]: counts[row]
+            for status_id, counts in enumerate(self.rollups)
+            if status_id and counts[row]
+        }
+
+    def children(self, node):
+        """Return the ids of the children of a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            range
+        """
+
+        first = self.first_child[node]
+
+        return range(first, first + self.child_count[node])
+
+    def child_names(self, node):
+        """Return the names of the children of a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            list[str]
+        """
+
+        return [self.strings[self.name_ids[each]] for each in self.children(node)]
+
+    def row(self, node):
+        """Return the row of a node under its parent.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            int: -1 for a top level node; top level rows are up to the owner
+                of the tree.
+        """
+
+        parent = self.parents[node]
+
+        if parent < 0:
+            return -1
+
+        return node - self.first_child[parent]
+
+    def top(self, node):
+        """Return the top level node above a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            int
+        """
+
+        while self.parents[node] >= 0:
+            node = self.parents[node]
+
+        return node
+
+    def path(self, node):
+        """Return the names of a node and its parents.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            tuple[str]: Names, from the top level node down.
+        """
+
+        names = []
+
+        while node >= 0:
+            names.append(self.strings[self.name_ids[node]])
+            node = self.parents[node]
+
+        return tuple(reversed(names))
+
+    def find(self, node, names):
+        """Return the descendant of a node with the given path.
+
+        Args:
+            node (int): Node id.
+            names (iterable[str]): Names of the descendant and its parents,
+                below the node.
+
+        Returns:
+            int: -1 if there is no such descendant.
+        """
+
+        for name in names:
+            name_id = self.strings.get(name)
+
+            for child in self.children(node):
+                if self.name_ids[child] == name_id:
+                    node = child
+                    break
+            else:
+                return -1
+
+        return node
+
+    def add(self, record):
+        """Add a top level record and its descendants to the tree.
+
+        Args:
+            record (dict): Status data, with a 'name', and an optional
+                'status' and list of child records ('items').
+
+        Returns:
+            int: Id of the node of the record.
+        """
+
+        root = self._append_record(record, -1)
+
+        self._append_descendants(root, record.get('items') or [])
+        self._sum_rollups(root + 1)
+
+        return root
+
+    def add_children(self, node, records):
+        """Add children, and their descendants, to a node without children.
+
+        Args:
+            node (int): Node id.
+            records (list[dict]): Status data of the children.
+
+        Raises:
+            ValueError: If the node already has children.
+        """
+
+        if self.child_count[node]:
+            raise ValueError('Node {} already has children'.format(node))
+
+        if not records:
+            return
+
+        # The node is no longer a leaf node, so its parents stop counting it.
+        self._add_to_parents(node, -1)
+
+        first = len(self)
+
+        self._append_descendants(node, records)
+        self._sum_rollups(first)
+
+        self._add_to_parents(node, 1)
+
+    def remove_children(self, node):
+        """Discard the descendants of a node, which becomes a leaf node.
+
+        Args:
+            node (int): Node id.
+        """
+
+        if not self.child_count[node]:
+            return
+
+        self._add_to_parents(node, -1)
+
+        for child in self.children(node):
+            self.discard(child)
+
+        # The rollup row of the node is reclaimed when the tree is compacted.
+        self.child_count[node] = 0
+        self.rollup_ids[node] = -1
+
+        self._add_to_parents(node, 1)
+
+    def to_record(self, node):
+        """Return the status data of a node and its descendants.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            dict
+        """
+
+        record = {'name': self.name(node)}
+
+        status = self.status(node)
+
+        if status is not None:
+            record['status'] = status
+
+        if self.child_count[node]:
+            record['items'] = [self.to_record(each) for each in self.children(node)]
+
+        return record
+
+    def status_changes(self, node, record):
+        """Return the status changes that turn a node into the given record.
+
+        Args:
+            node (int): Node id.
+            record (dict): Status data.
+
+        Returns:
+            list[tuple[int, str]]: Id and new status code of each node whose
+                status changed; None if the names or number of the nodes
+                changed too.
+        """
+
+        changes = []
+        stack = [(node, record)]
+
+        while stack:
+            node, record = stack.pop()
+
+            if self.name(node) != record['name']:
+                return None
+
+            status = record.get('status')
+
+            if self.status(node) != status:
+                changes.append((node, status))
+
+            items = record.get('items') or []
+
+            if len(items) != self.child_count[node]:
+                return None
+
+            stack.extend(zip(self.children(node), items))
+
+        return changes
+
+    def discard(self, node):
+        """Mark a node and its descendants as unused.
+
+        Args:
+            node (int): Node id.
+        """
+
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+            self.garbage += 1
+            stack.extend(self.children(node))
+
+    def compacted(self, roots):
+        """Return a copy of the tree without the discarded nodes.
+
+        Args:
+            roots (iterable[int]): Ids of the top level nodes to keep.
+
+        Returns:
+            tuple[StatusTree, array.array]: New tree, and the id of each
+                node in the new tree, by its id in this tree (-1 for
+                discarded nodes).
+        """
+
+        tree = StatusTree(self.strings, self.status_codes)
+        mapping = array.array('i', [-1]) * len(self)
+
+        for root in roots:
+            mapping[root] = tree._append(
+                self.name_ids[root], -1, self.statuses[root]
+            )
+
+            queue = collections.deque([root])
+
+            while queue:
+                node = queue.popleft()
+                new_node = mapping[node]
+
+                tree._set_children(new_node, len(tree), self.child_count[node])
+
+                row = self.rollup_ids[node]
+
+                if row >= 0:
+                    tree._ensure_rollup(len(self.rollups) - 1)
+                    new_row = tree.rollup_ids[new_node]
+
+                    for counts, new_counts in zip(self.rollups, tree.rollups):
+                        new_counts[new_row] = counts[row]
+
+                for child in self.children(node):
+                    mapping[child] = tree._append(
+                        self.name_ids[child], new_node, self.statuses[child]
+                    )
+
+                queue.extend(self.children(node))
+
+        return tree, mapping
+
+    def _append(self, name_id, parent, status_id):
+        """Add a node without children.
+
+        Args:
+            name_id (int): Id of the node's name.
+            parent (int): Id of the parent node, or -1.
+            status_id (int): Id of the node's status code.
+
+        Returns:
+            int: Id of the new node.
+        """
+
+        self.name_ids.append(name_id)
+        self.parents.append(parent)
+        self.first_child.append(0)
+        self.child_count.append(0)
+        self.statuses.append(status_id)
+        self.rollup_ids.append(-1)
+
+        return len(self.name_ids) - 1
+
+    def _append_record(self, record, parent):
+        """Add a node for a record, without its children.
+
+        Args:
+            record (dict): Status data.
+            parent (int): Id of the parent node, or -1.
+
+        Returns:
+            int: Id of the new node.
+        """
+
+        return self._append(
+            self.strings.intern(record['name']),
+            parent,
+            self.status_codes.intern(record.get('status'))
+        )
+
+    def _append_descendants(self, node, records):
+        """Add the given children of a node, and their descendants.
+
+        The rollups of the new nodes are not added up (see `_sum_rollups`).
+
+        Args:
+            node (int): Id of the parent node, which has no children.
+            records (list[dict]): Status data of the children.
+        """
+
+        # The children of each node are added together, so they are stored
+        # next to each other.
+        queue = collections.deque([(node, records)])
+
+        while queue:
+            node, records = queue.popleft()
+            first = len(self)
+
+            for each in records:
+                self._append_record(each, node)
+
+            self._set_children(node, first, len(records))
+
+            queue.extend(
+                (child, each.get('items') or [])
+                for child, each in zip(range(first, len(self)), records)
+            )
+
+    def _add_to_parents(self, node, sign):
+        """Add the rollup of a node to the rollups of its parents.
+
+        Args:
+            node (int): Node id.
+            sign (int): 1 to add the rollup, or -1 to subtract it.
+        """
+
+        counts = {
+            self.status_codes.get(status): count
+            for status, count in self.rollup(node).items()
+        }
+
+        parent = self.parents[node]
+
+        while parent >= 0:
+            row = self.rollup_ids[parent]
+
+            for status_id, count in counts.items():
+                self.rollups[status_id][row] += sign * count
+
+            parent = self.parents[parent]
+
+    def _sum_rollups(self, first):
+        """Add up the rollups of the nodes from `first` to the last node.
+
+        Args:
+            first (int): Id of the first node that is not a top level node.
+        """
+
+        self._ensure_rollup(len(self.status_codes) - 1)
+
+        # Children are stored after their parents, so going backwards adds
+        # up each rollup before it is added to the rollup of its parent.
+        for node in range(len(self) - 1, first - 1, -1):
+            parent_row = self.rollup_ids[self.parents[node]]
+            row = self.rollup_ids[node]
+
+            if row < 0:
+                status_id = self.statuses[node]
+
+                if status_id:
+                    self.rollups[status_id][parent_row] += 1
+            else:
+                for counts in self.rollups:
+                    counts[parent_row] += counts[row]
+
+    def _set_children(self, node, first, count):
+        """Set the children of a node, and give it a rollup if it has any.
+
+        Args:
+            node (int): Node id.
+            first (int): Id of the first child.
+            count (int): Number of children.
+        """
+
+        self.first_child[node] = first
+        self.child_count[node] = count
+
+        if count:
+            self.rollup_ids[node] = self._rollup_count
+            self._rollup_count += 1
+
+            for counts in self.rollups:
+                counts.append(0)
+
+    def _ensure_rollup(self, status_id):
+        """Make sure there are rollup arrays up to the given status id.
+
+        Args:
+            status_id (int): Status id.
+        """
+
+        while len(self.rollups) <= status_id:
+            self.rollups.append(array.array('I', [0]) * self._rollup_count)
@@ -1,72 +1,924 @@
-import collections
-import json
-import os
-import sys 
-
-from PySide2 import QtCore, QtGui, QtWidgets
-
-
-STATUS_NAMES = {
-    'rdy': 'Ready to Start',
-    'omt': 'Omitted',
-    'wip': 'In Progress',
-    'fin': 'Final'
-}
-
-STATUS_COLORS = {
-    'rdy': QtCore.Qt.white,
-    'omt': QtCore.Qt.darkGray,
-    'wip': QtCore.Qt.yellow,
-    'fin': QtCore.Qt.green
-}
-
-ItemStatus = collections.namedtuple('ItemStatus', 'parent child status')
-
-
-def print_item_status(item_status):
-    print('{parent}:{child} ({status})'.format(**item_status._asdict()))
-
-
-def query_db(filename='data.json'):
-    with open(os.path.join(os.path.dirname(__file__), filename), 'r') as fp:
-        return json.load(fp)
-
-
-class StatusWindow(QtWidgets.QMainWindow):
-    """Window for a tool that displays the status of items."""
-
-    def __init__(self, widget):
-        """Initialize."""
-
-        super(StatusWindow, self).__init__()
-
-        self._status_widget = widget(self)
-        self.setCentralWidget(self._status_widget)
-        self.setFixedWidth(320)
-        self.setFixedHeight(320)
-
-        self._opened = False
-
-    def showEvent(self, event):
-        # Delay "querying" the DB until after the window has opened
-        if not self._opened:
-            self._opened = True 
-            self._handle_window_opened()
-
-        super(StatusWindow, self).showEvent(event)
-
-    def _handle_window_opened(self):
-        """Handle the window opening for the first time."""
-
-        self._status_widget.refresh()
-
-
-def main(widget, window_name):
-    app = QtWidgets.QApplication([])
-    app.setQuitOnLastWindowClosed(True)
-
-    win = StatusWindow(widget)
-    win.setWindowTitle('{} Work Status'.format(window_name))
-    win.show()
-
+import collections
+import difflib
+import functools
+import json
+import os
+import sys 
+import threading
+import time
+
+import cache
+import instrument
+import search
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+
+STATUS_NAMES = {
+    'rdy': 'Ready to Start',
+    'omt': 'Omitted',
+    'wip': 'In Progress',
+    'fin': 'Final'
+}
+
+STATUS_COLORS = {
+    'rdy': QtCore.Qt.white,
+    'omt': QtCore.Qt.darkGray,
+    'wip': QtCore.Qt.yellow,
+    'fin': QtCore.Qt.green
+}
+
+StatusStyle = collections.namedtuple('StatusStyle', 'brush text')
+
+# Items only store their status code; the brush and label for each status
+# are shared by every item with that status (see `StatusDelegate`).
+STATUS_STYLES = {
+    status: StatusStyle(QtGui.QBrush(color), STATUS_NAMES[status])
+    for status, color in STATUS_COLORS.items()
+}
+
+# QStandardItem.setData stores data in this role by default.
+STATUS_ROLE = QtCore.Qt.UserRole + 1
+
+# Column of the status code.
+STATUS_COLUMN = 1
+
+ItemStatus = collections.namedtuple('ItemStatus', 'parent child status')
+
+# Status data is cached until the file it was read from changes.
+QUERY_CACHE = cache.QueryCache()
+
+# Name of the local socket that live status updates are sent to.
+FEED_SERVER_NAME = 'qmodelview_status'
+
+# Backends, by path to their status data.
+_BACKENDS = {}
+_BACKENDS_LOCK = threading.Lock()
+
+
+def print_item_status(item_status):
+    print('{parent}:{child} ({status})'.format(**item_status._asdict()))
+
+
+def diff_rows(old, new, is_sorted=False):
+    """Return the edits that turn the `old` list of row keys into `new`.
+
+    Each edit replaces the rows `old[first:last]` with `new[new_first:new_last]`.
+    The edits are returned last row first, so applying them in order never 
+    shifts the rows of an edit that has yet to be applied.
+
+    Args:
+        old (list): Keys of the current rows. Keys must be unique.
+        new (list): Keys of the new rows. Keys must be unique.
+        is_sorted (bool): If True, both lists are sorted, and they can be
+            diffed in a single pass.
+
+    Returns:
+        list[tuple[int, int, int, int]]: (first, last, new_first, new_last)
+    """
+
+    if old == new:
+        return []
+
+    if not is_sorted:
+        matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+
+        return [
+            (i1, i2, j1, j2) 
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes())
+            if tag != 'equal'
+        ]
+
+    edits = []
+    i = j = 0
+
+    while i < len(old) or j < len(new):
+        if i < len(old) and j < len(new) and old[i] == new[j]:
+            i += 1
+            j += 1
+            continue
+
+        first, new_first = i, j
+
+        while i < len(old) or j < len(new):
+            if i < len(old) and j < len(new):
+                if old[i] == new[j]:
+                    break
+                elif old[i] < new[j]:
+                    i += 1
+                else:
+                    j += 1
+            elif i < len(old):
+                i += 1
+            else:
+                j += 1
+
+        edits.append((first, i, new_first, j))
+
+    return edits[::-1]
+
+
+def changed_rows(old, new):
+    """Return the runs of rows whose values differ between the two lists.
+
+    Args:
+        old (list): Current row values.
+        new (list): New row values, the same length as `old`.
+
+    Returns:
+        list[tuple[int, int]]: (first, last) rows, inclusive.
+    """
+
+    runs = []
+
+    if old == new:
+        return runs
+
+    for row, (a, b) in enumerate(zip(old, new)):
+        if a == b:
+            continue
+
+        if runs and runs[-1][1] == row - 1:
+            runs[-1] = (runs[-1][0], row)
+        else:
+            runs.append((row, row))
+
+    return runs
+
+
+def data_path(filename):
+    """Return the path to the given status data file.
+
+    Args:
+        filename (str): Name of the file, relative to this package.
+
+    Returns:
+        str
+    """
+
+    return os.path.join(os.path.dirname(__file__), filename)
+
+
+def get_backend(filename='data.json'):
+    """Return the backend for the given status data file.
+
+    Backends are shared, so a database keeps its connection pool between 
+    queries.
+
+    Args:
+        filename (str): Name of the status data file (see `data_path`).
+
+    Returns:
+        backends.StatusBackend
+    """
+
+    path = data_path(filename)
+
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(path)
+
+        if backend is None:
+            # Imported here, so the examples start without sqlite3 and mmap.
+            import backends
+
+            backend = _BACKENDS[path] = backends.open_backend(path, QUERY_CACHE)
+
+    return backend
+
+
+@instrument.timed
+def query_db(filename='data.json'):
+    return get_backend(filename).query()
+
+
+def query_children(parent, filename='data.json'):
+    """Return the status data of one top level item.
+
+    Args:
+        parent (str): Name of the top level item.
+        filename (str): Name of the status data file.
+
+    Returns:
+        dict|list[dict]
+    """
+
+    return get_backend(filename).children(parent)
+
+
+def query_record(parent, filename='data.json'):
+    """Return the status data of one top level item, as a nested record.
+
+    Args:
+        parent (str): Name of the top level item.
+        filename (str): Name of the status data file.
+
+    Returns:
+        dict: Nested status data; without children if there is no such
+            item.
+    """
+
+    try:
+        items = query_children(parent, filename)
+    except KeyError:
+        items = []
+
+    if isinstance(items, dict):
+        items = [
+            {'name': child, 'status': status}
+            for child, status in items.items()
+        ]
+
+    return {'name': parent, 'items': items}
+
+
+def query_status(status, filename='data.json'):
+    """Return the items with the given status.
+
+    Args:
+        status (str): Status code.
+        filename (str): Name of the status data file.
+
+    Returns:
+        list[tuple]
+    """
+
+    return get_backend(filename).with_status(status)
+
+
+def iter_query(filename='data.json'):
+    """Yield the top level items of the status data as they are read.
+
+    Args:
+        filename (str): Name of the status data file.
+
+    Yields:
+        object: (name, items) pairs for a dict, or records for a list.
+    """
+
+    for item in get_backend(filename).iter_items():
+        yield item
+
+
+def iter_parents(filename='data.json', full=()):
+    """Yield the top level items of the status data, mostly without children.
+
+    Only the names of the top level items are queried, and the children of
+    the given items.
+
+    Args:
+        filename (str): Name of the status data file.
+        full (set[str]): Names of the top level items to yield with their
+            children (see `query_record`).
+
+    Yields:
+        dict: Nested status data.
+    """
+
+    for name in get_backend(filename).parents():
+        yield query_record(name, filename) if name in full else {'name': name}
+
+
+def group_updates(updates):
+    """Group status updates by top level item.
+
+    Args:
+        updates (dict[tuple[str], str]): Status codes, by the names of each 
+            item and its parents, from the top level down.
+
+    Returns:
+        dict[str, dict[tuple[str], str]]: Status codes, by the rest of the 
+            path of each item, by top level item name.
+    """
+
+    result = {}
+
+    for path, status in updates.items():
+        result.setdefault(path[0], {})[path[1:]] = status
+
+    return result
+
+
+class StatusDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints status items from their status code.
+
+    The status code is read from `STATUS_ROLE` of the status column. Every 
+    column of the row is painted with the status color, and the status 
+    column shows the status name, so the model does not need to store a 
+    brush or label for each item.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize.
+
+        Args:
+            parent (QtCore.QObject): Parent object for this delegate.
+        """
+
+        super(StatusDelegate, self).__init__(parent)
+
+        # Size of each status label, by font.
+        self._label_sizes = {}
+
+        # Lower case search text, whose matches are highlighted.
+        self._highlight = ''
+
+    def set_highlight(self, text):
+        """Highlight the names that match the given search text.
+
+        Names are matched as they are painted, so only the visible items
+        are ever tested.
+
+        Args:
+            text (str): Search text (see `search.matches`), or '' to 
+                highlight nothing.
+        """
+
+        self._highlight = text.lower()
+
+    @staticmethod
+    def status(index):
+        """Return the status code for the row of the given index.
+
+        Args:
+            index (QtCore.QModelIndex): Index of an item.
+
+        Returns:
+            str: None if the row has no status.
+        """
+
+        return index.siblingAtColumn(STATUS_COLUMN).data(STATUS_ROLE)
+
+    def initStyleOption(self, option, index):
+        """Initialize the style option used to paint the given index.
+
+        Args:
+            option (QtWidgets.QStyleOptionViewItem): Option to initialize.
+            index (QtCore.QModelIndex): Index of an item.
+        """
+
+        super(StatusDelegate, self).initStyleOption(option, index)
+
+        if self._highlight and index.column() == 0:
+            if search.matches(option.text, self._highlight):
+                option.font.setBold(True)
+
+        style = STATUS_STYLES.get(self.status(index))
+
+        if style is None:
+            return
+
+        option.backgroundBrush = style.brush
+
+        if index.column() == STATUS_COLUMN:
+            option.text = style.text
+            option.features |= QtWidgets.QStyleOptionViewItem.HasDisplay
+
+    def sizeHint(self, option, index):
+        """Return the size needed to display the given index.
+
+        Args:
+            option (QtWidgets.QStyleOptionViewItem): Style option.
+            index (QtCore.QModelIndex): Index of an item.
+
+        Returns:
+            QtCore.QSize
+        """
+
+        status = self.status(index)
+
+        if index.column() != STATUS_COLUMN or status not in STATUS_STYLES:
+            return super(StatusDelegate, self).sizeHint(option, index)
+
+        font_key = option.font.key()
+        sizes = self._label_sizes.get(font_key)
+
+        if sizes is None:
+            sizes = self._label_sizes[font_key] = self._measure_labels(option)
+
+        return sizes[status]
+
+    @staticmethod
+    def _measure_labels(option):
+        """Return the size of each status label in the option's font.
+
+        Args:
+            option (QtWidgets.QStyleOptionViewItem): Style option.
+
+        Returns:
+            dict[str, QtCore.QSize]
+        """
+
+        metrics = QtGui.QFontMetrics(option.font)
+        widget = option.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+        margin = style.pixelMetric(QtWidgets.QStyle.PM_FocusFrameHMargin) + 1
+
+        return {
+            status: QtCore.QSize(
+                metrics.horizontalAdvance(each.text) + 2 * margin, 
+                metrics.height()
+            )
+            for status, each in STATUS_STYLES.items()
+        }
+
+
+class QueryTask(QtCore.QRunnable):
+    """Queries the status data on a worker thread.
+
+    The data is read with a streaming parser, and sent back in batches as it
+    is read, so the first items can be shown before the whole file is read.
+    """
+
+    # Seconds to collect items for before sending them as a batch.
+    BATCH_INTERVAL = 0.05
+
+    def __init__(self, filename, generation, loaded, failed, full=None):
+        """Initialize.
+
+        Args:
+            filename (str): Name of the status data file.
+            generation (int): Id of the load this task belongs to.
+            loaded (QtCore.SignalInstance): Emitted with the generation, a 
+                batch of top level items, and whether it is the last batch.
+            failed (QtCore.SignalInstance): Emitted with the generation and 
+                an error message if the query fails.
+            full (set[str]): If given, only query the names of the top level
+                items, and the children of these (see `iter_parents`).
+        """
+
+        super(QueryTask, self).__init__()
+
+        self.filename = filename
+        self.generation = generation
+        self.full = full
+        self.cancelled = False
+
+        self._loaded = loaded
+        self._failed = failed
+
+    def run(self):
+        """Run the query."""
+
+        batch = []
+        deadline = time.perf_counter() + self.BATCH_INTERVAL
+
+        if self.full is None:
+            items = iter_query(self.filename)
+        else:
+            items = iter_parents(self.filename, self.full)
+
+        try:
+            for item in items:
+                if self.cancelled:
+                    return
+
+                batch.append(item)
+
+                if time.perf_counter() >= deadline:
+                    self._loaded.emit(self.generation, batch, False)
+
+                    batch = []
+                    deadline = time.perf_counter() + self.BATCH_INTERVAL
+        except Exception as error:
+            if not self.cancelled:
+                self._failed.emit(self.generation, str(error))
+        else:
+            if not self.cancelled:
+                self._loaded.emit(self.generation, batch, True)
+
+
+class StatusLoader(QtCore.QObject):
+    """Loads status data in the background.
+
+    The query runs on a QThreadPool worker, which sends the items back as 
+    they are read. They are handed out in chunks, a few milliseconds' worth 
+    at a time, so the event loop keeps running while a widget is populated. 
+    Starting a new load cancels the previous one.
+
+    A widget is updated with these signals like so:
+
+        loader.Started.connect(widget.begin_update)
+        loader.ChunkReady.connect(widget.update_items)
+        loader.Finished.connect(widget.end_update)
+    """
+
+    Started = QtCore.Signal()
+    ChunkReady = QtCore.Signal(object)
+    Finished = QtCore.Signal()
+    Failed = QtCore.Signal(str)
+
+    _Loaded = QtCore.Signal(int, object, bool)
+    _Failed = QtCore.Signal(int, str)
+
+    # Number of top level items handed out at a time.
+    CHUNK_SIZE = 64
+
+    # Milliseconds of GUI thread time to spend on chunks before yielding
+    # to the event loop.
+    TIME_SLICE = 10
+
+    def __init__(self, filename='data.json', parent=None):
+        """Initialize.
+
+        Args:
+            filename (str): Name of the status data file.
+            parent (QtCore.QObject): Parent object for this loader.
+        """
+
+        super(StatusLoader, self).__init__(parent)
+
+        self.filename = filename
+
+        self._generation = 0
+        self._task = None
+        self._pending = None
+        self._started = False
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._deliver_chunks)
+
+        self._Loaded.connect(self._handle_loaded)
+        self._Failed.connect(self._handle_failed)
+
+    @property
+    def loading(self):
+        """Return True if a load is in progress.
+
+        Returns:
+            bool
+        """
+
+        return self._task is not None or self._pending is not None
+
+    def load(self, full=None):
+        """Start loading the status data, cancelling any load in progress.
+
+        Args:
+            full (set[str]): If given, only load the names of the top level
+                items, and the children of these (see `iter_parents`).
+        """
+
+        self.cancel()
+
+        self._generation += 1
+        self._task = QueryTask(
+            self.filename, self._generation, self._Loaded, self._Failed, full
+        )
+
+        QtCore.QThreadPool.globalInstance().start(self._task)
+
+    def cancel(self):
+        """Cancel the load in progress, if any."""
+
+        if self._task is not None:
+            self._task.cancelled = True
+            self._task = None
+
+        self._pending = None
+        self._started = False
+        self._timer.stop()
+
+    def _handle_loaded(self, generation, items, done):
+        """Handle a worker sending a batch of items.
+
+        Args:
+            generation (int): Id of the load the worker belongs to.
+            items (list): Top level status items.
+            done (bool): If True, this is the last batch.
+        """
+
+        if generation != self._generation or self._task is None:
+            return
+
+        if done:
+            self._task = None
+
+        if self._pending is None:
+            self._pending = collections.deque()
+
+        self._pending.extend(items)
+
+        if not self._started:
+            self._started = True
+            self.Started.emit()
+
+        self._timer.start()
+
+    def _handle_failed(self, generation, message):
+        """Handle a worker failing its query.
+
+        Args:
+            generation (int): Id of the load the worker belongs to.
+            message (str): Error message.
+        """
+
+        if generation != self._generation or self._task is None:
+            return
+
+        self._task = None
+        self.Failed.emit(message)
+
+    def _deliver_chunks(self):
+        """Hand out chunks of the status data until the time slice is up."""
+
+        generation = self._generation
+        deadline = time.perf_counter() + self.TIME_SLICE / 1000.0
+
+        while self._pending:
+            count = min(self.CHUNK_SIZE, len(self._pending))
+            chunk = [self._pending.popleft() for _ in range(count)]
+
+            self.ChunkReady.emit(chunk)
+
+            # A slot may have started a new load.
+            if generation != self._generation:
+                return
+
+            if time.perf_counter() >= deadline:
+                return
+
+        self._timer.stop()
+
+        # Wait for the worker to send more items.
+        if self._task is not None:
+            return
+
+        self._pending = None
+        self._started = False
+        self.Finished.emit()
+
+
+class StatusFeed(QtCore.QObject):
+    """Watches for changes to the status data.
+
+    Changes come from two places: the status data file being rewritten, and
+    a local socket that accepts status updates, one JSON object per line:
+
+        {"path": ["SQ010", "0010"], "status": "wip"}
+
+    Both come in bursts, so they are coalesced. The file is reported once it
+    has stopped changing, and the updates are delivered at most once per
+    frame, with the latest status of each item. Updates that are not valid,
+    including those whose path does not have the number of names the feed
+    expects, are printed and ignored.
+    """
+
+    FileChanged = QtCore.Signal()
+    UpdatesReady = QtCore.Signal(object)
+
+    # Milliseconds between deliveries of status updates, ie, one frame.
+    FRAME_INTERVAL = 16
+
+    # Milliseconds to wait for the file to stop changing.
+    RELOAD_DELAY = 100
+
+    def __init__(
+        self, 
+        filename='data.json', 
+        server_name=FEED_SERVER_NAME, 
+        depth=None, 
+        parent=None
+    ):
+        """Initialize.
+
+        Args:
+            filename (str): Name of the status data file (see `data_path`).
+            server_name (str): Name of the local socket to listen on, or None
+                to only watch the file.
+            depth (int): Number of names in the path of each update, or None
+                for any number.
+            parent (QtCore.QObject): Parent object for this feed.
+        """
+
+        super(StatusFeed, self).__init__(parent)
+
+        self._path = data_path(filename)
+        self._depth = depth
+
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._handle_file_changed)
+
+        if os.path.exists(self._path):
+            self._watcher.addPath(self._path)
+
+        self._reload_timer = QtCore.QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(self.RELOAD_DELAY)
+        self._reload_timer.timeout.connect(self._handle_reload)
+
+        # Latest status code, by item path, since the last delivery.
+        self._pending = {}
+
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FRAME_INTERVAL)
+        self._flush_timer.timeout.connect(self._flush)
+
+        # Imported here, so windows that are not watched start without it.
+        from PySide2 import QtNetwork
+
+        self._server = QtNetwork.QLocalServer(self)
+        self._server.newConnection.connect(self._handle_new_connection)
+
+        if server_name:
+            # Clean up after a window that did not shut down cleanly; the
+            # most recently opened window receives the updates.
+            QtNetwork.QLocalServer.removeServer(server_name)
+
+            if not self._server.listen(server_name):
+                print(
+                    'Cannot listen for status updates on {}: {}'.format(
+                        server_name, self._server.errorString()
+                    ),
+                    file=sys.stderr
+                )
+
+    def _handle_file_changed(self, path):
+        """Handle the status data file changing.
+
+        Args:
+            path (str): Path to the file.
+        """
+
+        self._reload_timer.start()
+
+    def _handle_reload(self):
+        """Handle the status data file no longer changing."""
+
+        # Files that are replaced, rather than written to, are no longer
+        # watched, so watch the new file.
+        if os.path.exists(self._path) and self._path not in self._watcher.files():
+            self._watcher.addPath(self._path)
+
+        self.FileChanged.emit()
+
+    def _handle_new_connection(self):
+        """Handle a status feed connecting."""
+
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            socket.readyRead.connect(functools.partial(self._read_updates, socket))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _read_updates(self, socket):
+        """Read the status updates sent to the given socket.
+
+        Args:
+            socket (QtNetwork.QLocalSocket): Connection to a status feed.
+        """
+
+        while socket.canReadLine():
+            line = socket.readLine().data().decode('utf-8').strip()
+
+            if not line:
+                continue
+
+            try:
+                update = json.loads(line)
+                path = tuple(update['path'])
+                status = update['status']
+
+                if not path or not all(isinstance(name, str) for name in path):
+                    raise ValueError('Invalid path')
+
+                if self._depth is not None and len(path) != self._depth:
+                    raise ValueError(
+                        'Expected a path of {} names'.format(self._depth)
+                    )
+
+                if status not in STATUS_NAMES:
+                    raise ValueError('Invalid status')
+            except (ValueError, KeyError, TypeError) as error:
+                print(
+                    'Ignoring status update {!r}: {}'.format(line, error),
+                    file=sys.stderr
+                )
+                continue
+
+            self._pending[path] = status
+
+        if self._pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Deliver the status updates received since the last delivery."""
+
+        updates, self._pending = self._pending, {}
+
+        if updates:
+            self.UpdatesReady.emit(updates)
+
+
+class StatusWindow(QtWidgets.QMainWindow):
+    """Window for a tool that displays the status of items."""
+
+    def __init__(self, widget, asynchronous=False, watch=False):
+        """Initialize.
+
+        Args:
+            widget (type): Status widget class. The widget must have a 
+                `refresh` method; to be loaded asynchronously, it must also 
+                have a `data_source` attribute and `begin_update`, 
+                `update_items` and `end_update` methods; to be watched, it
+                must have a `data_source` attribute and an `apply_updates`
+                method, and may have an `UPDATE_DEPTH` attribute, the
+                number of names in the path of each update it accepts.
+            asynchronous (bool): If True, load the status data in the 
+                background instead of blocking the window. A widget whose 
+                `lazy` attribute is True loads the data itself, in the 
+                background if its `asynchronous` attribute is set.
+            watch (bool): If True, refresh the status widget when the status
+                data changes (see `StatusFeed`).
+        """
+
+        super(StatusWindow, self).__init__()
+
+        self._status_widget = widget(self)
+        self.setCentralWidget(self._status_widget)
+        self.setFixedWidth(320)
+        self.setFixedHeight(320)
+
+        self._opened = False
+        self._loader = None
+
+        # The loader reads every record; a lazy widget only reads the top
+        # level items (and the subtrees it has loaded), on its own loader.
+        if asynchronous and getattr(self._status_widget, 'lazy', False):
+            self._status_widget.asynchronous = True
+        elif asynchronous:
+            self._loader = StatusLoader(self._status_widget.data_source, self)
+            self._loader.Started.connect(self._status_widget.begin_update)
+            self._loader.ChunkReady.connect(self._status_widget.update_items)
+            self._loader.Finished.connect(self._status_widget.end_update)
+            self._loader.Failed.connect(self._handle_load_failed)
+
+        self._overlay = None
+
+        if instrument.ENABLED:
+            instrument.FirstPaintTimer(self, 'StatusWindow.first_paint')
+
+            self._overlay = instrument.TimingOverlay(self)
+
+            shortcut = QtWidgets.QShortcut(QtGui.QKeySequence('F12'), self)
+            shortcut.activated.connect(self._overlay.toggle)
+
+        self._feed = None
+
+        if watch:
+            self._feed = StatusFeed(
+                self._status_widget.data_source,
+                depth=getattr(self._status_widget, 'UPDATE_DEPTH', None),
+                parent=self
+            )
+            self._feed.FileChanged.connect(self.refresh)
+            self._feed.UpdatesReady.connect(self._status_widget.apply_updates)
+
+    def showEvent(self, event):
+        # Delay "querying" the DB until after the window has opened
+        if not self._opened:
+            self._opened = True 
+            self._handle_window_opened()
+
+        super(StatusWindow, self).showEvent(event)
+
+    def _handle_window_opened(self):
+        """Handle the window opening for the first time."""
+
+        self.refresh()
+
+    def _handle_load_failed(self, message):
+        """Handle the status data failing to load.
+
+        Args:
+            message (str): Error message.
+        """
+
+        self.statusBar().showMessage('Failed to load status: {}'.format(message))
+
+    def refresh(self):
+        """Refresh the status widget."""
+
+        if self._loader is None:
+            self._status_widget.refresh()
+        else:
+            self._loader.load()
+
+
+def main(
+    widget, window_name, asynchronous=True, watch=True, on_first_paint=None
+):
+    app = QtWidgets.QApplication([])
+    app.setQuitOnLastWindowClosed(True)
+
+    win = StatusWindow(widget, asynchronous=asynchronous, watch=watch)
+    win.setWindowTitle('{} Work Status'.format(window_name))
+
+    # Called with the time (see `time.perf_counter`) of the first paint.
+    if on_first_paint is not None:
+        timer = instrument.FirstPaintTimer(win, 'main.first_paint')
+        timer.Painted.connect(on_first_paint)
+
+    win.show()
+
     sys.exit(app.exec_())
\ No newline at end of file
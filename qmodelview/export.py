@@ -0,0 +1,66 @@
+"""Export item statuses to files.
+
+Item statuses are written as they are produced, so exporting a large
+selection never holds more than one record in memory.
+"""
+
+import csv
+import json
+import os
+
+import common
+
+
+def write_csv(fp, item_statuses):
+    """Write item statuses as CSV, with a header row.
+
+    Args:
+        fp (file): File object opened in text mode, with newline=''.
+        item_statuses (iterable[ItemStatus]): Item statuses.
+    """
+
+    writer = csv.writer(fp)
+    writer.writerow(common.ItemStatus._fields)
+    writer.writerows(item_statuses)
+
+
+def write_jsonl(fp, item_statuses):
+    """Write item statuses as JSON lines, one object per item.
+
+    Args:
+        fp (file): File object opened in text mode.
+        item_statuses (iterable[ItemStatus]): Item statuses.
+    """
+
+    fields = common.ItemStatus._fields
+
+    fp.writelines(
+        json.dumps(dict(zip(fields, each))) + '\n' for each in item_statuses
+    )
+
+
+# Writers, by file extension.
+WRITERS = {
+    '.csv': write_csv,
+    '.jsonl': write_jsonl,
+}
+
+
+def export(path, item_statuses):
+    """Write item statuses to a file, in the format of its extension.
+
+    Args:
+        path (str): Path to write to (.csv, .jsonl).
+        item_statuses (iterable[ItemStatus]): Item statuses.
+
+    Raises:
+        ValueError: If the file extension is not supported.
+    """
+
+    writer = WRITERS.get(os.path.splitext(path)[1].lower())
+
+    if writer is None:
+        raise ValueError('Cannot export item statuses to {}'.format(path))
+
+    with open(path, 'w', newline='', encoding='utf-8') as fp:
+        writer(fp, item_statuses)
@@ -0,0 +1,132 @@
+"""Stand-in for a live status feed.
+
+Sends random status changes for the items of a status data file to the
+status examples, which listen for them on a local socket (see
+`common.StatusFeed`).
+
+    python feed.py data2.json --rate 1000 --duration 10
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import backends
+import common
+
+from PySide2 import QtCore, QtNetwork
+
+
+# Seconds between writes to the socket.
+SEND_INTERVAL = 0.01
+
+
+def iter_updates(paths, seed=0):
+    """Yield random status updates.
+
+    Args:
+        paths (list[tuple[str]]): Paths of the items to update.
+        seed (int): Random seed.
+
+    Yields:
+        dict: Status update, as sent to the status examples.
+    """
+
+    rng = random.Random(seed)
+    statuses = sorted(common.STATUS_NAMES)
+
+    while True:
+        yield {'path': rng.choice(paths), 'status': rng.choice(statuses)}
+
+
+def send(updates, rate, duration=None, server_name=common.FEED_SERVER_NAME):
+    """Send status updates to the status examples.
+
+    Args:
+        updates (iterator[dict]): Status updates.
+        rate (float): Number of updates to send per second.
+        duration (float): Number of seconds to send updates for, or None to
+            send them until the examples are closed.
+        server_name (str): Name of the local socket to send to.
+
+    Returns:
+        int: Number of updates sent.
+
+    Raises:
+        RuntimeError: If the status examples can't be reached.
+    """
+
+    socket = QtNetwork.QLocalSocket()
+    socket.connectToServer(server_name)
+
+    if not socket.waitForConnected(1000):
+        raise RuntimeError(
+            'Cannot connect to {}: {}'.format(server_name, socket.errorString())
+        )
+
+    start = time.perf_counter()
+    sent = 0
+
+    while socket.state() == QtNetwork.QLocalSocket.ConnectedState:
+        elapsed = time.perf_counter() - start
+
+        if duration is not None and elapsed >= duration:
+            break
+
+        due = int(elapsed * rate)
+
+        if due > sent:
+            lines = [
+                json.dumps(next(updates)) + '\n' for _ in range(due - sent)
+            ]
+
+            socket.write(''.join(lines).encode('utf-8'))
+            socket.waitForBytesWritten(1000)
+
+            sent = due
+
+        time.sleep(SEND_INTERVAL)
+
+    socket.disconnectFromServer()
+
+    return sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Send live status updates.')
+    parser.add_argument(
+        'filename', nargs='?', default='data.json',
+        help='Status data file whose items are updated'
+    )
+    parser.add_argument(
+        '--rate', type=float, default=100, help='Updates per second'
+    )
+    parser.add_argument(
+        '--duration', type=float, help='Seconds to send updates for'
+    )
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+
+    args = parser.parse_args()
+
+    # The socket needs an application; Qt keeps track of the instance.
+    QtCore.QCoreApplication([])
+
+    paths = [
+        path for path, _ in backends.iter_statuses(common.query_db(args.filename))
+    ]
+
+    try:
+        sent = send(iter_updates(paths, args.seed), args.rate, args.duration)
+    except RuntimeError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+
+    print('Sent {} status updates'.format(sent), file=sys.stderr)
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+"""Timing instrumentation for the status examples.
+
+Records the wall time and number of calls of the hot paths of the examples
+(querying, building the models, expanding the views, first paint).
+Instrumentation is off unless the QMODELVIEW_TIMING environment variable
+is set (to anything but 0); when it is off, `timed` returns the function
+it decorates as it is, so it costs nothing.
+
+    QMODELVIEW_TIMING=1 QMODELVIEW_TIMING_FILE=timing.json python -m qmodelview
+
+The timings are written to QMODELVIEW_TIMING_FILE, if it is set, when the
+process exits; the status windows also show them in an overlay (F12).
+"""
+
+import atexit
+import collections
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+
+ENABLED = os.environ.get('QMODELVIEW_TIMING', '') not in ('', '0')
+
+DUMP_PATH = os.environ.get('QMODELVIEW_TIMING_FILE')
+
+Timing = collections.namedtuple('Timing', 'calls total max')
+
+_TIMINGS = {}
+_TIMINGS_LOCK = threading.Lock()
+
+# Context manager for sections, when instrumentation is off.
+_NULL_SECTION = contextlib.nullcontext()
+
+
+def record(name, elapsed):
+    """Record one call of an instrumented section.
+
+    Args:
+        name (str): Name of the section.
+        elapsed (float): Wall time of the call, in seconds.
+    """
+
+    with _TIMINGS_LOCK:
+        timing = _TIMINGS.get(name)
+
+        if timing is None:
+            _TIMINGS[name] = Timing(1, elapsed, elapsed)
+        else:
+            _TIMINGS[name] = Timing(
+                timing.calls + 1,
+                timing.total + elapsed,
+                max(timing.max, elapsed)
+            )
+
+
+def timed(func):
+    """Decorate a function to record its wall time and calls.
+
+    Args:
+        func (callable): Function to instrument; it is recorded under its
+            module and qualified name.
+
+    Returns:
+        callable: The function itself, if instrumentation is off.
+    """
+
+    if not ENABLED:
+        return func
+
+    name = '{}.{}'.format(func.__module__, func.__qualname__)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def section(name):
+    """Return a context manager that records the wall time of a block.
+
+    Args:
+        name (str): Name of the section.
+
+    Returns:
+        contextlib.AbstractContextManager
+    """
+
+    if not ENABLED:
+        return _NULL_SECTION
+
+    return _section(name)
+
+
+@contextlib.contextmanager
+def _section(name):
+    """Record the wall time of a block.
+
+    Args:
+        name (str): Name of the section.
+    """
+
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def timings():
+    """Return the recorded timings.
+
+    Returns:
+        dict[str, Timing]: Timings, by section name.
+    """
+
+    with _TIMINGS_LOCK:
+        return dict(_TIMINGS)
+
+
+def reset():
+    """Forget the recorded timings."""
+
+    with _TIMINGS_LOCK:
+        _TIMINGS.clear()
+
+
+def to_json():
+    """Return the recorded timings, as JSON data.
+
+    Returns:
+        dict[str, dict]: Calls, and total, mean and max wall time (in
+            seconds) by section name.
+    """
+
+    return {
+        name: {
+            'calls': timing.calls,
+            'total': timing.total,
+            'mean': timing.total / timing.calls,
+            'max': timing.max,
+        }
+        for name, timing in timings().items()
+    }
+
+
+def dump(path):
+    """Write the recorded timings to a JSON file.
+
+    Args:
+        path (str): Path to write to.
+    """
+
+    with open(path, 'w') as fp:
+        json.dump(to_json(), fp, indent=2, sort_keys=True)
+
+
+def format_timings(limit=None):
+    """Return the recorded timings as a table, slowest first.
+
+    Args:
+        limit (int): Maximum number of sections to include.
+
+    Returns:
+        str
+    """
+
+    items = sorted(
+        timings().items(), key=lambda item: item[1].total, reverse=True
+    )
+
+    lines = [
+        '{:>9} {:>6} {:>9}  {}'.format('total ms', 'calls', 'max ms', 'section')
+    ]
+    lines.extend(
+        '{:9.1f} {:6d} {:9.1f}  {}'.format(
+            timing.total * 1000, timing.calls, timing.max * 1000, name
+        )
+        for name, timing in items[:limit]
+    )
+
+    return '\n'.join(lines)
+
+
+class FirstPaintTimer(QtCore.QObject):
+    """Records the time from its creation to the first paint of a widget."""
+
+    # Emitted with the time (see `time.perf_counter`) of the first paint.
+    Painted = QtCore.Signal(float)
+
+    def __init__(self, widget, name):
+        """Initialize.
+
+        Args:
+            widget (QtWidgets.QWidget): Widget to watch.
+            name (str): Name to record the time under.
+        """
+
+        super(FirstPaintTimer, self).__init__(widget)
+
+        self._name = name
+        self._start = time.perf_counter()
+
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QtCore.QEvent.Paint:
+            painted = time.perf_counter()
+
+            record(self._name, painted - self._start)
+            watched.removeEventFilter(self)
+
+            self.Painted.emit(painted)
+
+        return False
+
+
+class TimingOverlay(QtWidgets.QLabel):
+    """Shows the recorded timings on top of a window."""
+
+    # Milliseconds between updates of the overlay.
+    UPDATE_INTERVAL = 500
+
+    # Maximum number of sections shown.
+    MAX_SECTIONS = 12
+
+    def __init__(self, parent):
+        """Initialize.
+
+        Args:
+            parent (QtWidgets.QWidget): Widget to show the overlay on.
+        """
+
+        super(TimingOverlay, self).__init__(parent)
+
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.setFont(
+            QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+        )
+        self.setStyleSheet(
+            'background-color: rgba(0, 0, 0, 180); color: white; padding: 4px;'
+        )
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(self.UPDATE_INTERVAL)
+        self._timer.timeout.connect(self._update_text)
+
+        self.hide()
+
+    def toggle(self):
+        """Show the overlay if it is hidden, or hide it if it is shown."""
+
+        if self.isVisible():
+            self._timer.stop()
+            self.hide()
+        else:
+            self._update_text()
+            self._timer.start()
+            self.show()
+
+    def _update_text(self):
+        """Show the latest timings."""
+
+        self.setText(format_timings(self.MAX_SECTIONS))
+        self.adjustSize()
+        self.move(0, 0)
+        self.raise_()
+
+
+if ENABLED and DUMP_PATH:
+    atexit.register(dump, DUMP_PATH)
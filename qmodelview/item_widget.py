@@ -1,116 +1,236 @@
-"""Tree item/widget example.
-
-This example shows the widget approach to rendering a data in a tree structure. 
-It uses a QTreeWidget and QTreeWidgetItems.
-"""
-
-import os
-import sys 
-
-import common 
-
-from PySide2 import QtCore, QtGui, QtWidgets
-
-
-class StatusWidget(QtWidgets.QTreeWidget):
-    """Widget that displays the status of items."""
-
-    def __init__(self, parent=None):
-        """Initialize.
-        
-        Args:
-            parent (QtWidgets.QWidget): Parent widget for this widget.
-        """
-
-        super(StatusWidget, self).__init__(parent)
-
-        self.setColumnCount(2)
-        self.setHeaderLabels(['Name', 'Status'])
-        self.setSelectionMode(QtWidgets.QTreeWidget.SingleSelection)
-        self.itemSelectionChanged.connect(self._handle_item_selection_handled)
-
-    def refresh(self):
-        """Refresh the list of status items."""
-
-        data = common.query_db()
-        
-        self.clear()
-
-        for name, items in sorted(data.items()):
-            self._create_top_item(name, items, self)
-
-        self.expandAll()
-
-    def _create_top_item(self, name, data, parent):
-        """Create a top level item for the status list.
-
-        Args:
-            name (str): Display name of the top level item.
-            data (list(dict]): Status item data.
-            parent (QtWidgets.QTreeWidget): Parent for the item.
-        """
-
-        top_item = QtWidgets.QTreeWidgetItem(parent)
-        top_item.setFlags(top_item.flags() & ~QtCore.Qt.ItemIsSelectable)
-        top_item.setChildIndicatorPolicy(
-            QtWidgets.QTreeWidgetItem.DontShowIndicatorWhenChildless
-        )
-        top_item.setText(0, name)
-
-        for child, status in sorted(data.items()):
-            self._create_child_item(child, status, top_item)
-
-    def _create_child_item(self, name, status, parent):
-        """Create a child item for the status list.
-
-        Args:
-            name (str): Display name of the child item.
-            status (str): Status code for the child item.
-            parent (QtWidgets.QTreeWidgetItem): Parent for the item.
-        """
-
-        child_item = QtWidgets.QTreeWidgetItem(parent)
-        brush = QtGui.QBrush(common.STATUS_COLORS[status])
-        child_item.setBackground(0, brush)
-        child_item.setBackground(1, brush)
-        child_item.setText(0, name)
-        child_item.setText(1, common.STATUS_NAMES.get(status))
-        child_item.setData(1, QtCore.Qt.UserRole, status)
-        
-    def _handle_item_selection_handled(self):
-        """Handle the user selecting an item in the status list."""
-
-        item, = self.selectedItems() or [None]
-
-        if item is None:
-            return
-
-        item_status = self._item_status(item)
-        common.print_item_status(item_status)
-
-    def _item_status(self, item):
-        """Return the status for the given item.
-
-        Args:
-            item (QtWidgets.QTreeWidgetItem): Status item.
-        
-        Returns:
-            ItemStatus
-        """
-
-        return common.ItemStatus(
-            item.parent().text(0),
-            item.text(0),
-            item.data(1, QtCore.Qt.UserRole)
-        )
-
-
-def main():
-    common.main(
-        widget=StatusWidget,
-        window_name='Item/Widget'
-    )
-
-
-if __name__ == '__main__':
-    main()
+"""Tree item/widget example.
+
+This example shows the widget approach to rendering a data in a tree structure. 
+It uses a QTreeWidget and QTreeWidgetItems.
+"""
+
+import bisect
+import os
+import sys 
+
+import common 
+import instrument
+
+from PySide2 import QtCore, QtWidgets
+
+
+class StatusWidget(QtWidgets.QTreeWidget):
+    """Widget that displays the status of items."""
+
+    data_source = 'data.json'
+
+    # Updates are to a child of a top level item, by parent and child name.
+    UPDATE_DEPTH = 2
+
+    def __init__(self, parent=None):
+        """Initialize.
+        
+        Args:
+            parent (QtWidgets.QWidget): Parent widget for this widget.
+        """
+
+        super(StatusWidget, self).__init__(parent)
+
+        self.setColumnCount(2)
+        self.setHeaderLabels(['Name', 'Status'])
+        self.setSelectionMode(QtWidgets.QTreeWidget.SingleSelection)
+        self.itemSelectionChanged.connect(self._handle_item_selection_handled)
+        self.setItemDelegate(common.StatusDelegate(self))
+
+        # Names of the top level items, and the data they were built from.
+        self._names = []
+        self._data = []
+
+        # Names of the top level items seen during a chunked update.
+        self._seen = None
+
+    @instrument.timed
+    def refresh(self):
+        """Refresh the list of status items."""
+
+        data = common.query_db(self.data_source)
+
+        self.begin_update()
+        self.update_items(sorted(data.items()))
+        self.end_update()
+
+    def begin_update(self):
+        """Begin updating the list of status items in chunks.
+
+        Top level items that are not updated before `end_update` is called
+        are removed from the list.
+        """
+
+        self._seen = set()
+
+    def update_items(self, items):
+        """Insert/update a chunk of top level items.
+
+        Args:
+            items (iterable[tuple[str, dict]]): Top level item names and 
+                their status codes, by child name.
+        """
+
+        for name, data in items:
+            row = bisect.bisect_left(self._names, name)
+
+            if row < len(self._names) and self._names[row] == name:
+                if data != self._data[row]:
+                    self._update_child_items(
+                        self.topLevelItem(row), self._data[row], data
+                    )
+                    self._data[row] = data
+            else:
+                self.insertTopLevelItem(row, self._create_top_item(name, data))
+                self.topLevelItem(row).setExpanded(True)
+                self._names.insert(row, name)
+                self._data.insert(row, data)
+
+            if self._seen is not None:
+                self._seen.add(name)
+
+    def end_update(self):
+        """Finish updating the list of status items in chunks."""
+
+        if self._seen is None:
+            return
+
+        seen, self._seen = self._seen, None
+
+        for row in reversed(range(len(self._names))):
+            if self._names[row] not in seen:
+                self.takeTopLevelItem(row)
+                del self._names[row]
+                del self._data[row]
+
+    def apply_updates(self, updates):
+        """Update the status of individual items.
+
+        Args:
+            updates (dict[tuple[str, str], str]): Status codes, by parent and
+                child name.
+        """
+
+        items = []
+
+        for name, statuses in sorted(common.group_updates(updates).items()):
+            row = bisect.bisect_left(self._names, name)
+            exists = row < len(self._names) and self._names[row] == name
+
+            # The data may be shared with the query cache, so it is copied.
+            data = dict(self._data[row]) if exists else {}
+            data.update((path[0], status) for path, status in statuses.items())
+
+            items.append((name, data))
+
+        self.update_items(items)
+
+    @instrument.timed
+    def _create_top_item(self, name, data):
+        """Create a top level item for the status list.
+
+        Args:
+            name (str): Display name of the top level item.
+            data (dict[str, str]): Status codes, by child name.
+
+        Returns:
+            QtWidgets.QTreeWidgetItem
+        """
+
+        top_item = QtWidgets.QTreeWidgetItem()
+        top_item.setFlags(top_item.flags() & ~QtCore.Qt.ItemIsSelectable)
+        top_item.setChildIndicatorPolicy(
+            QtWidgets.QTreeWidgetItem.DontShowIndicatorWhenChildless
+        )
+        top_item.setText(0, name)
+
+        self._create_child_items(data, top_item)
+
+        return top_item
+
+    @instrument.timed
+    def _create_child_items(self, data, parent):
+        """Create the child items for a top level item.
+
+        Args:
+            data (dict[str, str]): Status codes, by child name.
+            parent (QtWidgets.QTreeWidgetItem): Parent for the items.
+        """
+
+        for child, status in sorted(data.items()):
+            self._create_child_item(child, status, parent)
+
+    def _update_child_items(self, parent, old, new):
+        """Update the child items of a top level item.
+
+        Args:
+            parent (QtWidgets.QTreeWidgetItem): Top level item.
+            old (dict[str, str]): Status codes the items were built from.
+            new (dict[str, str]): Status codes to update the items to.
+        """
+
+        if old.keys() != new.keys():
+            # Items are cheap to rebuild, compared to a model.
+            parent.takeChildren()
+            self._create_child_items(new, parent)
+            return
+
+        # Only the statuses changed, so the items are updated in place.
+        for row, child in enumerate(sorted(new)):
+            if new[child] != old[child]:
+                parent.child(row).setData(
+                    common.STATUS_COLUMN, common.STATUS_ROLE, new[child]
+                )
+
+    def _create_child_item(self, name, status, parent):
+        """Create a child item for the status list.
+
+        Args:
+            name (str): Display name of the child item.
+            status (str): Status code for the child item.
+            parent (QtWidgets.QTreeWidgetItem): Parent for the item.
+        """
+
+        # The delegate paints the color and name of the status.
+        child_item = QtWidgets.QTreeWidgetItem(parent)
+        child_item.setText(0, name)
+        child_item.setData(common.STATUS_COLUMN, common.STATUS_ROLE, status)
+        
+    def _handle_item_selection_handled(self):
+        """Handle the user selecting an item in the status list."""
+
+        item, = self.selectedItems() or [None]
+
+        if item is None:
+            return
+
+        item_status = self._item_status(item)
+        common.print_item_status(item_status)
+
+    def _item_status(self, item):
+        """Return the status for the given item.
+
+        Args:
+            item (QtWidgets.QTreeWidgetItem): Status item.
+        
+        Returns:
+            ItemStatus
+        """
+
+        return common.ItemStatus(
+            item.parent().text(0),
+            item.text(0),
+            item.data(common.STATUS_COLUMN, common.STATUS_ROLE)
+        )
+
+
+def main(**kwargs):
+    common.main(
+        widget=StatusWidget,
+        window_name='Item/Widget',
+        **kwargs
+    )
+
+
+if __name__ == '__main__':
+    main()
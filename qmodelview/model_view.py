@@ -1,175 +1,1089 @@
-"""Tree model/view example.
-
-This example shows the model/view to rendering a data in a tree structure. 
-It uses a QTreeView and QStandardItemModel
-"""
-
-import os
-import sys 
-
-import common 
-
-from PySide2 import QtCore, QtGui, QtWidgets
-
-
-class StatusView(QtWidgets.QTreeView):
-    """View that displays the status of items."""
-
-    def __init__(self, parent=None):
-        """Initialize.
-        
-        Args:
-            parent (QtWidgets.QWidget): Parent widget for this widget.
-        """
-
-        super(StatusView, self).__init__(parent)
-
-        self.setSelectionMode(QtWidgets.QTreeView.SingleSelection)
-        self.setEditTriggers(QtWidgets.QTreeView.NoEditTriggers)
-        self.setModel(StatusModel())
-
-    @property
-    def selected_index(self):
-        """Return the index of the selected item.
-        
-        Returns:
-            QtCore.QModelIndex
-        """
-
-        return (self.selectedIndexes() or [QtCore.QModelIndex()])[0]
-
-    def refresh(self):
-        """Refresh the status view."""
-
-        self.model().refresh()
-
-        self.expandAll()
-        self.setItemsExpandable(False)
-
-        for row in self.model().rows:
-            self.setFirstColumnSpanned(row, QtCore.QModelIndex(), True)
-
-    def selectionChanged(self, selected, deselected):
-        """Handle the user selecting an item in the status view."""
-
-        try:
-            item_status = self.model()[self.selected_index]
-        except IndexError:
-            pass
-        else:
-            common.print_item_status(item_status)
-
-
-class StatusModel(QtGui.QStandardItemModel):
-    """Provides access to the status of items."""
-
-    @property 
-    def rows(self):
-        """Return the row indices for this model.
-        
-        Returns:
-            iterable[int]
-        """
-
-        return range(self.rowCount())
-
-    def __getitem__(self, index):
-        """Return the status for the item at the given index.
-
-        Args:
-            index (QtCore.QModelIndex): Index of an item.
-        
-        Returns:
-            ItemStatus
-
-        Raises:
-            IndexError: If the index is invalid.
-        """
-
-        if not index.isValid():
-            raise IndexError()
-
-        if not index.parent().isValid():
-            raise IndexError()
-
-        return common.ItemStatus(
-            self.itemFromIndex(index.siblingAtColumn(0)).text(),
-            self.itemFromIndex(index.parent()).text(),
-            self.itemFromIndex(index.siblingAtColumn(1)).data(),
-        )
-
-    def flags(self, index):
-        """Return the flags for the item at the given index.
-
-        Args:
-            index (QtCore.QModelIndex): Index of an item.
-        
-        Returns:
-            QtCore.Qt.ItemFlags
-        """
-
-        result = super(StatusModel, self).flags(index)
-
-        is_top_level_item = index.isValid() and not index.parent().isValid()
-
-        if is_top_level_item:
-            result &= ~QtCore.Qt.ItemIsSelectable
-
-        return result 
-
-    def refresh(self):
-        """Refresh the list of status items in this model."""
-
-        data = common.query_db()
-
-        self.clear()
-        self.setHorizontalHeaderLabels(['Name', 'Status'])
-
-        for name, items in sorted(data.items()):
-            self._create_top_item(name, items, self)
-
-    def _create_top_item(self, name, data, parent):
-        """Create a top level item for the status list.
-
-        Args:
-            name (str): Display name of the top level item.
-            data (list(dict]): Status item data.
-            parent (QtGui.QStandardItemModel): Parent for the item.
-        """
-
-        top_item = QtGui.QStandardItem(name)
-
-        for child, status in sorted(data.items()):
-            self._create_child_items(child, status, top_item)
-        
-        parent.appendRow(top_item)
-
-    def _create_child_items(self, name, status, parent):
-        """Create a child item for the status list.
-
-        Args:
-            name (str): Display name of the child item.
-            status (str): Status code for the child item.
-            parent (QtGui.QStandardItem): Parent for the item.
-        """
-
-        child_item = QtGui.QStandardItem(name)
-        status_item = QtGui.QStandardItem(common.STATUS_NAMES.get(status))
-        status_item.setData(status)
-
-        brush = QtGui.QBrush(common.STATUS_COLORS[status])
-        child_item.setBackground(brush)
-        status_item.setBackground(brush)
-
-        parent.appendRow([child_item, status_item])
-
-
-def main():
-    common.main(
-        widget=StatusView,
-        window_name='Model/View'
-    )
-
-
-if __name__ == '__main__':
-    main()
+"""Tree model/view example.
+
+This example shows the model/view to rendering a data in a tree structure. 
+It uses a QTreeView and a custom QAbstractItemModel.
+"""
+
+import bisect
+import os
+import sys 
+
+import common 
+import export
+import instrument
+import search
+
+from PySide2 import QtCore, QtWidgets
+
+
+class StatusView(QtWidgets.QTreeView):
+    """View that displays the status of items."""
+
+    # Expand every top level row, or only the rows in or near the viewport.
+    EXPAND_ALL = 'all'
+    EXPAND_VISIBLE = 'visible'
+
+    # Number of viewport heights below the viewport to expand in advance.
+    EXPAND_MARGIN = 1
+
+    # File types the selection can be exported to.
+    EXPORT_FILTER = 'CSV (*.csv);;JSON Lines (*.jsonl)'
+
+    def __init__(self, parent=None, expand_mode=EXPAND_VISIBLE):
+        """Initialize.
+        
+        Args:
+            parent (QtWidgets.QWidget): Parent widget for this widget.
+            expand_mode (str): EXPAND_ALL or EXPAND_VISIBLE.
+        """
+
+        super(StatusView, self).__init__(parent)
+
+        self.setSelectionMode(QtWidgets.QTreeView.ExtendedSelection)
+        self.setEditTriggers(QtWidgets.QTreeView.NoEditTriggers)
+        self.setItemsExpandable(False)
+        self.setUniformRowHeights(True)
+        self.setItemDelegate(common.StatusDelegate(self))
+        self.setModel(StatusModel())
+
+        self._expand_mode = expand_mode
+
+        # Top level rows inserted since they were last expanded/spanned
+        # (EXPAND_ALL only; EXPAND_VISIBLE looks at the viewport instead).
+        self._new_rows = []
+        self.model().rowsInserted.connect(self._handle_rows_inserted)
+
+        # Scrolling and resizing can bring collapsed rows into view; the
+        # expansion is deferred to the event loop, so a burst of scroll
+        # events only expands the rows once.
+        self._expand_timer = QtCore.QTimer(self)
+        self._expand_timer.setSingleShot(True)
+        self._expand_timer.timeout.connect(self._expand_rows)
+
+        self.verticalScrollBar().valueChanged.connect(self._schedule_expand)
+
+    @property
+    def data_source(self):
+        """Return the name of the status data file.
+
+        Returns:
+            str
+        """
+
+        return self.model().data_source
+
+    @data_source.setter
+    def data_source(self, value):
+        self.model().data_source = value
+
+    @property
+    def expand_mode(self):
+        """Return which top level rows are expanded and spanned.
+
+        Returns:
+            str: EXPAND_ALL or EXPAND_VISIBLE.
+        """
+
+        return self._expand_mode
+
+    @expand_mode.setter
+    def expand_mode(self, value):
+        self._expand_mode = value
+
+        if value == self.EXPAND_ALL:
+            root = QtCore.QModelIndex()
+
+            self._new_rows = [
+                QtCore.QPersistentModelIndex(self.model().index(row, 0))
+                for row in range(self.model().rowCount(root))
+            ]
+
+        self._expand_rows()
+
+    @property
+    def selected_index(self):
+        """Return the index of the selected item.
+        
+        Returns:
+            QtCore.QModelIndex
+        """
+
+        return (self.selectedIndexes() or [QtCore.QModelIndex()])[0]
+
+    def selected_statuses(self):
+        """Return the status of each selected item, as they are read.
+
+        Returns:
+            iterator[ItemStatus]
+        """
+
+        return self.model().iter_statuses(self.selectionModel().selection())
+
+    def find(self, text):
+        """Highlight the items whose names match the given text, and show 
+        the first of them.
+
+        Args:
+            text (str): Text to search for (see `search.NameIndex`).
+
+        Returns:
+            int: Number of matching items.
+        """
+
+        self.itemDelegate().set_highlight(text)
+        self.viewport().update()
+
+        paths = self.model().search(text)
+
+        if not paths:
+            return 0
+
+        path = min(paths)
+        model = self.model()
+
+        # A child item is only in the model once its parent is fetched, and
+        # expanding the parent does not fetch it until the view is laid out.
+        if len(path) > 1:
+            parent = model.index_of(path[:1])
+
+            while model.canFetchMore(parent):
+                model.fetchMore(parent)
+
+            self._expand_row(parent.row())
+
+        index = model.index_of(path)
+
+        self.scrollTo(index, QtWidgets.QTreeView.PositionAtCenter)
+        self.selectionModel().setCurrentIndex(
+            index, QtCore.QItemSelectionModel.NoUpdate
+        )
+
+        return len(paths)
+
+    def export_selection(self, path):
+        """Write the status of the selected items to a file.
+
+        Args:
+            path (str): Path to write to (see `export.WRITERS`).
+        """
+
+        export.export(path, self.selected_statuses())
+
+    def refresh(self):
+        """Refresh the status view."""
+
+        self.model().refresh()
+        self._expand_rows()
+
+    def begin_update(self):
+        """Begin updating the status view in chunks."""
+
+        self.model().begin_update()
+
+    def update_items(self, items):
+        """Update a chunk of the top level items in the status view.
+
+        Args:
+            items (list[tuple[str, dict]]): Top level item names and data.
+        """
+
+        self.model().update_items(items)
+        self._expand_rows()
+
+    def end_update(self):
+        """Finish updating the status view in chunks."""
+
+        self.model().end_update()
+
+    def apply_updates(self, updates):
+        """Update the status of individual items in the status view.
+
+        Args:
+            updates (dict[tuple[str, str], str]): Status codes, by parent and
+                child name.
+        """
+
+        self.model().apply_updates(updates)
+        self._expand_rows()
+
+    def _handle_rows_inserted(self, parent, first, last):
+        """Handle rows being inserted into the model.
+
+        The rows are expanded after the model update is done, rather than
+        in the middle of it.
+        """
+
+        if parent.isValid():
+            return
+
+        if self._expand_mode != self.EXPAND_ALL:
+            self._schedule_expand()
+            return
+
+        self._new_rows.extend(
+            QtCore.QPersistentModelIndex(self.model().index(row, 0))
+            for row in range(first, last + 1)
+        )
+
+    def _schedule_expand(self, *args):
+        """Expand the rows in or near the viewport, once control returns to
+        the event loop.
+        """
+
+        if self._expand_mode == self.EXPAND_VISIBLE:
+            self._expand_timer.start()
+
+    @instrument.timed
+    def _expand_rows(self):
+        """Expand and span the top level rows, as per the expand mode.
+
+        Painting is suspended until all of the rows are done, so the view is
+        laid out and repainted once, rather than once per row.
+        """
+
+        self._expand_timer.stop()
+        self.setUpdatesEnabled(False)
+
+        try:
+            if self._expand_mode == self.EXPAND_ALL:
+                self._expand_new_rows()
+            else:
+                self._expand_visible_rows()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _expand_new_rows(self):
+        """Expand and span the top level rows inserted by the last update."""
+
+        for index in self._new_rows:
+            if index.isValid():
+                self._expand_row(index.row())
+
+        self._new_rows = []
+
+    def _expand_visible_rows(self):
+        """Expand and span the top level rows in or near the viewport.
+
+        Rows further down are left collapsed until they are scrolled into
+        view, so the cost of an update does not grow with the size of the
+        tree. Rows are only expanded below the top of the viewport, so the
+        rows that are already visible do not move.
+        """
+
+        model = self.model()
+        row_count = model.rowCount(QtCore.QModelIndex())
+
+        if not row_count:
+            return
+
+        index = self.indexAt(QtCore.QPoint(0, 0))
+
+        if not index.isValid():
+            row = 0
+        else:
+            while index.parent().isValid():
+                index = index.parent()
+
+            row = index.row()
+
+        limit = self.viewport().height() * (1 + self.EXPAND_MARGIN)
+
+        while row < row_count:
+            if self.visualRect(model.index(row, 0)).top() > limit:
+                break
+
+            self._expand_row(row)
+            row += 1
+
+    def _expand_row(self, row):
+        """Expand and span a top level row, if it isn't already.
+
+        Args:
+            row (int): Top level row.
+        """
+
+        index = self.model().index(row, 0)
+
+        if not self.isExpanded(index):
+            self.setFirstColumnSpanned(row, QtCore.QModelIndex(), True)
+            self.expand(index)
+
+    def resizeEvent(self, event):
+        """Expand the rows brought into view by resizing the view."""
+
+        super(StatusView, self).resizeEvent(event)
+        self._schedule_expand()
+
+    def contextMenuEvent(self, event):
+        """Show the actions for the selected items."""
+
+        menu = QtWidgets.QMenu(self)
+
+        action = menu.addAction('Export Selection...')
+        action.setEnabled(self.selectionModel().hasSelection())
+        action.triggered.connect(self._handle_export_triggered)
+
+        menu.exec_(event.globalPos())
+
+    def _handle_export_triggered(self):
+        """Handle the user asking to export the selected items."""
+
+        path, selected_filter = QtWidgets.QFileDialog.getSaveFileName(
+            self, 'Export Selection', '', self.EXPORT_FILTER
+        )
+
+        if not path:
+            return
+
+        # Names typed without an extension get the one of the chosen filter.
+        if os.path.splitext(path)[1].lower() not in export.WRITERS:
+            extension = selected_filter.partition('(*')[2].rstrip(')')
+            path += extension or '.csv'
+
+        try:
+            self.export_selection(path)
+        except (ValueError, OSError) as error:
+            QtWidgets.QMessageBox.warning(self, 'Export Selection', str(error))
+
+    def selectionChanged(self, selected, deselected):
+        """Handle the user selecting items in the status view."""
+
+        super(StatusView, self).selectionChanged(selected, deselected)
+
+        # Only the first newly selected item is printed, so selecting a 
+        # large range of items does not print every one of them.
+        item_status = next(self.model().iter_statuses(selected), None)
+
+        if item_status is not None:
+            common.print_item_status(item_status)
+
+
+class StatusWidget(QtWidgets.QWidget):
+    """Widget that displays the status of items, with a search box."""
+
+    # Updates are to a child of a top level item, by parent and child name.
+    UPDATE_DEPTH = 2
+
+    def __init__(self, parent=None):
+        """Initialize.
+
+        Args:
+            parent (QtWidgets.QWidget): Parent widget for this widget.
+        """
+
+        super(StatusWidget, self).__init__(parent)
+
+        # The search runs on every key press; the name index keeps it fast 
+        # enough that it does not need to wait for the user to stop typing.
+        self.search_box = QtWidgets.QLineEdit(self)
+        self.search_box.setPlaceholderText('Search')
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.textChanged.connect(self._handle_search_changed)
+
+        self.status_view = StatusView(self)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.search_box)
+        layout.addWidget(self.status_view)
+
+    @property
+    def data_source(self):
+        """Return the name of the status data file.
+
+        Returns:
+            str
+        """
+
+        return self.status_view.data_source
+
+    @data_source.setter
+    def data_source(self, value):
+        self.status_view.data_source = value
+
+    def refresh(self):
+        """Refresh the status view."""
+
+        self.status_view.refresh()
+
+    def begin_update(self):
+        """Begin updating the status view in chunks."""
+
+        self.status_view.begin_update()
+
+    def update_items(self, items):
+        """Update a chunk of the top level items in the status view.
+
+        Args:
+            items (list[tuple[str, dict]]): Top level item names and data.
+        """
+
+        self.status_view.update_items(items)
+
+    def end_update(self):
+        """Finish updating the status view in chunks."""
+
+        self.status_view.end_update()
+
+    def apply_updates(self, updates):
+        """Update the status of individual items in the status view.
+
+        Args:
+            updates (dict[tuple[str, str], str]): Status codes, by parent and
+                child name.
+        """
+
+        self.status_view.apply_updates(updates)
+
+    def _handle_search_changed(self, text):
+        """Handle the user editing the search text.
+
+        Args:
+            text (str): Search text.
+        """
+
+        self.status_view.find(text)
+
+
+class StatusModel(QtCore.QAbstractItemModel):
+    """Provides access to the status of items.
+
+    Unlike a QStandardItemModel, this model does not create an item for each
+    cell. The status data is kept in plain lists, and the model answers the 
+    view's questions (how many rows? what text?) straight from those lists.
+
+    The children of a top level row are only exposed to the views when they 
+    are needed, ie, when the row is expanded (see `canFetchMore`).
+
+    Refreshing the model compares the new status data against the current
+    rows, and only inserts/removes/updates the rows that changed, so the 
+    views keep their selection, expansion and scroll position.
+    """
+
+    HEADER_LABELS = ['Name', 'Status']
+
+    data_source = 'data.json'
+
+    def __init__(self, parent=None):
+        """Initialize.
+
+        Args:
+            parent (QtCore.QObject): Parent object for this model.
+        """
+
+        super(StatusModel, self).__init__(parent)
+
+        # Each top level row has a name, the (sorted) names of its children,
+        # the status codes of its children, a flag for whether its children
+        # have been exposed to the views, and the data it was built from.
+        self._names = []
+        self._children = []
+        self._statuses = []
+        self._exposed = []
+        self._data = []
+
+        # Child indices store an id for their parent, rather than its row, 
+        # because the row of a parent changes when rows are inserted/removed
+        # above it. Ids start at 1; an id of 0 marks a top level index.
+        self._ids = []
+        self._id_rows = {}
+        self._next_id = 1
+
+        # Names of the top level items seen during a chunked update.
+        self._seen = None
+
+        # Names of every item, for searching.
+        self._name_index = search.NameIndex()
+
+    @property 
+    def rows(self):
+        """Return the row indices for this model.
+        
+        Returns:
+            iterable[int]
+        """
+
+        return range(self.rowCount())
+
+    def __getitem__(self, index):
+        """Return the status for the item at the given index.
+
+        Args:
+            index (QtCore.QModelIndex): Index of an item.
+        
+        Returns:
+            ItemStatus
+
+        Raises:
+            IndexError: If the index is invalid.
+        """
+
+        if not index.isValid():
+            raise IndexError()
+
+        parent_row = self._parent_row(index)
+
+        if parent_row < 0:
+            raise IndexError()
+
+        return common.ItemStatus(
+            self._names[parent_row],
+            self._children[parent_row][index.row()],
+            self._statuses[parent_row][index.row()],
+        )
+
+    def iter_statuses(self, selection):
+        """Yield the status of each item in a selection.
+
+        Each selection range is resolved to its parent once, and its items 
+        are read straight from the lists of the parent, so no index is 
+        created per item.
+
+        Args:
+            selection (QtCore.QItemSelection): Selected items.
+
+        Yields:
+            ItemStatus
+        """
+
+        # Ranges may overlap, so the rows of each parent are merged first.
+        rows = {}
+
+        for selection_range in selection:
+            parent_row = self._parent_row(selection_range.topLeft())
+
+            # Top level items have no status.
+            if parent_row < 0:
+                continue
+
+            rows.setdefault(parent_row, []).append(
+                (selection_range.top(), selection_range.bottom() + 1)
+            )
+
+        for parent_row in sorted(rows):
+            parent = self._names[parent_row]
+            children = self._children[parent_row]
+            statuses = self._statuses[parent_row]
+
+            for start, end in self._merged_ranges(rows[parent_row]):
+                for child, status in zip(children[start:end], statuses[start:end]):
+                    yield common.ItemStatus(parent, child, status)
+
+    @staticmethod
+    def _merged_ranges(ranges):
+        """Return the given ranges of rows, sorted, with overlaps merged.
+
+        Args:
+            ranges (list[tuple[int, int]]): Start and end (exclusive) rows.
+
+        Returns:
+            list[tuple[int, int]]
+        """
+
+        result = []
+
+        for start, end in sorted(ranges):
+            if result and start <= result[-1][1]:
+                result[-1] = (result[-1][0], max(result[-1][1], end))
+            else:
+                result.append((start, end))
+
+        return result
+
+    def search(self, text):
+        """Return the items whose names match the given text.
+
+        Args:
+            text (str): Text to search for (see `search.NameIndex`).
+
+        Returns:
+            set[tuple[str]]: Parent and child name of each matching child
+                item, and the name of each matching top level item.
+        """
+
+        return self._name_index.search(text)
+
+    def index_of(self, path):
+        """Return the index of the item with the given path.
+
+        Args:
+            path (tuple[str]): Name of a top level item, and optionally the
+                name of one of its children.
+
+        Returns:
+            QtCore.QModelIndex: Invalid if there is no such item, or it has
+                not been fetched (see `fetchMore`).
+        """
+
+        row = bisect.bisect_left(self._names, path[0])
+
+        if row == len(self._names) or self._names[row] != path[0]:
+            return QtCore.QModelIndex()
+
+        parent = self.index(row, 0)
+
+        if len(path) == 1:
+            return parent
+
+        children = self._children[row]
+        child_row = bisect.bisect_left(children, path[1])
+
+        if child_row == len(children) or children[child_row] != path[1]:
+            return QtCore.QModelIndex()
+
+        return self.index(child_row, 0, parent)
+
+    def _parent_row(self, index):
+        """Return the row of the parent of the given index.
+
+        Top level indices have an internal id of 0; child indices store the
+        id of their parent.
+
+        Args:
+            index (QtCore.QModelIndex): Index of an item.
+
+        Returns:
+            int: -1 if the index is a top level index.
+        """
+
+        parent_id = index.internalId()
+
+        if not parent_id:
+            return -1
+
+        if self._id_rows is None:
+            self._id_rows = {each: row for row, each in enumerate(self._ids)}
+
+        return self._id_rows[parent_id]
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """Return the index of the item at the given row/column.
+
+        Args:
+            row (int): Row of the item.
+            column (int): Column of the item.
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            QtCore.QModelIndex
+        """
+
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+
+        if parent.isValid():
+            return self.createIndex(row, column, self._ids[parent.row()])
+
+        return self.createIndex(row, column, 0)
+
+    def parent(self, index):
+        """Return the index of the parent of the given item.
+
+        Args:
+            index (QtCore.QModelIndex): Index of an item.
+
+        Returns:
+            QtCore.QModelIndex
+        """
+
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        parent_row = self._parent_row(index)
+
+        if parent_row < 0:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(parent_row, 0, 0)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return the number of rows under the given parent.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            int
+        """
+
+        if not parent.isValid():
+            return len(self._names)
+
+        if parent.column() == 0 and self._parent_row(parent) < 0:
+            row = parent.row()
+
+            return len(self._children[row]) if self._exposed[row] else 0
+
+        return 0
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return the number of columns under the given parent.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            int
+        """
+
+        return len(self.HEADER_LABELS)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        """Return True if the given parent has children.
+
+        This must be answered without fetching the children, so the views 
+        know to draw an expand arrow for the parent.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            bool
+        """
+
+        if not parent.isValid():
+            return bool(self._names)
+
+        if parent.column() == 0 and self._parent_row(parent) < 0:
+            return bool(self._children[parent.row()])
+
+        return False
+
+    def canFetchMore(self, parent):
+        """Return True if the given parent has children not yet exposed.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            bool
+        """
+
+        if not parent.isValid() or self._parent_row(parent) >= 0:
+            return False
+
+        row = parent.row()
+
+        return not self._exposed[row] and bool(self._children[row])
+
+    def fetchMore(self, parent):
+        """Expose the children of the given parent to the views.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+        """
+
+        if not self.canFetchMore(parent):
+            return
+
+        row = parent.row()
+
+        self.beginInsertRows(parent, 0, len(self._children[row]) - 1)
+        self._exposed[row] = True
+        self.endInsertRows()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """Return the data for the item at the given index.
+
+        Args:
+            index (QtCore.QModelIndex): Index of an item.
+            role (int): Data role to return.
+
+        Returns:
+            object
+        """
+
+        if not index.isValid():
+            return None
+
+        parent_row = self._parent_row(index)
+
+        if parent_row < 0:
+            if role == QtCore.Qt.DisplayRole and index.column() == 0:
+                return self._names[index.row()]
+
+            return None
+
+        # The delegate paints the color and name of the status.
+        if role == QtCore.Qt.DisplayRole and index.column() == 0:
+            return self._children[parent_row][index.row()]
+
+        if role == common.STATUS_ROLE and index.column() == common.STATUS_COLUMN:
+            return self._statuses[parent_row][index.row()]
+
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """Return the header data for the given section.
+
+        Args:
+            section (int): Header section.
+            orientation (QtCore.Qt.Orientation): Header orientation.
+            role (int): Data role to return.
+
+        Returns:
+            object
+        """
+
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADER_LABELS[section]
+
+        return None
+
+    def flags(self, index):
+        """Return the flags for the item at the given index.
+
+        Args:
+            index (QtCore.QModelIndex): Index of an item.
+        
+        Returns:
+            QtCore.Qt.ItemFlags
+        """
+
+        result = super(StatusModel, self).flags(index)
+
+        is_top_level_item = index.isValid() and not index.parent().isValid()
+
+        if is_top_level_item:
+            result &= ~QtCore.Qt.ItemIsSelectable
+
+        return result 
+
+    @instrument.timed
+    def refresh(self):
+        """Refresh the list of status items in this model."""
+
+        data = common.query_db(self.data_source)
+
+        self.begin_update()
+        self.update_items(data.items())
+        self.end_update()
+
+    def begin_update(self):
+        """Begin updating the model in chunks.
+
+        Top level items that are not updated before `end_update` is called
+        are removed from the model.
+        """
+
+        self._seen = set()
+
+    def update_items(self, items):
+        """Insert/update a chunk of top level items.
+
+        Args:
+            items (iterable[tuple[str, dict]]): Top level item names and 
+                their status codes, by child name.
+        """
+
+        items = sorted(items)
+
+        if not items:
+            return
+
+        data = dict(items)
+        names = [name for name, _ in items]
+
+        # Only the rows between the first and last name of the chunk can 
+        # change, so only those rows need to be diffed.
+        first = bisect.bisect_left(self._names, names[0])
+        last = bisect.bisect_right(self._names, names[-1])
+        window = sorted(set(self._names[first:last]).union(names))
+
+        self._update_top_items(window, data, first, last)
+
+        for name in names:
+            row = bisect.bisect_left(self._names, name)
+
+            if data[name] != self._data[row]:
+                self._update_child_items(row, data[name])
+
+        if self._seen is not None:
+            self._seen.update(names)
+
+    def end_update(self):
+        """Finish updating the model in chunks."""
+
+        if self._seen is None:
+            return
+
+        seen, self._seen = self._seen, None
+
+        self._update_top_items([name for name in self._names if name in seen])
+
+    def apply_updates(self, updates):
+        """Update the status of individual items.
+
+        Only the rows of the given items are updated; items that are not in
+        the model yet are inserted.
+
+        Args:
+            updates (dict[tuple[str, str], str]): Status codes, by parent and
+                child name.
+        """
+
+        new_items = []
+
+        for name, statuses in common.group_updates(updates).items():
+            row = bisect.bisect_left(self._names, name)
+            exists = row < len(self._names) and self._names[row] == name
+
+            # The data may be shared with the query cache, so it is copied.
+            data = dict(self._data[row]) if exists else {}
+            data.update((path[0], status) for path, status in statuses.items())
+
+            # Existing rows are updated directly, rather than diffing every 
+            # top level row between the first and last updated one.
+            if exists:
+                self._update_child_items(row, data)
+            else:
+                new_items.append((name, data))
+
+        self.update_items(new_items)
+
+    @instrument.timed
+    def _update_top_items(self, names, data=None, first=0, last=None):
+        """Insert/remove top level rows so they match the given names.
+
+        Args:
+            names (list[str]): Sorted names of the top level items.
+            data (dict[str, dict]): Status data, by top level item name. 
+                Required if there are rows to insert.
+            first (int): First row to update.
+            last (int): Row after the last row to update; defaults to the
+                number of rows.
+        """
+
+        last = len(self._names) if last is None else last
+        edits = common.diff_rows(self._names[first:last], names, is_sorted=True)
+
+        for start, end, new_start, new_end in edits:
+            start += first
+            end += first
+
+            if end > start:
+                self.beginRemoveRows(QtCore.QModelIndex(), start, end - 1)
+
+                for name in self._names[start:end]:
+                    self._name_index.remove_item(name)
+
+                for values in self._top_level_lists():
+                    del values[start:end]
+
+                self._id_rows = None
+                self.endRemoveRows()
+
+            if new_end > new_start:
+                self.beginInsertRows(
+                    QtCore.QModelIndex(), 
+                    start, 
+                    start + new_end - new_start - 1
+                )
+
+                for row, name in enumerate(names[new_start:new_end], start):
+                    self._create_top_item(row, name, data[name])
+
+                self._id_rows = None
+                self.endInsertRows()
+
+    def _top_level_lists(self):
+        """Return the lists that hold a value for each top level row.
+
+        Returns:
+            list[list]
+        """
+
+        return [
+            self._names, 
+            self._children, 
+            self._statuses, 
+            self._exposed, 
+            self._data, 
+            self._ids
+        ]
+
+    @instrument.timed
+    def _create_top_item(self, row, name, data):
+        """Create a top level item for the status list.
+
+        Args:
+            row (int): Row to insert the item at.
+            name (str): Display name of the top level item.
+            data (dict[str, str]): Status codes, by child name.
+        """
+
+        items = sorted(data.items())
+
+        self._names.insert(row, name)
+        self._children.insert(row, [child for child, _ in items])
+        self._statuses.insert(row, [status for _, status in items])
+        self._exposed.insert(row, False)
+        self._data.insert(row, data)
+        self._ids.insert(row, self._next_id)
+
+        self._next_id += 1
+
+        self._name_index.set_item(name, self._children[row])
+
+    def _update_child_items(self, row, data):
+        """Update the child rows of a top level item to match the given data.
+
+        Args:
+            row (int): Row of the top level item.
+            data (dict[str, str]): Status codes, by child name.
+        """
+
+        self._data[row] = data
+
+        children = sorted(data)
+        statuses = [data[child] for child in children]
+
+        if children != self._children[row]:
+            self._name_index.set_item(self._names[row], children)
+
+        if not self._exposed[row]:
+            # No view has seen these rows yet, so there is nothing to notify.
+            self._children[row] = children
+            self._statuses[row] = statuses
+            return
+
+        parent = self.index(row, 0)
+        old_children = self._children[row]
+        old_statuses = self._statuses[row]
+
+        edits = common.diff_rows(old_children, children, is_sorted=True)
+
+        for first, last, new_first, new_last in edits:
+            if last > first:
+                self.beginRemoveRows(parent, first, last - 1)
+                del old_children[first:last]
+                del old_statuses[first:last]
+                self.endRemoveRows()
+
+            if new_last > new_first:
+                self.beginInsertRows(
+                    parent, first, first + new_last - new_first - 1
+                )
+                old_children[first:first] = children[new_first:new_last]
+                old_statuses[first:first] = statuses[new_first:new_last]
+                self.endInsertRows()
+
+        for first, last in common.changed_rows(old_statuses, statuses):
+            old_statuses[first:last + 1] = statuses[first:last + 1]
+
+            self.dataChanged.emit(
+                self.index(first, 0, parent),
+                self.index(last, self.columnCount() - 1, parent)
+            )
+
+
+def main(**kwargs):
+    common.main(
+        widget=StatusWidget,
+        window_name='Model/View',
+        **kwargs
+    )
+
+
+if __name__ == '__main__':
+    main()
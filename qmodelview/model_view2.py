@@ -1,248 +1,1644 @@
-"""Advanced model/view example.
-
-This example shows the model/view to rendering nested data in a tree structure,
-shared across multiple widgets.
-"""
-
-import os
-import operator
-import sys 
-
-import common 
-
-from PySide2 import QtCore, QtGui, QtWidgets
-
-
-class StatusView(QtWidgets.QTreeView):
-    """Widget that displays the status of items."""
-
-    def __init__(self, model, parent=None):
-        """Initialize.
-        
-        Args:
-            model (QtGui.QStandardItemModel): Model for the item/status data.
-            parent (QtWidgets.QWidget): Parent widget for this widget.
-        """
-
-        super(StatusView, self).__init__(parent)
-
-        self.setSelectionMode(QtWidgets.QTreeView.NoSelection)
-        self.setEditTriggers(QtWidgets.QTreeView.NoEditTriggers)
-        self.setModel(model)
-
-
-class RootLeafWidget(QtWidgets.QWidget):
-    """Widget to select root/leaf items."""
-
-    IndexChanged = QtCore.Signal(QtCore.QModelIndex)
-
-    def __init__(self, model, parent=None):
-        """Initialize.
-        
-        Args:
-            model (QtGui.QStandardItemModel): Model for the root/leaf data.
-            parent (QtWidgets.QWidget): Parent widget for this widget.
-        """
-
-        super(RootLeafWidget, self).__init__(parent)
-
-        form_layout = QtWidgets.QFormLayout(self)
-
-        # A QComboBox behaves like a QListView 
-        # that renders only the selected item.
-        self.sel_root = QtWidgets.QComboBox(self)
-        self.sel_root.setModel(model)
-        self.sel_root.currentIndexChanged.connect(self._handle_root_changed)
-
-        self.sel_leaf = QtWidgets.QComboBox(self)
-        self.sel_leaf.setModel(model)
-        self.sel_leaf.currentIndexChanged.connect(self._handle_leaf_changed)
-
-        form_layout.addRow('Root', self.sel_root)
-        form_layout.addRow('Leaf', self.sel_leaf)
-
-    def _handle_root_changed(self, row):
-        """Handle the user selecting a root item.
-
-        Args:
-            row (int): Selected row in the combo box.
-        """
-
-        # When the root is selected, we need to point the leaf combo box at 
-        # the index for that root so the correct leaf items are shown.
-        new_index = self.sel_root.model().index(row, 0)
-
-        self._set_root_index(self.sel_leaf, new_index, restore_selection=True)
-
-    def _handle_leaf_changed(self, row):
-        """Handle the user selecting a leaf item.
-
-        Args:
-            row (int): Selected row in the combo box.
-        """
-
-        # When a leaf is selected, we need to point the tree view at 
-        # the index for that root so the items are shown. Note that the 
-        # new index is a child of the leaf index, because our data model
-        # is hierarchical.
-        new_index = self.sel_leaf.model().index(
-            row, 0, self.sel_leaf.rootModelIndex()
-        )
-
-        self.IndexChanged.emit(new_index)
-
-    @staticmethod
-    def _set_root_index(combobox, index, restore_selection=True):
-        """Set the root index of the given combobox.
-
-        Args:
-            combobox (QtWidgets.QComboBox): Combobox to edit.
-            index (QtCore.QModelIndex): New root index for the combobox.
-            restore_selection (bool): If True, attempt to restore the combo box
-                to the last selected row. If the index is out of bounds, set 
-                the selection to the first row.
-        """
-
-        # Setting a new model/root index in a combo box clears the selection.
-        # We can either reset to the first item, or try to maintain selection.
-        # In this example, we just re-select the same index, but in production
-        # code, you would have to some sort of lookup to find the index of the 
-        # "same" item (eg, same name, same data, etc).
-        row = combobox.currentIndex()
-        combobox.setRootModelIndex(index)
-
-        if restore_selection:
-            row = max(0, row * (row < combobox.count()))
-            combobox.setCurrentIndex(row)
-        else:
-            combobox.setCurrentIndex(0)
-
-
-class StatusWidget(QtWidgets.QWidget):
-    """Widget that displays the status of items."""
-
-    def __init__(self, parent=None):
-        """Initialize.
-        
-        Args:
-            parent (QtWidgets.QWidget): Parent widget for this widget.
-        """
-
-        super(StatusWidget, self).__init__(parent)
-
-        # Normally, the model should be passed to the view; this is just an 
-        # artifact of how I set up the re-usable components of this example.
-        # 
-        # Passing the model to the view means you can mock it when your doing 
-        # tests/demos if you don't want to deal with spinning up a test database
-        # and populating test data.
-        self.model = StatusModel()
-
-        # Decomposing your view into individual widgets makes your code easier 
-        # to digest in small junks. Let the widget be responsible for its own
-        # static configuration options.
-        self.status_view = StatusView(self.model, self)
-
-        # A GroupBox lets you organize and label your widgets.
-        self.status_box = QtWidgets.QGroupBox('Status')
-        self.status_lay = QtWidgets.QVBoxLayout(self.status_box)
-        self.status_lay.addWidget(self.status_view)
-
-        # Decomposing your view into individual widgets also them re-usable.
-        # How many tools do you have that have your user select a data in a 
-        # parent/child relationship? Hint: do you group shots by sequence?
-        self.sel_widget = RootLeafWidget(self.model, self)
-        self.sel_widget.IndexChanged.connect(self.status_view.setRootIndex)
-
-        root_layout = QtWidgets.QVBoxLayout(self)
-        root_layout.addWidget(self.sel_widget)
-        root_layout.addWidget(self.status_box)
-    
-    def refresh(self):
-        """Refresh the UI."""
-
-        self.model.refresh()
-
-
-class StatusModel(QtGui.QStandardItemModel):
-    """Provides access to the status of items."""
-
-    def refresh(self):
-        """Refresh the list of status items in this model."""
-
-        data = common.query_db('data2.json')
-
-        self.clear()
-
-        # In a Model/View setup, the model is responsible for the header labels.
-        self.setHorizontalHeaderLabels(['Name', 'Status'])
-
-        # Use the operator module to make callables that behave like operators
-        # For example, operator.itemgetter('foo')(obj) is the same as obj.foo
-        for each in sorted(data, key=operator.itemgetter('name')):
-            self._create_item_a(each, self)
-
-    def _create_item_a(self, data, parent):
-        """Create a item for the status list.
-
-        Args:
-            data (dict): Status data.
-            parent (QtGui.QStandardItemModel): Parent for the model items.
-        """
-
-        item = QtGui.QStandardItem(data['name'])
-
-        for each in sorted(data.get('items', []), key=operator.itemgetter('name')):
-            self._create_item_b(each, item)
-        
-        parent.appendRow(item)
-
-    def _create_item_b(self, data, parent):
-        """Create a named item for the status list.
-
-        Args:
-            data (dict): Status data.
-            parent (QtGui.QStandardItem): Parent for the model items.
-        """
-
-        item = QtGui.QStandardItem(data['name'])
-
-        for each in data.get('items', []):
-            self._create_item_c(each, item)
-        
-        parent.appendRow(item)
-
-    def _create_item_c(self, data, parent):
-        """Create a child item for the status list.
-
-        Args:
-            data (dict): Status data.
-            parent (QtGui.QStandardItem): Parent for the model items.
-        """
-
-        name = data['name']
-        status = data['status']
-
-        name_item = QtGui.QStandardItem(name)
-        status_item = QtGui.QStandardItem(common.STATUS_NAMES.get(status))
-
-        # The constructor of QStandardItem accepts the text/display data.
-        # You can set additional internal data on the item in any "role".
-        status_item.setData(status)
-
-        brush = QtGui.QBrush(common.STATUS_COLORS[status])
-        name_item.setBackground(brush)
-        status_item.setBackground(brush)
-
-        parent.appendRow([name_item, status_item])
-
-
-def main():
-    common.main(
-        widget=StatusWidget,
-        window_name='Model/View+'
-    )
-
-
-if __name__ == '__main__':
-    main()
+"""Advanced model/view example.
+
+This example shows the model/view to rendering nested data in a tree structure,
+shared across multiple widgets.
+"""
+
+import array
+import bisect
+import collections
+import itertools
+import os
+import operator
+import sys 
+
+import columnar
+import common 
+import instrument
+
+from PySide2 import QtCore, QtWidgets
+
+
+class StatusView(QtWidgets.QTreeView):
+    """Widget that displays the status of items."""
+
+    def __init__(self, model, parent=None):
+        """Initialize.
+        
+        Args:
+            model (QtCore.QAbstractItemModel): Model for the item/status data.
+            parent (QtWidgets.QWidget): Parent widget for this widget.
+        """
+
+        super(StatusView, self).__init__(parent)
+
+        self.setSelectionMode(QtWidgets.QTreeView.NoSelection)
+        self.setEditTriggers(QtWidgets.QTreeView.NoEditTriggers)
+        self.setItemDelegate(common.StatusDelegate(self))
+        self.setModel(model)
+
+
+class RootLeafWidget(QtWidgets.QWidget):
+    """Widget to select root/leaf items."""
+
+    IndexChanged = QtCore.Signal(QtCore.QModelIndex)
+
+    def __init__(self, model, parent=None):
+        """Initialize.
+        
+        Args:
+            model (StatusModel): Model for the root/leaf data.
+            parent (QtWidgets.QWidget): Parent widget for this widget.
+        """
+
+        super(RootLeafWidget, self).__init__(parent)
+
+        form_layout = QtWidgets.QFormLayout(self)
+
+        # A QComboBox behaves like a QListView 
+        # that renders only the selected item.
+        self.sel_root = QtWidgets.QComboBox(self)
+        self.sel_root.setModel(model)
+        self.sel_root.currentIndexChanged.connect(self._handle_root_changed)
+
+        self.sel_leaf = QtWidgets.QComboBox(self)
+        self.sel_leaf.setModel(model)
+        self.sel_leaf.currentIndexChanged.connect(self._handle_leaf_changed)
+
+        form_layout.addRow('Root', self.sel_root)
+        form_layout.addRow('Leaf', self.sel_leaf)
+
+    def _handle_root_changed(self, row):
+        """Handle the user selecting a root item.
+
+        Args:
+            row (int): Selected row in the combo box.
+        """
+
+        # When the root is selected, we need to point the leaf combo box at 
+        # the index for that root so the correct leaf items are shown.
+        new_index = self.sel_root.model().index(row, 0)
+
+        self._set_root_index(self.sel_leaf, new_index, restore_selection=True)
+
+    def _handle_leaf_changed(self, row):
+        """Handle the user selecting a leaf item.
+
+        Args:
+            row (int): Selected row in the combo box.
+        """
+
+        # When a leaf is selected, we need to point the tree view at 
+        # the index for that root so the items are shown. Note that the 
+        # new index is a child of the leaf index, because our data model
+        # is hierarchical.
+        new_index = self.sel_leaf.model().index(
+            row, 0, self.sel_leaf.rootModelIndex()
+        )
+
+        self.IndexChanged.emit(new_index)
+
+    @staticmethod
+    def _set_root_index(combobox, index, restore_selection=True):
+        """Set the root index of the given combobox.
+
+        Args:
+            combobox (QtWidgets.QComboBox): Combobox to edit.
+            index (QtCore.QModelIndex): New root index for the combobox.
+            restore_selection (bool): If True, attempt to restore the combo box
+                to the item with the same name as the last selected item. If 
+                there is no such item, set the selection to the first row.
+        """
+
+        # Setting a new model/root index in a combo box clears the selection.
+        # We can either reset to the first item, or try to maintain selection.
+        # Rows are not a reliable way to find the "same" item under the new 
+        # root, so the model looks it up by name instead.
+        name = combobox.currentText()
+
+        # A lazy model loads the children of the new root when asked to.
+        model = combobox.model()
+
+        if model.canFetchMore(index):
+            model.fetchMore(index)
+
+        combobox.setRootModelIndex(index)
+
+        row = 0
+
+        if restore_selection and name:
+            row = max(0, combobox.model().find_row(name, index))
+
+        combobox.setCurrentIndex(row)
+
+
+class StatusWidget(QtWidgets.QWidget):
+    """Widget that displays the status of items."""
+
+    def __init__(self, parent=None):
+        """Initialize.
+        
+        Args:
+            parent (QtWidgets.QWidget): Parent widget for this widget.
+        """
+
+        super(StatusWidget, self).__init__(parent)
+
+        # Normally, the model should be passed to the view; this is just an 
+        # artifact of how I set up the re-usable components of this example.
+        # 
+        # Passing the model to the view means you can mock it when your doing 
+        # tests/demos if you don't want to deal with spinning up a test database
+        # and populating test data.
+        #
+        # The view only ever shows one shot, so the children of each
+        # sequence are only loaded when it is selected.
+        self.model = StatusModel(lazy=True)
+
+        # Decomposing your view into individual widgets makes your code easier 
+        # to digest in small junks. Let the widget be responsible for its own
+        # static configuration options.
+        # The view only shows one shot, so it looks at the model through a 
+        # proxy that hides (and ignores changes to) the rest of the model.
+        self.subtree_model = SubtreeProxyModel(self)
+        self.subtree_model.setSourceModel(self.model)
+
+        self.status_view = StatusView(self.subtree_model, self)
+
+        # A GroupBox lets you organize and label your widgets.
+        self.status_box = QtWidgets.QGroupBox('Status')
+        self.status_lay = QtWidgets.QVBoxLayout(self.status_box)
+        self.status_lay.addWidget(self.status_view)
+
+        # Decomposing your view into individual widgets also them re-usable.
+        # How many tools do you have that have your user select a data in a 
+        # parent/child relationship? Hint: do you group shots by sequence?
+        self.sel_widget = RootLeafWidget(self.model, self)
+        self.sel_widget.IndexChanged.connect(self.subtree_model.set_root_index)
+
+        root_layout = QtWidgets.QVBoxLayout(self)
+        root_layout.addWidget(self.sel_widget)
+        root_layout.addWidget(self.status_box)
+    
+    @property
+    def data_source(self):
+        """Return the name of the status data file.
+
+        Returns:
+            str
+        """
+
+        return self.model.data_source
+
+    @property
+    def lazy(self):
+        """Return True if the children of each item are loaded when needed.
+
+        Returns:
+            bool
+        """
+
+        return self.model.lazy
+
+    @property
+    def asynchronous(self):
+        """Return True if the top level items are loaded in the background.
+
+        Returns:
+            bool
+        """
+
+        return self.model.asynchronous
+
+    @asynchronous.setter
+    def asynchronous(self, value):
+        self.model.asynchronous = value
+
+    @data_source.setter
+    def data_source(self, value):
+        self.model.data_source = value
+
+    def refresh(self):
+        """Refresh the UI."""
+
+        self.model.refresh()
+
+    def begin_update(self):
+        """Begin updating the UI in chunks."""
+
+        self.model.begin_update()
+
+    def update_items(self, items):
+        """Update a chunk of the top level items in the UI.
+
+        Args:
+            items (list[dict]): Top level status data.
+        """
+
+        self.model.update_items(items)
+
+    def end_update(self):
+        """Finish updating the UI in chunks."""
+
+        self.model.end_update()
+
+    def apply_updates(self, updates):
+        """Update the status of individual items in the UI.
+
+        Args:
+            updates (dict[tuple[str], str]): Status codes, by item path.
+        """
+
+        self.model.apply_updates(updates)
+
+
+class StatusModel(QtCore.QAbstractItemModel):
+    """Provides access to the status of items.
+
+    The status data is stored in a `columnar.StatusTree`, a few flat arrays
+    with one value per item, rather than a QStandardItem per cell. The 
+    internal id of each index is the id of its node in the tree, so the 
+    model answers the views' questions straight from the arrays.
+
+    Refreshing the model compares the new status data against the tree. A
+    change of status only updates the changed rows; a change of structure 
+    replaces the children of the nodes whose children were renamed, added
+    or removed, and keeps the rest, so the views keep their selection and
+    expansion state wherever the structure did not change.
+
+    A lazy model only loads the top level items up front. The children of
+    a top level item are requested from the data source when a view asks
+    for them (see `fetchMore`), eg, when the item is expanded, and the
+    least recently loaded subtrees that no view is using are unloaded
+    again once there are more than `MAX_LOADED`. An asynchronous lazy model
+    queries the top level items, and the subtrees it has loaded, on a
+    worker thread (see `common.StatusLoader`).
+
+    Snapshots are the exception: an empty model takes every item of a 
+    snapshot as it is, as that is quicker than querying even the top level
+    items of another data source.
+    """
+
+    HEADER_LABELS = ['Name', 'Status', 'Summary']
+
+    # Column of the number of items below each row with each status.
+    SUMMARY_COLUMN = 2
+
+    # Fraction of discarded nodes at which the tree is compacted.
+    COMPACT_RATIO = 0.5
+
+    # Number of top level items whose children a lazy model keeps loaded.
+    MAX_LOADED = 32
+
+    data_source = 'data2.json'
+
+    def __init__(self, parent=None, lazy=False, asynchronous=False):
+        """Initialize.
+
+        Args:
+            parent (QtCore.QObject): Parent object for this model.
+            lazy (bool): If True, load the children of each top level item
+                only when they are needed.
+            asynchronous (bool): If True, a lazy model is refreshed in the
+                background.
+        """
+
+        super(StatusModel, self).__init__(parent)
+
+        self.lazy = lazy
+        self.asynchronous = asynchronous
+
+        # Loads the top level items of an asynchronous lazy model; made
+        # when it is first refreshed.
+        self._loader = None
+
+        self._tree = columnar.StatusTree()
+
+        # Names and node ids of the top level items, sorted by name.
+        self._names = []
+        self._top = array.array('I')
+
+        # Names of the top level items seen during a chunked update.
+        self._seen = None
+
+        # Row of each child item, by name, by the node id of its parent.
+        # These are dropped when the children of a node are loaded,
+        # unloaded or replaced, and when the tree is compacted.
+        self._rows_by_name = {}
+
+        # Names of the top level items whose children are loaded, least
+        # recently loaded first, and the status updates received for each
+        # top level item of a lazy model, to apply when they are loaded.
+        self._loaded = collections.OrderedDict()
+        self._updates = {}
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """Return the index of the item at the given row/column.
+
+        Args:
+            row (int): Row of the item.
+            column (int): Column of the item.
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            QtCore.QModelIndex
+        """
+
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+
+        if parent.isValid():
+            node = self._tree.first_child[parent.internalId()] + row
+        else:
+            node = self._top[row]
+
+        return self.createIndex(row, column, node)
+
+    def parent(self, index):
+        """Return the index of the parent of the given item.
+
+        Args:
+            index (QtCore.QModelIndex): Index of an item.
+
+        Returns:
+            QtCore.QModelIndex
+        """
+
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        node = self._tree.parents[index.internalId()]
+
+        if node < 0:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(self._row(node), 0, node)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return the number of rows under the given parent.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            int
+        """
+
+        if not parent.isValid():
+            return len(self._top)
+
+        if parent.column() != 0:
+            return 0
+
+        return self._tree.child_count[parent.internalId()]
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return the number of columns under the given parent.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            int
+        """
+
+        return len(self.HEADER_LABELS)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        """Return True if the given parent has children.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            bool
+        """
+
+        return self.rowCount(parent) > 0 or self.canFetchMore(parent)
+
+    def canFetchMore(self, parent):
+        """Return True if the children of the given parent are not loaded.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            bool
+        """
+
+        if not self.lazy or not parent.isValid() or parent.column() != 0:
+            return False
+
+        node = parent.internalId()
+
+        return self._tree.parents[node] < 0 and (
+            self._tree.name(node) not in self._loaded
+        )
+
+    @instrument.timed
+    def fetchMore(self, parent):
+        """Load the children of the given top level item.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+        """
+
+        if not self.canFetchMore(parent):
+            return
+
+        node = parent.internalId()
+        name = self._tree.name(node)
+
+        record = self._apply_statuses(
+            common.query_record(name, self.data_source),
+            self._updates.get(name, {})
+        )
+        items = self._prepared(record).get('items') or []
+
+        self._loaded[name] = True
+
+        if items:
+            self.beginInsertRows(parent, 0, len(items) - 1)
+            self._tree.add_children(node, items)
+            self._rows_by_name.pop(node, None)
+            self.endInsertRows()
+
+            self._emit_summary_changed(node)
+
+        self._unload_if_needed()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """Return the data for the item at the given index.
+
+        Args:
+            index (QtCore.QModelIndex): Index of an item.
+            role (int): Data role to return.
+
+        Returns:
+            object
+        """
+
+        if not index.isValid():
+            return None
+
+        # The delegate paints the color and name of the status.
+        if role == QtCore.Qt.DisplayRole and index.column() == 0:
+            return self._tree.name(index.internalId())
+
+        if role == common.STATUS_ROLE and index.column() == common.STATUS_COLUMN:
+            return self._tree.status(index.internalId())
+
+        if role == QtCore.Qt.DisplayRole and index.column() == self.SUMMARY_COLUMN:
+            return self._summary(index.internalId())
+
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """Return the header data for the given section.
+
+        Args:
+            section (int): Header section.
+            orientation (QtCore.Qt.Orientation): Header orientation.
+            role (int): Data role to return.
+
+        Returns:
+            object
+        """
+
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADER_LABELS[section]
+
+        return None
+
+    def find_row(self, name, parent=QtCore.QModelIndex()):
+        """Return the row of the child item with the given name.
+
+        Args:
+            name (str): Name of the child item.
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            int: -1 if the parent has no child with that name.
+        """
+
+        if not parent.isValid():
+            return self._top_row(name)
+
+        node = parent.internalId()
+        rows = self._rows_by_name.get(node)
+
+        if rows is None:
+            rows = self._rows_by_name[node] = {
+                each: row for row, each in enumerate(self._tree.child_names(node))
+            }
+
+        return rows.get(name, -1)
+
+    @instrument.timed
+    def refresh(self):
+        """Refresh the list of status items in this model."""
+
+        backend = common.get_backend(self.data_source)
+
+        # Already imported by `get_backend`; see `common.get_backend`.
+        import backends
+
+        if not self._top and isinstance(backend, backends.SnapshotBackend):
+            # An empty model can take the arrays of a snapshot as they are.
+            mapped = backend.snapshot()
+            tree = columnar.StatusTree.from_snapshot(mapped)
+            self._load_tree(tree, mapped.top_count)
+
+            # Every subtree is in the tree already, so none are fetched.
+            if self.lazy:
+                self._loaded = collections.OrderedDict.fromkeys(self._names, True)
+
+            return
+
+        if self.lazy:
+            # Loaded subtrees are loaded again; the rest stay unloaded.
+            self._updates = {}
+
+            if self.asynchronous:
+                self._load_in_background()
+                return
+
+            data = common.iter_parents(self.data_source, self._loaded)
+
+        else:
+            data = common.query_db(self.data_source)
+
+        self.begin_update()
+        self.update_items(data)
+        self.end_update()
+
+    def _load_in_background(self):
+        """Query the top level items, and the loaded subtrees, on a worker."""
+
+        if self._loader is None:
+            self._loader = common.StatusLoader(parent=self)
+            self._loader.Started.connect(self.begin_update)
+            self._loader.ChunkReady.connect(self.update_items)
+            self._loader.Finished.connect(self.end_update)
+            self._loader.Failed.connect(self._handle_load_failed)
+
+        self._loader.filename = self.data_source
+        self._loader.load(full=set(self._loaded))
+
+    def _handle_load_failed(self, message):
+        """Handle the status data failing to load in the background.
+
+        Args:
+            message (str): Error message.
+        """
+
+        print('Failed to load status: {}'.format(message), file=sys.stderr)
+
+    def begin_update(self):
+        """Begin updating the model in chunks.
+
+        Top level items that are not updated before `end_update` is called
+        are removed from the model.
+        """
+
+        self._seen = set()
+
+    def update_items(self, records):
+        """Insert/update a chunk of top level items.
+
+        Args:
+            records (iterable[dict]): Top level status data.
+        """
+
+        new_records = []
+
+        for record in self._sorted(records):
+            if self.lazy and record['name'] not in self._loaded:
+                record = self._unloaded(record)
+            elif self.lazy and 'items' not in record:
+                # Loaded after the records were queried.
+                record = common.query_record(record['name'], self.data_source)
+
+            row = self._top_row(record['name'])
+
+            if row < 0:
+                new_records.append(record)
+            else:
+                self._update_top_item(row, self._prepared(record))
+
+            if self._seen is not None:
+                self._seen.add(record['name'])
+
+        self._insert_top_items(new_records)
+
+        if self._seen is None:
+            self._compact_if_needed()
+
+    def end_update(self):
+        """Finish updating the model in chunks."""
+
+        if self._seen is None:
+            return
+
+        seen, self._seen = self._seen, None
+
+        # Remove the unseen rows in runs, from the bottom up.
+        row = len(self._names)
+
+        while row > 0:
+            if self._names[row - 1] in seen:
+                row -= 1
+                continue
+
+            last = row
+
+            while row > 0 and self._names[row - 1] not in seen:
+                row -= 1
+
+            self.beginRemoveRows(QtCore.QModelIndex(), row, last - 1)
+
+            for node in self._top[row:last]:
+                self._tree.discard(node)
+
+            for name in self._names[row:last]:
+                self._loaded.pop(name, None)
+
+            del self._names[row:last]
+            del self._top[row:last]
+            self.endRemoveRows()
+
+        self._compact_if_needed()
+
+    def apply_updates(self, updates):
+        """Update the status of individual items.
+
+        Only the rows of the given items are updated; items that are not in
+        the model yet are inserted.
+
+        Args:
+            updates (dict[tuple[str], str]): Status codes, by the names of 
+                each item and its parents, from the top level down.
+        """
+
+        new_records = []
+
+        for name, statuses in common.group_updates(updates).items():
+            row = self._top_row(name)
+
+            if self.lazy:
+                # Kept, so they survive the subtree being loaded again.
+                self._updates.setdefault(name, {}).update(statuses)
+
+                if name not in self._loaded:
+                    if row < 0:
+                        new_records.append({'name': name})
+                    elif () in statuses:
+                        self._set_statuses([(self._top[row], statuses[()])])
+
+                    continue
+
+            if row < 0:
+                new_records.append(self._apply_statuses({'name': name}, statuses))
+                continue
+
+            node = self._top[row]
+            changes = []
+
+            for path, status in statuses.items():
+                child = self._tree.find(node, path)
+
+                if child < 0:
+                    changes = None
+                    break
+
+                changes.append((child, status))
+
+            if changes is None:
+                # New items change the structure of the subtree.
+                record = self._tree.to_record(node)
+                self._update_top_item(
+                    row, self._prepared(self._apply_statuses(record, statuses))
+                )
+            else:
+                self._set_statuses(changes)
+
+        self._insert_top_items(self._sorted(new_records))
+        self._compact_if_needed()
+
+    @classmethod
+    def _apply_statuses(cls, record, statuses):
+        """Return a copy of the status data, with the given statuses set.
+
+        The status data may be shared with the query cache, so only the
+        records on the path to each updated item are copied.
+
+        Args:
+            record (dict): Status data.
+            statuses (dict[tuple[str], str]): Status codes, by the path of
+                each item below the record; an empty path is the record.
+
+        Returns:
+            dict
+        """
+
+        result = dict(record)
+
+        for name, each in common.group_updates(
+            {path: status for path, status in statuses.items() if path}
+        ).items():
+            items = result['items'] = list(result.get('items', []))
+
+            for row, child in enumerate(items):
+                if child['name'] == name:
+                    items[row] = cls._apply_statuses(child, each)
+                    break
+            else:
+                items.append(cls._apply_statuses({'name': name}, each))
+
+        if () in statuses:
+            result['status'] = statuses[()]
+
+        return result
+
+    @instrument.timed
+    def _load_tree(self, tree, top_count):
+        """Replace the contents of this model with a tree.
+
+        Args:
+            tree (columnar.StatusTree): Tree whose top level nodes come
+                first, sorted by name.
+            top_count (int): Number of top level nodes.
+        """
+
+        self.beginResetModel()
+
+        self._tree = tree
+        self._top = array.array('I', range(top_count))
+        self._names = [tree.name(node) for node in self._top]
+        self._rows_by_name = {}
+
+        self.endResetModel()
+
+    def _unload_if_needed(self):
+        """Unload the least recently loaded subtrees, if there are too many.
+
+        Subtrees that have persistent indexes in them (eg, the root index
+        of a view, or an expanded item) are in use, and are kept.
+        """
+
+        if len(self._loaded) <= self.MAX_LOADED:
+            return
+
+        in_use = {
+            self._tree.name(self._tree.top(index.internalId()))
+            for index in self.persistentIndexList()
+            if index.isValid()
+        }
+
+        for name in list(self._loaded):
+            if len(self._loaded) <= self.MAX_LOADED:
+                break
+
+            if name in in_use:
+                self._loaded.move_to_end(name)
+                continue
+
+            del self._loaded[name]
+
+            row = self._top_row(name)
+            node = self._top[row]
+            count = self._tree.child_count[node]
+
+            if not count:
+                continue
+
+            self.beginRemoveRows(self.createIndex(row, 0, node), 0, count - 1)
+            self._tree.remove_children(node)
+            self._rows_by_name.pop(node, None)
+            self.endRemoveRows()
+
+            self._emit_summary_changed(node)
+
+        self._compact_if_needed()
+
+    @staticmethod
+    def _unloaded(record):
+        """Return top level status data, without its children.
+
+        Args:
+            record (dict): Top level status data.
+
+        Returns:
+            dict
+        """
+
+        return {
+            key: value for key, value in record.items() if key != 'items'
+        }
+
+    def _row(self, node):
+        """Return the row of the given node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            int
+        """
+
+        row = self._tree.row(node)
+
+        if row < 0:
+            row = bisect.bisect_left(self._names, self._tree.name(node))
+
+        return row
+
+    def _top_row(self, name):
+        """Return the row of the top level item with the given name.
+
+        Args:
+            name (str): Name of the top level item.
+
+        Returns:
+            int: -1 if there is no such item.
+        """
+
+        row = bisect.bisect_left(self._names, name)
+
+        if row < len(self._names) and self._names[row] == name:
+            return row
+
+        return -1
+
+    @instrument.timed
+    def _insert_top_items(self, records):
+        """Insert new top level items.
+
+        Args:
+            records (list[dict]): Sorted status data of the new items.
+        """
+
+        # Records inserted at the same row are inserted together, so the 
+        # views are notified once per run of new rows, not once per row.
+        positions = [
+            bisect.bisect_left(self._names, each['name']) for each in records
+        ]
+
+        offset = 0
+
+        for position, group in itertools.groupby(
+            zip(positions, records), key=operator.itemgetter(0)
+        ):
+            group = [record for _, record in group]
+            first = position + offset
+
+            self.beginInsertRows(
+                QtCore.QModelIndex(), first, first + len(group) - 1
+            )
+
+            self._names[first:first] = [each['name'] for each in group]
+            self._top[first:first] = array.array('I', [
+                self._tree.add(self._prepared(each)) for each in group
+            ])
+
+            self.endInsertRows()
+
+            offset += len(group)
+
+    @instrument.timed
+    def _update_top_item(self, row, record):
+        """Update a top level item to match the given status data.
+
+        Args:
+            row (int): Row of the top level item.
+            record (dict): Prepared status data (see `_prepared`).
+        """
+
+        changes = self._tree.status_changes(self._top[row], record)
+
+        if changes is not None:
+            self._set_statuses(changes)
+            return
+
+        # The structure changed. Nodes keep their children where the names
+        # of the children are the same, so the views keep the selection
+        # and expansion state of those; elsewhere the children are removed,
+        # then the new ones are inserted.
+        changes = []
+        self._update_children(self._top[row], record, changes)
+        self._set_statuses(changes)
+
+    def _update_children(self, node, record, changes):
+        """Update the children of a node to match the given status data.
+
+        Args:
+            node (int): Node id.
+            record (dict): Status data of the node.
+            changes (list[tuple[int, str]]): Node id and new status code of
+                the nodes whose status changed, which is added to.
+        """
+
+        if self._tree.status(node) != record.get('status'):
+            changes.append((node, record.get('status')))
+
+        items = record.get('items') or []
+        children = self._tree.children(node)
+
+        if [self._tree.name(each) for each in children] == [
+            each['name'] for each in items
+        ]:
+            for child, item in zip(children, items):
+                self._update_children(child, item, changes)
+
+            return
+
+        parent = self.createIndex(self._row(node), 0, node)
+
+        if len(children):
+            self.beginRemoveRows(parent, 0, len(children) - 1)
+            self._tree.remove_children(node)
+            self._forget_rows(node)
+            self.endRemoveRows()
+
+        if items:
+            self.beginInsertRows(parent, 0, len(items) - 1)
+            self._tree.add_children(node, items)
+            self._rows_by_name.pop(node, None)
+            self.endInsertRows()
+
+        while node >= 0:
+            self._emit_summary_changed(node)
+            node = self._tree.parents[node]
+
+    def _forget_rows(self, node):
+        """Drop the rows by name of a node and its descendants.
+
+        Args:
+            node (int): Node id.
+        """
+
+        def in_subtree(each):
+            while each >= 0:
+                if each == node:
+                    return True
+
+                each = self._tree.parents[each]
+
+            return False
+
+        for each in [each for each in self._rows_by_name if in_subtree(each)]:
+            del self._rows_by_name[each]
+
+    def _set_statuses(self, changes):
+        """Set the status of individual items.
+
+        The summaries of their parents are updated too.
+
+        Args:
+            changes (list[tuple[int, str]]): Node id and status code of each
+                item.
+        """
+
+        parents = set()
+
+        for node, status in changes:
+            if self._tree.status(node) == status:
+                continue
+
+            self._tree.set_status(node, status)
+
+            # The name column is painted with the status color too.
+            row = self._row(node)
+
+            self.dataChanged.emit(
+                self.createIndex(row, 0, node),
+                self.createIndex(row, self.columnCount() - 1, node)
+            )
+
+            parent = self._tree.parents[node]
+
+            while parent >= 0 and parent not in parents:
+                parents.add(parent)
+                parent = self._tree.parents[parent]
+
+        for node in parents:
+            self._emit_summary_changed(node)
+
+    def _emit_summary_changed(self, node):
+        """Notify the views that the summary of a node changed.
+
+        Args:
+            node (int): Node id.
+        """
+
+        index = self.createIndex(self._row(node), self.SUMMARY_COLUMN, node)
+        self.dataChanged.emit(index, index)
+
+    def _summary(self, node):
+        """Return the number of items below a node with each status.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            str: eg, '3 wip / 2 fin'; None for items without children.
+        """
+
+        if not self._tree.child_count[node]:
+            return None
+
+        rollup = self._tree.rollup(node)
+        statuses = [each for each in common.STATUS_NAMES if each in rollup]
+        statuses += sorted(set(rollup).difference(statuses))
+
+        return ' / '.join(
+            '{} {}'.format(rollup[status], status) for status in statuses
+        )
+
+    def _remap_persistent_indexes(self, remap):
+        """Move the persistent indexes to new nodes.
+
+        Args:
+            remap (callable): Returns the new node id for a node id, or -1
+                if the node no longer exists.
+        """
+
+        old_indexes = self.persistentIndexList()
+        new_indexes = []
+
+        for index in old_indexes:
+            node = remap(index.internalId()) if index.isValid() else -1
+
+            if node < 0:
+                new_indexes.append(QtCore.QModelIndex())
+            else:
+                new_indexes.append(
+                    self.createIndex(self._row(node), index.column(), node)
+                )
+
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+    def _compact_if_needed(self):
+        """Reclaim the discarded nodes of the tree, if there are enough."""
+
+        if self._tree.garbage <= len(self._tree) * self.COMPACT_RATIO:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+
+        self._tree, mapping = self._tree.compacted(self._top)
+        self._top = array.array('I', [mapping[node] for node in self._top])
+        self._rows_by_name = {}
+
+        self._remap_persistent_indexes(mapping.__getitem__)
+        self.layoutChanged.emit()
+
+    @classmethod
+    def _prepared(cls, record):
+        """Return top level status data, in the order it is displayed.
+
+        Args:
+            record (dict): Top level status data.
+
+        Returns:
+            dict
+        """
+
+        if not record.get('items'):
+            return record
+
+        return dict(record, items=cls._sorted(record['items']))
+
+    @staticmethod
+    def _sorted(records):
+        """Return the given status data, sorted by name.
+
+        Args:
+            records (list[dict]): Status data.
+
+        Returns:
+            list[dict]
+        """
+
+        # Use the operator module to make callables that behave like operators
+        # For example, operator.itemgetter('foo')(obj) is the same as obj.foo
+        return sorted(records, key=operator.itemgetter('name'))
+
+
+class SubtreeProxyModel(QtCore.QAbstractProxyModel):
+    """Exposes one subtree of a source model.
+
+    The children of the root index are the top level items of this model.
+    Views of this model are only notified of changes inside the subtree, so
+    changes to the rest of the source model never cause them to repaint or
+    lay out their items again. An invalid root index exposes nothing.
+
+    Each index of this model stores the key of its source parent, in a table
+    of persistent indexes, which is looked up by the internal id of the 
+    source parent. Parents are dropped from the table when they are removed
+    from the source model.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize.
+
+        Args:
+            parent (QtCore.QObject): Parent object for this model.
+        """
+
+        super(SubtreeProxyModel, self).__init__(parent)
+
+        self._root = QtCore.QPersistentModelIndex()
+
+        # Source parents of the indexes of this model, by key, and their
+        # keys, by the internal id of the source parent.
+        self._parents = {}
+        self._keys = {}
+        self._next_key = 0
+
+        # How the source change in progress is forwarded, if at all.
+        self._removing = None
+        self._moving = False
+        self._layout_forwarded = False
+        self._layout_indexes = []
+
+    def setSourceModel(self, model):
+        """Set the source model of this model.
+
+        Args:
+            model (QtCore.QAbstractItemModel): Source model.
+        """
+
+        self.beginResetModel()
+
+        old_model = self.sourceModel()
+
+        if old_model is not None:
+            for signal, slot in self._source_connections(old_model):
+                signal.disconnect(slot)
+
+        super(SubtreeProxyModel, self).setSourceModel(model)
+
+        self._root = QtCore.QPersistentModelIndex()
+        self._clear_keys()
+
+        if model is not None:
+            for signal, slot in self._source_connections(model):
+                signal.connect(slot)
+
+        self.endResetModel()
+
+    def root_index(self):
+        """Return the source index of the root of the subtree.
+
+        Returns:
+            QtCore.QModelIndex
+        """
+
+        return self._source_index(self._root)
+
+    def set_root_index(self, index):
+        """Set the root of the subtree.
+
+        Args:
+            index (QtCore.QModelIndex): Source index of the new root.
+        """
+
+        self.beginResetModel()
+        self._root = QtCore.QPersistentModelIndex(index)
+        self._clear_keys()
+        self.endResetModel()
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """Return the index of the item at the given row/column.
+
+        Args:
+            row (int): Row of the item.
+            column (int): Column of the item.
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            QtCore.QModelIndex
+        """
+
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+
+        key = self._parent_key(self.mapToSource(parent))
+
+        return self.createIndex(row, column, key)
+
+    def parent(self, index):
+        """Return the index of the parent of the given item.
+
+        Args:
+            index (QtCore.QModelIndex): Index of an item.
+
+        Returns:
+            QtCore.QModelIndex
+        """
+
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        source_parent = self._source_parent(index)
+
+        return self.mapFromSource(source_parent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Return the number of rows under the given parent.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            int
+        """
+
+        if (
+            self.sourceModel() is None
+            or not self._root.isValid()
+            or parent.column() > 0
+        ):
+            return 0
+
+        return self.sourceModel().rowCount(self.mapToSource(parent))
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Return the number of columns under the given parent.
+
+        Args:
+            parent (QtCore.QModelIndex): Index of the parent item.
+
+        Returns:
+            int
+        """
+
+        if self.sourceModel() is None:
+            return 0
+
+        return self.sourceModel().columnCount(self.mapToSource(parent))
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """Return the header data of the source model.
+
+        Args:
+            section (int): Header section.
+            orientation (QtCore.Qt.Orientation): Header orientation.
+            role (int): Data role to return.
+
+        Returns:
+            object
+        """
+
+        if self.sourceModel() is None:
+            return None
+
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def mapToSource(self, index):
+        """Return the source index for an index of this model.
+
+        Args:
+            index (QtCore.QModelIndex): Index of this model.
+
+        Returns:
+            QtCore.QModelIndex: The root index, for an invalid index.
+        """
+
+        if not index.isValid():
+            return self._source_index(self._root)
+
+        source_parent = self._source_parent(index)
+
+        if not source_parent.isValid():
+            return QtCore.QModelIndex()
+
+        return self.sourceModel().index(
+            index.row(), index.column(), source_parent
+        )
+
+    def mapFromSource(self, index):
+        """Return the index of this model for a source index.
+
+        Args:
+            index (QtCore.QModelIndex): Source index.
+
+        Returns:
+            QtCore.QModelIndex: An invalid index, for the root index and for
+                indexes outside of the subtree.
+        """
+
+        if not index.isValid() or index == self._root:
+            return QtCore.QModelIndex()
+
+        source_parent = index.parent()
+
+        if not self._in_subtree(source_parent):
+            return QtCore.QModelIndex()
+
+        return self.createIndex(
+            index.row(), index.column(), self._parent_key(source_parent)
+        )
+
+    def _source_connections(self, model):
+        """Return the source model signals that this model handles.
+
+        Args:
+            model (QtCore.QAbstractItemModel): Source model.
+
+        Returns:
+            list[tuple[QtCore.SignalInstance, callable]]
+        """
+
+        return [
+            (model.dataChanged, self._handle_data_changed),
+            (model.rowsAboutToBeInserted, self._handle_rows_about_to_be_inserted),
+            (model.rowsInserted, self._handle_rows_inserted),
+            (model.rowsAboutToBeRemoved, self._handle_rows_about_to_be_removed),
+            (model.rowsRemoved, self._handle_rows_removed),
+            (model.rowsAboutToBeMoved, self._handle_rows_about_to_be_moved),
+            (model.rowsMoved, self._handle_rows_moved),
+            (model.layoutAboutToBeChanged, self._handle_layout_about_to_be_changed),
+            (model.layoutChanged, self._handle_layout_changed),
+            (model.modelAboutToBeReset, self.beginResetModel),
+            (model.modelReset, self._handle_model_reset),
+        ]
+
+    def _source_index(self, index):
+        """Return a source index for a persistent source index.
+
+        Args:
+            index (QtCore.QPersistentModelIndex): Persistent source index.
+
+        Returns:
+            QtCore.QModelIndex
+        """
+
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        return self.sourceModel().index(
+            index.row(), index.column(), index.parent()
+        )
+
+    def _parent_key(self, source_parent):
+        """Return the key of a source parent, adding it to the table if needed.
+
+        Args:
+            source_parent (QtCore.QModelIndex): Source index.
+
+        Returns:
+            int
+        """
+
+        key = self._keys.get(source_parent.internalId())
+
+        if key is not None and self._parents[key] == source_parent:
+            return key
+
+        key = self._next_key
+        self._next_key += 1
+
+        self._parents[key] = QtCore.QPersistentModelIndex(source_parent)
+        self._keys[source_parent.internalId()] = key
+
+        return key
+
+    def _source_parent(self, index):
+        """Return the source parent of an index of this model.
+
+        Args:
+            index (QtCore.QModelIndex): Valid index of this model.
+
+        Returns:
+            QtCore.QModelIndex: An invalid index, if the parent is gone.
+        """
+
+        parent = self._parents.get(index.internalId())
+
+        if parent is None:
+            return QtCore.QModelIndex()
+
+        return self._source_index(parent)
+
+    def _clear_keys(self):
+        """Forget the keys of every source parent."""
+
+        self._parents = {}
+        self._keys = {}
+
+    def _prune_keys(self):
+        """Forget the source parents that were removed, and look the rest
+        up by their current internal ids.
+        """
+
+        self._parents = {
+            key: each for key, each in self._parents.items() if each.isValid()
+        }
+        self._keys = {
+            each.internalId(): key for key, each in self._parents.items()
+        }
+
+    def _in_subtree(self, index):
+        """Return True if a source index is the root, or one of its descendants.
+
+        Args:
+            index (QtCore.QModelIndex): Source index.
+
+        Returns:
+            bool
+        """
+
+        if not self._root.isValid():
+            return False
+
+        while index.isValid():
+            if index == self._root:
+                return True
+
+            index = index.parent()
+
+        return False
+
+    def _above_root(self, parent, first, last):
+        """Return True if the given source rows are the root, or its ancestors.
+
+        Args:
+            parent (QtCore.QModelIndex): Source index of the parent of the rows.
+            first (int): First row.
+            last (int): Last row.
+
+        Returns:
+            bool
+        """
+
+        index = self._source_index(self._root)
+
+        while index.isValid():
+            if index.parent() == parent and first <= index.row() <= last:
+                return True
+
+            index = index.parent()
+
+        return False
+
+    def _is_related(self, index):
+        """Return True if changes to the children of a source index can 
+        change this model.
+
+        Args:
+            index (QtCore.QModelIndex): Source index.
+
+        Returns:
+            bool
+        """
+
+        if self._in_subtree(index):
+            return True
+
+        # The index is an ancestor of the root.
+        root = self._source_index(self._root)
+
+        while root.isValid():
+            if root == index:
+                return True
+
+            root = root.parent()
+
+        return not index.isValid()
+
+    def _handle_data_changed(self, top_left, bottom_right, roles=()):
+        """Forward data changes inside the subtree."""
+
+        if top_left == self._root or not self._in_subtree(top_left.parent()):
+            return
+
+        self.dataChanged.emit(
+            self.mapFromSource(top_left), 
+            self.mapFromSource(bottom_right), 
+            roles
+        )
+
+    def _handle_rows_about_to_be_inserted(self, parent, first, last):
+        """Forward rows being inserted inside the subtree."""
+
+        if self._in_subtree(parent):
+            self.beginInsertRows(self.mapFromSource(parent), first, last)
+
+    def _handle_rows_inserted(self, parent, first, last):
+        """Forward rows being inserted inside the subtree."""
+
+        if self._in_subtree(parent):
+            self.endInsertRows()
+
+    def _handle_rows_about_to_be_removed(self, parent, first, last):
+        """Forward rows being removed inside the subtree.
+
+        Removing the root, or one of its ancestors, resets this model; once
+        they are removed, the root index is invalid.
+        """
+
+        if self._above_root(parent, first, last):
+            self._removing = 'reset'
+            self.beginResetModel()
+        elif self._in_subtree(parent):
+            self._removing = 'rows'
+            self.beginRemoveRows(self.mapFromSource(parent), first, last)
+
+    def _handle_rows_removed(self, parent, first, last):
+        """Forward rows being removed inside the subtree."""
+
+        # The root may have been removed, so the subtree is not checked 
+        # again.
+        removing, self._removing = self._removing, None
+
+        if removing == 'reset':
+            self._clear_keys()
+            self.endResetModel()
+        elif removing == 'rows':
+            self._prune_keys()
+            self.endRemoveRows()
+
+    def _handle_rows_about_to_be_moved(self, parent, first, last, dest, row):
+        """Reset this model if rows are moved into/out of/inside the subtree."""
+
+        self._moving = self._is_related(parent) or self._is_related(dest)
+
+        if self._moving:
+            self.beginResetModel()
+
+    def _handle_rows_moved(self, parent, first, last, dest, row):
+        """Reset this model if rows are moved into/out of/inside the subtree."""
+
+        if self._moving:
+            self._moving = False
+            self._clear_keys()
+            self.endResetModel()
+
+    def _handle_layout_about_to_be_changed(self, parents=(), hint=None):
+        """Forward source layout changes that can affect the subtree.
+
+        Args:
+            parents (list[QtCore.QPersistentModelIndex]): Source parents 
+                whose children change; all of them, if empty.
+        """
+
+        self._layout_forwarded = not parents or any(
+            self._is_related(self._source_index(each)) for each in parents
+        )
+
+        if not self._layout_forwarded:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+
+        # The source indexes are persistent, so they are updated by the 
+        # source model.
+        self._layout_indexes = [
+            (index, QtCore.QPersistentModelIndex(self.mapToSource(index)))
+            for index in self.persistentIndexList()
+        ]
+
+    def _handle_layout_changed(self, parents=(), hint=None):
+        """Forward source layout changes that can affect the subtree."""
+
+        if not self._layout_forwarded:
+            return
+
+        self._layout_forwarded = False
+
+        old_indexes = []
+        new_indexes = []
+
+        for index, source_index in self._layout_indexes:
+            old_indexes.append(index)
+            new_indexes.append(
+                self.mapFromSource(self._source_index(source_index))
+            )
+
+        self._layout_indexes = []
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+        # The internal ids of the source parents may have changed.
+        self._prune_keys()
+
+        self.layoutChanged.emit()
+
+    def _handle_model_reset(self):
+        """Forward the source model being reset."""
+
+        self._clear_keys()
+        self.endResetModel()
+
+
+def main(**kwargs):
+    common.main(
+        widget=StatusWidget,
+        window_name='Model/View+',
+        **kwargs
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+"""Name index for searching status trees.
+
+The index holds the name of every item of a two level status tree (top
+level items and their children), for find-as-you-type searches:
+
+    - a sorted list of names, which finds the names that start with a
+      query with a binary search, and
+    - an n-gram index (the set of items that contain each run of `NGRAM`
+      characters), which narrows down the names that contain a query to
+      the few that contain all of its n-grams.
+
+Searches are case insensitive, and take time in proportion to the number
+of matches, so a specific query takes well under a millisecond. Items are
+added and removed a top level item at a time, so the index is kept up to
+date as the tree changes, rather than being rebuilt.
+"""
+
+import bisect
+import collections
+
+
+# Length of the runs of characters that are indexed.
+NGRAM = 3
+
+
+def matches(name, text):
+    """Return True if a name matches the given text, as in `NameIndex`.
+
+    Args:
+        name (str): Name of an item.
+        text (str): Lower case text to search for.
+
+    Returns:
+        bool
+    """
+
+    if len(text) < NGRAM:
+        return name.lower().startswith(text)
+
+    return text in name.lower()
+
+
+class NameIndex(object):
+    """Index of the names of the items of a status tree.
+
+    Items are identified by their path: (parent,) for a top level item, or
+    (parent, child) for a child item.
+    """
+
+    # Fraction of removed entries at which the index is compacted.
+    COMPACT_RATIO = 0.5
+
+    def __init__(self):
+        """Initialize."""
+
+        self.clear()
+
+    def __len__(self):
+        return len(self._paths) - self._removed
+
+    def clear(self):
+        """Remove every item."""
+
+        # Path and lower case name of each entry; the path of a removed
+        # entry is None.
+        self._paths = []
+        self._keys = []
+
+        # Entries of each top level item, by its name.
+        self._entries = {}
+
+        # (name, entry) pairs, sorted, and the pairs added since they were
+        # last sorted, which are merged in by the next search.
+        self._sorted = []
+        self._unsorted = []
+
+        # Entries, by each n-gram of their name.
+        self._ngrams = collections.defaultdict(set)
+
+        self._removed = 0
+
+    def set_item(self, parent, children):
+        """Add, or replace, a top level item and its children.
+
+        Args:
+            parent (str): Name of the top level item.
+            children (iterable[str]): Names of its children.
+        """
+
+        self.remove_item(parent)
+
+        self._entries[parent] = [self._add((parent,), parent)] + [
+            self._add((parent, child), child) for child in children
+        ]
+
+    def remove_item(self, parent):
+        """Remove a top level item and its children.
+
+        Args:
+            parent (str): Name of the top level item.
+        """
+
+        for entry in self._entries.pop(parent, ()):
+            for ngram in self._iter_ngrams(self._keys[entry]):
+                self._ngrams[ngram].discard(entry)
+
+            self._paths[entry] = None
+            self._removed += 1
+
+        if self._removed > len(self._paths) * self.COMPACT_RATIO:
+            self._compact()
+
+    def search(self, text):
+        """Return the items whose names match the given text.
+
+        Text shorter than `NGRAM` matches the names that start with it;
+        longer text matches the names that contain it.
+
+        Args:
+            text (str): Text to search for.
+
+        Returns:
+            set[tuple[str]]: Paths of the matching items.
+        """
+
+        text = text.lower()
+
+        if not text:
+            return set()
+
+        if len(text) < NGRAM:
+            return self._search_prefix(text)
+
+        # Start from the rarest n-gram, so the intersections stay small.
+        postings = sorted(
+            (self._ngrams.get(ngram, set()) for ngram in self._iter_ngrams(text)),
+            key=len
+        )
+        entries = postings[0].intersection(*postings[1:])
+
+        # Having every n-gram does not mean having them in order.
+        return {
+            self._paths[entry] for entry in entries if text in self._keys[entry]
+        }
+
+    def _search_prefix(self, text):
+        """Return the items whose names start with the given text.
+
+        Args:
+            text (str): Lower case text to search for.
+
+        Returns:
+            set[tuple[str]]: Paths of the matching items.
+        """
+
+        if self._unsorted:
+            self._unsorted.sort()
+            self._sorted.extend(self._unsorted)
+            self._unsorted = []
+
+            # Sorting two sorted runs is a merge.
+            self._sorted.sort()
+
+        result = set()
+        row = bisect.bisect_left(self._sorted, (text, -1))
+
+        while row < len(self._sorted):
+            key, entry = self._sorted[row]
+
+            if not key.startswith(text):
+                break
+
+            path = self._paths[entry]
+
+            if path is not None:
+                result.add(path)
+
+            row += 1
+
+        return result
+
+    def _add(self, path, name):
+        """Add an entry.
+
+        Args:
+            path (tuple[str]): Path of the item.
+            name (str): Name of the item.
+
+        Returns:
+            int: Id of the new entry.
+        """
+
+        entry = len(self._paths)
+        key = name.lower()
+
+        self._paths.append(path)
+        self._keys.append(key)
+        self._unsorted.append((key, entry))
+
+        for ngram in self._iter_ngrams(key):
+            self._ngrams[ngram].add(entry)
+
+        return entry
+
+    def _compact(self):
+        """Rebuild the index without the removed entries."""
+
+        items = [
+            (parent, [self._paths[entry][1] for entry in entries[1:]])
+            for parent, entries in self._entries.items()
+        ]
+
+        self.clear()
+
+        for parent, children in items:
+            self.set_item(parent, children)
+
+    @staticmethod
+    def _iter_ngrams(key):
+        """Yield the n-grams of a lower case name.
+
+        Args:
+            key (str): Lower case name.
+
+        Yields:
+            str
+        """
+
+        for start in range(len(key) - NGRAM + 1):
+            yield key[start:start + NGRAM]
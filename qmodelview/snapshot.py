@@ -0,0 +1,596 @@
+"""Binary status data snapshots.
+
+Parsing JSON dominates the time it takes to open large status files. A
+snapshot stores the same data in a binary file that is memory-mapped and
+read in place, so opening one takes about the same time at any size.
+
+A snapshot is a header (see `HEADER`), followed by these sections, each
+aligned to 8 bytes:
+
+    string offsets  start of each string in the string data (uint32)
+    string data     UTF-8 encoded strings
+    status codes    string id of each status code (uint32); id 0 is for
+                    nodes without a status
+    name_ids        string id of the name of each node (uint32)
+    parents         id of the parent of each node, or -1 (int32)
+    first_child     id of the first child of each node (uint32)
+    child_count     number of children of each node (uint32)
+    statuses        status id of each node (uint8)
+    rollup_ids      row of each node in the rollups, or -1 (int32)
+    rollups         one array per status id, of the number of leaf nodes
+                    with that status below each node with children (uint32)
+
+The sections are the arrays of a `columnar.StatusTree`, so a tree is made
+from a snapshot by copying them, rather than by decoding each node.
+
+Nodes are stored breadth first, so the top level nodes come first, and the
+children of each node are next to each other (see `columnar`). The top
+level nodes, and their children, are sorted by name.
+
+Numbers are stored in the byte order of the machine that wrote the
+snapshot; snapshots are a cache, to be written where they are read.
+
+    python snapshot.py data2.json data2.qmvs
+"""
+
+import argparse
+import array
+import bisect
+import mmap
+import operator
+import struct
+import sys
+
+import columnar
+
+
+MAGIC = b'QMVS'
+VERSION = 2
+
+# Shapes of status data (see `backends`).
+FLAT = 0
+NESTED = 1
+
+# Magic, version, shape, byte order (0 = little endian), node count, top
+# level node count, string count, size of the string data, status count,
+# rollup count.
+HEADER = struct.Struct('<4sHBBIIIIII')
+
+# String id of the status code of nodes without a status.
+NO_STRING = 0xFFFFFFFF
+
+
+def _align(offset):
+    """Return the given offset, rounded up to the next section boundary.
+
+    Args:
+        offset (int): Offset, in bytes.
+
+    Returns:
+        int
+    """
+
+    return (offset + 7) & ~7
+
+
+def _records(data):
+    """Return status data as top level records, in the order they are stored.
+
+    Args:
+        data (dict|list[dict]): Flat or nested status data.
+
+    Returns:
+        list[dict]
+    """
+
+    by_name = operator.itemgetter('name')
+
+    if isinstance(data, dict):
+        return [
+            {
+                'name': parent,
+                'items': [
+                    {'name': child, 'status': status}
+                    for child, status in sorted(children.items())
+                ]
+            }
+            for parent, children in sorted(data.items())
+        ]
+
+    return [
+        dict(record, items=sorted(record.get('items') or [], key=by_name))
+        for record in sorted(data, key=by_name)
+    ]
+
+
+def write(path, data):
+    """Write status data to a snapshot.
+
+    Args:
+        path (str): Path to write to.
+        data (dict|list[dict]): Flat or nested status data.
+    """
+
+    shape = FLAT if isinstance(data, dict) else NESTED
+    records = _records(data)
+    tree = columnar.StatusTree.from_records(records)
+
+    # The status codes are stored in the string table too.
+    status_codes = array.array('I', [NO_STRING])
+    status_codes.extend(
+        tree.strings.intern(tree.status_codes[each])
+        for each in range(1, len(tree.status_codes))
+    )
+
+    strings = [
+        tree.strings[each].encode('utf-8') for each in range(len(tree.strings))
+    ]
+
+    string_offsets = array.array('I', [0])
+
+    for each in strings:
+        string_offsets.append(string_offsets[-1] + len(each))
+
+    sections = [
+        string_offsets,
+        b''.join(strings),
+        status_codes,
+        tree.name_ids,
+        tree.parents,
+        tree.first_child,
+        tree.child_count,
+        tree.statuses,
+        tree.rollup_ids,
+    ]
+
+    # Every status id has a rollup array, even if no leaf node has it.
+    tree._ensure_rollup(len(status_codes) - 1)
+    sections.extend(tree.rollups)
+
+    with open(path, 'wb') as fp:
+        fp.write(HEADER.pack(
+            MAGIC,
+            VERSION,
+            shape,
+            0 if sys.byteorder == 'little' else 1,
+            len(tree),
+            len(records),
+            len(strings),
+            string_offsets[-1],
+            len(status_codes),
+            tree._rollup_count,
+        ))
+
+        for section in sections:
+            fp.write(b'\0' * (_align(fp.tell()) - fp.tell()))
+            fp.write(section)
+
+
+class Snapshot(object):
+    """Memory-mapped status data snapshot.
+
+    The arrays of the snapshot are memoryviews of the mapped file; nothing
+    is copied until it is asked for.
+    """
+
+    def __init__(self, path):
+        """Initialize.
+
+        Args:
+            path (str): Path to the snapshot.
+
+        Raises:
+            ValueError: If the file is not a snapshot that can be read.
+        """
+
+        self.filename = path
+
+        self._fp = open(path, 'rb')
+
+        try:
+            self._map = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._fp.close()
+            raise ValueError('Empty snapshot: {}'.format(path))
+
+        self._views = []
+
+        try:
+            self._read()
+        except ValueError:
+            self.close()
+            raise
+
+    def _read(self):
+        """Read the header, and map the sections of the snapshot.
+
+        Raises:
+            ValueError: If the file is not a snapshot that can be read.
+        """
+
+        if len(self._map) < HEADER.size:
+            raise ValueError('Not a status snapshot: {}'.format(self.filename))
+
+        (
+            magic,
+            version,
+            self.shape,
+            byte_order,
+            self.node_count,
+            self.top_count,
+            string_count,
+            string_size,
+            status_count,
+            self.rollup_count,
+        ) = HEADER.unpack_from(self._map)
+
+        if magic != MAGIC:
+            raise ValueError('Not a status snapshot: {}'.format(self.filename))
+
+        if version != VERSION:
+            raise ValueError(
+                'Unsupported snapshot version {}: {}'
+                .format(version, self.filename)
+            )
+
+        if byte_order != (0 if sys.byteorder == 'little' else 1):
+            raise ValueError(
+                'Snapshot written on a machine with a different byte order: '
+                '{}'.format(self.filename)
+            )
+
+        self._offset = HEADER.size
+        view = memoryview(self._map)
+        self._views.append(view)
+
+        self._string_offsets = self._section(view, 'I', string_count + 1)
+        self._string_data = self._section(view, 'B', string_size)
+        self._status_ids = self._section(view, 'I', status_count)
+        self.name_ids = self._section(view, 'I', self.node_count)
+        self.parents = self._section(view, 'i', self.node_count)
+        self.first_child = self._section(view, 'I', self.node_count)
+        self.child_count = self._section(view, 'I', self.node_count)
+        self.statuses = self._section(view, 'B', self.node_count)
+        self._statuses_start = self._offset - self.node_count
+        self.rollup_ids = self._section(view, 'i', self.node_count)
+        self.rollups = [
+            self._section(view, 'I', self.rollup_count)
+            for _ in range(status_count)
+        ]
+
+        # Strings, once they are all decoded (see `_all_strings`).
+        self._strings = None
+
+        # There are only a few status codes, so they are decoded up front.
+        self.status_codes = [
+            None if each == NO_STRING else self.string(each)
+            for each in self._status_ids
+        ]
+
+    def _section(self, view, typecode, count):
+        """Return a view of the next section of the snapshot.
+
+        Args:
+            view (memoryview): View of the whole snapshot.
+            typecode (str): Type of the values in the section.
+            count (int): Number of values in the section.
+
+        Returns:
+            memoryview
+
+        Raises:
+            ValueError: If the snapshot is too short.
+        """
+
+        start = _align(self._offset)
+        end = start + count * struct.calcsize(typecode)
+
+        if end > len(view):
+            raise ValueError('Truncated snapshot: {}'.format(self.filename))
+
+        self._offset = end
+
+        section = view[start:end].cast(typecode)
+        self._views.append(section)
+
+        return section
+
+    def close(self):
+        """Unmap the snapshot."""
+
+        for view in reversed(self._views):
+            view.release()
+
+        self._views = []
+
+        self._map.close()
+        self._fp.close()
+
+    def string(self, string_id):
+        """Return a string from the string table.
+
+        Args:
+            string_id (int): String id.
+
+        Returns:
+            str
+        """
+
+        start = self._string_offsets[string_id]
+        end = self._string_offsets[string_id + 1]
+
+        return str(self._string_data[start:end], 'utf-8')
+
+    def strings(self):
+        """Return every string in the string table.
+
+        Returns:
+            list[str]
+        """
+
+        return [self.string(each) for each in range(len(self._string_offsets) - 1)]
+
+    def string_data(self):
+        """Return a copy of the string table, encoded.
+
+        Returns:
+            tuple[bytes, array.array]: UTF-8 encoded strings, one after
+                another, and the start of each string, followed by the end
+                of the last one.
+        """
+
+        offsets = array.array('I')
+        offsets.frombytes(self._string_offsets.cast('B'))
+
+        return bytes(self._string_data), offsets
+
+    def _all_strings(self):
+        """Return every string, decoding them the first time.
+
+        Strings are shared by many nodes (eg, task names), so decoding each
+        one once is quicker than decoding the name of each node.
+
+        Returns:
+            list[str]
+        """
+
+        if self._strings is None:
+            self._strings = self.strings()
+
+        return self._strings
+
+    def _children_data(self, node):
+        """Return the names and status codes of the children of a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            tuple[iterator[str], iterator[str]]
+        """
+
+        first = self.first_child[node]
+        end = first + self.child_count[node]
+
+        return (
+            map(self._all_strings().__getitem__, self.name_ids[first:end]),
+            map(self.status_codes.__getitem__, self.statuses[first:end]),
+        )
+
+    def name(self, node):
+        """Return the name of a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            str
+        """
+
+        return self.string(self.name_ids[node])
+
+    def status(self, node):
+        """Return the status code of a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            str: None if the node has no status.
+        """
+
+        return self.status_codes[self.statuses[node]]
+
+    def children(self, node):
+        """Return the ids of the children of a node.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            range
+        """
+
+        first = self.first_child[node]
+
+        return range(first, first + self.child_count[node])
+
+    def find(self, name):
+        """Return the top level node with the given name.
+
+        Args:
+            name (str): Name of the node.
+
+        Returns:
+            int: -1 if there is no such node.
+        """
+
+        names = _TopLevelNames(self)
+        node = bisect.bisect_left(names, name)
+
+        if node < self.top_count and names[node] == name:
+            return node
+
+        return -1
+
+    def path(self, node):
+        """Return the names of a node and its parents.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            tuple[str]: Names, from the top level node down.
+        """
+
+        names = []
+
+        while node >= 0:
+            names.append(self.name(node))
+            node = self.parents[node]
+
+        return tuple(reversed(names))
+
+    def record(self, node):
+        """Return the status data of a node and its descendants.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            dict: Nested status data.
+        """
+
+        record = {'name': self.name(node)}
+
+        status = self.status(node)
+
+        # Only status items have a status, so a node without one is a
+        # parent, even if it has no children.
+        if status is not None:
+            record['status'] = status
+            return record
+
+        children = self.children(node)
+
+        if any(self.child_count[children.start:children.stop]) or (
+            0 in self.statuses[children.start:children.stop]
+        ):
+            record['items'] = [self.record(each) for each in children]
+        else:
+            # The children are all status items, so they are made in bulk.
+            record['items'] = [
+                {'name': name, 'status': status}
+                for name, status in zip(*self._children_data(node))
+            ]
+
+        return record
+
+    def item(self, node):
+        """Return the status data of a top level node, in its original shape.
+
+        Args:
+            node (int): Node id.
+
+        Returns:
+            tuple[str, dict]|dict: (name, children) for flat data, or a
+                record for nested data.
+        """
+
+        if self.shape == NESTED:
+            return self.record(node)
+
+        return self.name(node), dict(zip(*self._children_data(node)))
+
+    def to_data(self):
+        """Return all of the status data, in its original shape.
+
+        Returns:
+            dict|list[dict]
+        """
+
+        items = [self.item(node) for node in range(self.top_count)]
+
+        return dict(items) if self.shape == FLAT else items
+
+    def with_status(self, status):
+        """Return the nodes with the given status.
+
+        Args:
+            status (str): Status code.
+
+        Returns:
+            list[int]: Node ids, in the order they are stored.
+        """
+
+        try:
+            status_id = self.status_codes.index(status)
+        except ValueError:
+            return []
+
+        # The status column is one byte per node, so it is searched in the
+        # mapped file, rather than with a Python loop.
+        needle = bytes([status_id])
+        start = self._statuses_start
+        end = start + self.node_count
+
+        result = []
+        position = self._map.find(needle, start, end)
+
+        while position >= 0:
+            result.append(position - start)
+            position = self._map.find(needle, position + 1, end)
+
+        return result
+
+
+class _TopLevelNames(object):
+    """Sequence of the names of the top level nodes of a snapshot, for bisect.
+
+    Names are decoded as they are compared, so a lookup only decodes a few
+    of them.
+    """
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def __len__(self):
+        return self._snapshot.top_count
+
+    def __getitem__(self, node):
+        return self._snapshot.name(node)
+
+
+def convert(source, target):
+    """Write a snapshot of a status data file.
+
+    Args:
+        source (str): Path to the status data (see `backends.open_backend`).
+        target (str): Path to write the snapshot to.
+    """
+
+    # The backends read snapshots, so they are imported when needed.
+    import backends
+
+    backend = backends.open_backend(source)
+
+    try:
+        write(target, backend.query())
+    finally:
+        backend.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a status snapshot.')
+    parser.add_argument('source', help='Status data file (.json, .db)')
+    parser.add_argument('target', help='Snapshot file to write (.qmvs)')
+
+    args = parser.parse_args()
+
+    convert(args.source, args.target)
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
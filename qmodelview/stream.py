@@ -0,0 +1,192 @@
+"""Streaming status data reader.
+
+Status exports can be too large to load in one go. This module reads the
+top level elements of a JSON document one at a time, so only one element
+(eg, one sequence and its shots/tasks) is held in memory at once, and the
+first elements are available long before the whole document is read.
+"""
+
+import json
+import re
+
+
+# Number of characters to read from the file at a time.
+CHUNK_SIZE = 64 * 1024
+
+_NON_WHITESPACE = re.compile(r'\S')
+_DELIMITER = re.compile(r'[\s,\]}]')
+
+
+class _Reader(object):
+    """Buffered reader that decodes one JSON value at a time."""
+
+    def __init__(self, fp, chunk_size=CHUNK_SIZE):
+        """Initialize.
+
+        Args:
+            fp (file): File object opened in text mode.
+            chunk_size (int): Number of characters to read at a time.
+        """
+
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size):
+        """Read more of the file into the buffer.
+
+        The part of the buffer that has already been decoded is dropped, so
+        the buffer never holds more than the value being decoded.
+
+        Args:
+            size (int): Number of characters to read.
+
+        Returns:
+            bool: False if the end of the file was reached.
+        """
+
+        data = self._fp.read(size)
+
+        if not data:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character, without consuming it.
+
+        Returns:
+            str
+
+        Raises:
+            ValueError: If the end of the file was reached.
+        """
+
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._pos)
+
+            if match is not None:
+                self._pos = match.start()
+                return self._buffer[self._pos]
+
+            self._pos = len(self._buffer)
+
+            if not self._fill(self._chunk_size):
+                raise ValueError('Unexpected end of JSON document')
+
+    def next_char(self):
+        """Return and consume the next non-whitespace character.
+
+        Returns:
+            str
+        """
+
+        char = self.peek()
+        self._pos += 1
+
+        return char
+
+    def expect(self, char):
+        """Consume the next non-whitespace character, which must be `char`.
+
+        Args:
+            char (str): Expected character.
+
+        Raises:
+            ValueError: If the next character is something else.
+        """
+
+        found = self.next_char()
+
+        if found != char:
+            raise ValueError(
+                "Expected '{}' in JSON document, found '{}'".format(char, found)
+            )
+
+    def decode(self):
+        """Return and consume the next JSON value.
+
+        Returns:
+            object
+        """
+
+        if self.peek() not in '{["':
+            # Numbers (and literals) have no closing character, so make sure
+            # the whole value has been read before decoding it.
+            while _DELIMITER.search(self._buffer, self._pos) is None:
+                if not self._fill(self._chunk_size):
+                    break
+
+        size = self._chunk_size
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._fill(size):
+                    raise
+
+                # Grow the reads, so a large value is not re-scanned from
+                # the start once per chunk.
+                size *= 2
+                continue
+
+            self._pos = end
+
+            return value
+
+
+def iter_document(fp, chunk_size=CHUNK_SIZE):
+    """Yield the top level elements of a JSON document as they are read.
+
+    Args:
+        fp (file): File object opened in text mode.
+        chunk_size (int): Number of characters to read at a time.
+
+    Yields:
+        object: Elements of a top level array, or (key, value) pairs of a
+            top level object.
+
+    Raises:
+        ValueError: If the document is not a valid array/object.
+    """
+
+    reader = _Reader(fp, chunk_size)
+
+    opening = reader.next_char()
+
+    if opening == '[':
+        closing, is_object = ']', False
+    elif opening == '{':
+        closing, is_object = '}', True
+    else:
+        raise ValueError('Expected a JSON array or object')
+
+    if reader.peek() == closing:
+        return
+
+    while True:
+        if is_object:
+            key = reader.decode()
+            reader.expect(':')
+            yield key, reader.decode()
+        else:
+            yield reader.decode()
+
+        char = reader.next_char()
+
+        if char == closing:
+            return
+
+        if char != ',':
+            raise ValueError(
+                "Expected ',' or '{}' in JSON document, found '{}'"
+                .format(closing, char)
+            )
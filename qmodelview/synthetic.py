@@ -0,0 +1,187 @@
+"""Synthetic status data.
+
+Generates deterministic status data of any size, in the same shapes as the
+example data files, for stress testing and benchmarks.
+
+    python synthetic.py status.db --rows 1000000
+    python synthetic.py status.json --rows 10000
+    python synthetic.py status2.json --rows 10000 --nested
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+import backends
+
+
+# Relative frequency of each status code.
+STATUS_WEIGHTS = {
+    'rdy': 2,
+    'omt': 1,
+    'wip': 4,
+    'fin': 3,
+}
+
+TASK_NAMES = ['anim', 'comp', 'fx', 'layout', 'light', 'model', 'rig', 'surf']
+
+
+def _statuses(rng, count):
+    """Return a list of random status codes.
+
+    Args:
+        rng (random.Random): Random number generator.
+        count (int): Number of status codes.
+
+    Returns:
+        list[str]
+    """
+
+    return rng.choices(
+        list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()), k=count
+    )
+
+
+def iter_rows(rows, children=100, seed=0):
+    """Yield flat status rows.
+
+    Args:
+        rows (int): Total number of rows.
+        children (int): Number of rows per parent.
+        seed (int): Random seed; the same seed yields the same rows.
+
+    Yields:
+        tuple[str, str, str]: Parent, child and status of each row.
+    """
+
+    rng = random.Random(seed)
+
+    for first in range(0, rows, children):
+        count = min(children, rows - first)
+        parent = 'SQ{:05d}'.format(first // children)
+
+        for child, status in enumerate(_statuses(rng, count)):
+            yield parent, '{:04d}'.format((child + 1) * 10), status
+
+
+def flat_data(rows, children=100, seed=0):
+    """Return flat status data, like `data.json`.
+
+    Args:
+        rows (int): Total number of rows.
+        children (int): Number of rows per parent.
+        seed (int): Random seed.
+
+    Returns:
+        dict[str, dict[str, str]]
+    """
+
+    result = {}
+
+    for parent, child, status in iter_rows(rows, children, seed):
+        result.setdefault(parent, {})[child] = status
+
+    return result
+
+
+def nested_data(rows, shots=20, seed=0):
+    """Return nested sequence/shot/task status data, like `data2.json`.
+
+    Args:
+        rows (int): Approximate number of task rows.
+        shots (int): Number of shots per sequence.
+        seed (int): Random seed.
+
+    Returns:
+        list[dict]
+    """
+
+    rng = random.Random(seed)
+    tasks = len(TASK_NAMES)
+    sequences = max(1, rows // (shots * tasks))
+
+    result = []
+
+    for sequence in range(sequences):
+        items = []
+
+        for shot in range(shots):
+            statuses = _statuses(rng, tasks)
+
+            items.append({
+                'name': '{:04d}'.format((shot + 1) * 10),
+                'items': [
+                    {'name': name, 'status': status}
+                    for name, status in zip(TASK_NAMES, statuses)
+                ]
+            })
+
+        result.append({'name': 'SQ{:05d}'.format(sequence), 'items': items})
+
+    return result
+
+
+def write(path, rows, nested=False, seed=0):
+    """Write synthetic status data to a file.
+
+    The format is picked from the file extension (see `backends.BACKENDS`);
+    anything else is written as JSON.
+
+    Args:
+        path (str): Path to write to.
+        rows (int): Number of rows.
+        nested (bool): If True, write nested data (JSON only).
+        seed (int): Random seed.
+
+    Raises:
+        ValueError: If nested data is to be written to a database or 
+            snapshot.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension in backends.BACKENDS:
+        if nested:
+            raise ValueError(
+                'Nested data can only be written as JSON, not {}'.format(extension)
+            )
+
+        if os.path.exists(path):
+            os.remove(path)
+
+        backends.BACKENDS[extension].create(path, iter_rows(rows, seed=seed))
+        return
+
+    data = nested_data(rows, seed=seed) if nested else flat_data(rows, seed=seed)
+
+    with open(path, 'w') as fp:
+        json.dump(data, fp)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate status data.')
+    parser.add_argument('path', help='File to write (.json, .db)')
+    parser.add_argument(
+        '--rows', type=int, default=100000, help='Number of rows'
+    )
+    parser.add_argument(
+        '--nested', action='store_true', help='Write sequence/shot/task data'
+    )
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+
+    args = parser.parse_args()
+
+    extension = os.path.splitext(args.path)[1].lower()
+
+    if args.nested and extension in backends.BACKENDS:
+        parser.error('--nested can only be used with JSON files')
+
+    write(args.path, args.rows, nested=args.nested, seed=args.seed)
+
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()